@@ -26,6 +26,11 @@ _PYTHON_FENCE_RE = re.compile(
     r"```python\s*\n(.*?)\n\s*```", re.DOTALL
 )
 
+# Literal markers for the substring fast paths below
+_EXECUTE_OPEN = "<execute>"
+_EXECUTE_CLOSE = "</execute>"
+_PYTHON_FENCE = "```python"
+
 
 class CodeActParser:
     """Extracts executable code and thought blocks from LLM responses."""
@@ -76,14 +81,22 @@ class CodeActParser:
 
     def has_code(self, text: str) -> bool:
         """Return True if the LLM output contains executable code."""
-        return any(b.kind == "execute" for b in self.parse(text))
+        # Substring fast path: most responses contain no code at all, and
+        # plain `in` rejects them without touching the regex engine
+        if _EXECUTE_OPEN not in text and _PYTHON_FENCE not in text:
+            return False
+        return bool(_EXECUTE_TAG_RE.search(text) or _PYTHON_FENCE_RE.search(text))
 
     def extract_code(self, text: str) -> str | None:
         """Return the first executable code block, or None."""
-        for block in self.parse(text):
-            if block.kind == "execute":
-                return block.content
-        return None
+        # Fast path: a single well-formed tag pair needs no regex
+        start = text.find(_EXECUTE_OPEN)
+        if start >= 0:
+            end = text.find(_EXECUTE_CLOSE, start)
+            if end >= 0:
+                return text[start + len(_EXECUTE_OPEN):end].strip()
+        match = _EXECUTE_TAG_RE.search(text) or _PYTHON_FENCE_RE.search(text)
+        return match.group(1).strip() if match else None
 
     def extract_text_response(self, text: str) -> str:
         """Strip code/thought tags and return only prose."""
@@ -62,14 +62,20 @@ def _guarded_import(
     return importlib.import_module(name)
 
 
-def build_safe_builtins() -> dict[str, Any]:
-    """Return a dict of safe builtins for use in exec() globals."""
-    safe: dict[str, Any] = {}
+# Built once at import time — every execution copies this template instead
+# of re-resolving each builtin name
+_SAFE_BUILTINS_TEMPLATE: dict[str, Any] = {
+    name: obj
+    for name in _ALLOWED_BUILTINS
+    if (obj := getattr(builtins, name, None)) is not None
+}
+_SAFE_BUILTINS_TEMPLATE["__import__"] = _guarded_import
+
 
-    for name in _ALLOWED_BUILTINS:
-        obj = getattr(builtins, name, None)
-        if obj is not None:
-            safe[name] = obj
+def build_safe_builtins() -> dict[str, Any]:
+    """Return a dict of safe builtins for use in exec() globals.
 
-    safe["__import__"] = _guarded_import
-    return safe
+    Returns a shallow copy of the module-level template so callers can
+    mutate their exec namespace without affecting other executions.
+    """
+    return _SAFE_BUILTINS_TEMPLATE.copy()
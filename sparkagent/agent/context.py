@@ -3,11 +3,44 @@
 from __future__ import annotations
 
 import base64
+import functools
+import json
 import mimetypes
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+_JSON_TO_PY_TYPE = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "array": "list",
+    "object": "dict",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _schema_signature_cached(name: str, schema_key: str) -> str:
+    """Build a signature from a canonically serialized schema (memoized).
+
+    Tool schemas are stable across turns, so the rendered signature is
+    keyed on the sorted JSON form and reused on every prompt rebuild.
+    """
+    params_schema = json.loads(schema_key)
+    props = params_schema.get("properties", {})
+    required = set(params_schema.get("required", []))
+
+    parts: list[str] = []
+    for pname, pinfo in props.items():
+        py_type = _JSON_TO_PY_TYPE.get(pinfo.get("type", "str"), "str")
+        if pname in required:
+            parts.append(f"{pname}: {py_type}")
+        else:
+            parts.append(f"{pname}: {py_type} | None = None")
+
+    return f"{name}({', '.join(parts)})"
+
 
 class ContextBuilder:
     """Build the context (system prompt + messages) for the agent.
@@ -149,7 +182,9 @@ save these yourself.
         system_prompt = self.build_system_prompt(current_message=current_message)
 
         if execution_mode == "code_act" and tool_schemas:
-            system_prompt += "\n\n---\n\n" + self._get_codeact_instructions(tool_schemas)
+            system_prompt = "\n\n---\n\n".join(
+                (system_prompt, self._get_codeact_instructions(tool_schemas))
+            )
 
         messages.append({"role": "system", "content": system_prompt})
 
@@ -220,27 +255,8 @@ save these yourself.
     @staticmethod
     def _schema_to_signature(name: str, params_schema: dict[str, Any]) -> str:
         """Convert a JSON Schema parameters object to a Python-style signature."""
-        props = params_schema.get("properties", {})
-        required = set(params_schema.get("required", []))
-
-        parts: list[str] = []
-        for pname, pinfo in props.items():
-            ptype = pinfo.get("type", "str")
-            type_map = {
-                "string": "str",
-                "integer": "int",
-                "number": "float",
-                "boolean": "bool",
-                "array": "list",
-                "object": "dict",
-            }
-            py_type = type_map.get(ptype, "str")
-            if pname in required:
-                parts.append(f"{pname}: {py_type}")
-            else:
-                parts.append(f"{pname}: {py_type} | None = None")
-
-        return f"{name}({', '.join(parts)})"
+        # No sort_keys: property order determines parameter order in the signature
+        return _schema_signature_cached(name, json.dumps(params_schema))
 
     def _build_user_content(
         self,
@@ -4,6 +4,7 @@ import asyncio
 import json
 import logging
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -31,7 +32,8 @@ from sparkagent.memory.models import HardCase, MemoryOperation, OperationType
 from sparkagent.memory.selector import select_skills
 from sparkagent.memory.skill_bank import NullSkillBank, SkillBank
 from sparkagent.memory.store import MemoryStore, NullMemoryStore
-from sparkagent.providers import LLMProvider
+from sparkagent.memory.turn_context import TurnContext
+from sparkagent.providers import LLMProvider, LLMResponse
 from sparkagent.session import SessionManager
 
 logger = logging.getLogger(__name__)
@@ -59,8 +61,14 @@ class AgentLoop:
         tavily_api_key: str | None = None,
         execution_mode: str = "function_calling",
         memory_config: MemoryConfig | None = None,
+        tools: ToolRegistry | None = None,
     ):
-        """Initialize the agent loop with bus, provider, and configuration."""
+        """Initialize the agent loop with bus, provider, and configuration.
+
+        When ``tools`` is given, that registry is used as-is and the
+        default tools are not registered — callers can supply a custom
+        (or shared) toolset.
+        """
         self.bus = bus
         self.provider = provider
         self.workspace = workspace
@@ -87,12 +95,15 @@ class AgentLoop:
 
         self.context = ContextBuilder(workspace, memory_store=self._memory_store)
         self.sessions = SessionManager()
-        self.tools = ToolRegistry()
 
         self._running = False
         self._codeact_parser = CodeActParser()
         self._codeact_executors: dict[str, CodeActExecutor] = {}
-        self._register_tools(brave_api_key, tavily_api_key)
+        if tools is not None:
+            self.tools = tools
+        else:
+            self.tools = ToolRegistry()
+            self._register_tools(brave_api_key, tavily_api_key)
 
     def _register_tools(
         self,
@@ -311,13 +322,15 @@ class AgentLoop:
             return
 
         turn = f"User: {user_message}\nAssistant: {assistant_response}"
+        # Tokenize the query once; both retrievals share the context
+        query_ctx = TurnContext.from_text(user_message)
         memories_text = self._memory_store.retrieve_for_context(
-            user_message,
+            query_ctx,
             max_entries=self._memory_config.max_memories_in_context,
             max_chars=self._memory_config.max_memory_chars,
         )
-        relevant = self._memory_store.retrieve(
-            user_message, max_results=self._memory_config.max_memories_in_context
+        relevant = self._memory_store.retrieve_ctx(
+            query_ctx, max_results=self._memory_config.max_memories_in_context
         )
 
         skill_ids = await select_skills(
@@ -421,3 +434,106 @@ class AgentLoop:
 
         response = await self._process_message(msg)
         return response.content if response else ""
+
+    async def process_direct_stream(
+        self, content: str, session_key: str = "cli:direct"
+    ) -> AsyncIterator[str]:
+        """Process a message directly, streaming the response (for CLI usage).
+
+        Yields content chunks as the provider produces them. Tool-call
+        iterations run silently; only assistant text is streamed. CodeAct
+        mode does not stream and falls back to a single chunk.
+
+        Args:
+            content: The message content.
+            session_key: Session identifier.
+
+        Yields:
+            Chunks of the agent's response.
+
+        """
+        msg = InboundMessage(
+            channel="cli",
+            sender_id="user",
+            chat_id="direct",
+            content=content,
+        )
+
+        mode = await self._resolve_execution_mode(msg.content)
+        if mode == "code_act":
+            yield await self.process_direct(content, session_key)
+            return
+
+        session = self.sessions.get_or_create(msg.session_key)
+        messages = self.context.build_messages(
+            history=session.get_history(),
+            current_message=msg.content,
+            media=msg.media if msg.media else None,
+        )
+
+        iteration = 0
+        final_content = None
+        chunks_streamed = False
+
+        while iteration < self.max_iterations:
+            iteration += 1
+
+            response: LLMResponse | None = None
+            chunks_streamed = False
+            async for item in self.provider.chat_stream(
+                messages=messages,
+                tools=self.tools.get_schemas(),
+                model=self.model,
+            ):
+                if isinstance(item, str):
+                    chunks_streamed = True
+                    yield item
+                else:
+                    response = item
+
+            if response is None:
+                break
+
+            if response.has_tool_calls:
+                tool_call_dicts = [
+                    {
+                        "id": tc.id,
+                        "type": "function",
+                        "function": {
+                            "name": tc.name,
+                            "arguments": json.dumps(tc.arguments),
+                        },
+                    }
+                    for tc in response.tool_calls
+                ]
+                messages = self.context.add_assistant_message(
+                    messages, response.content, tool_call_dicts
+                )
+
+                for tool_call in response.tool_calls:
+                    logger.debug("Executing tool: %s", tool_call.name)
+                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
+                    messages = self.context.add_tool_result(
+                        messages, tool_call.id, tool_call.name, result
+                    )
+            else:
+                final_content = response.content
+                break
+
+        if final_content is None:
+            final_content = "I've completed processing but have no response."
+            chunks_streamed = False
+
+        # Error responses and the max-iterations fallback arrive as whole
+        # strings rather than deltas — surface them to the caller too.
+        if not chunks_streamed and final_content:
+            yield final_content
+
+        session.add_message("user", msg.content)
+        session.add_message("assistant", final_content)
+        self.sessions.save(session)
+
+        try:
+            await self._process_memory(msg.content, final_content, msg.session_key)
+        except Exception as e:
+            logger.warning("Memory processing error (non-fatal): %s", e)
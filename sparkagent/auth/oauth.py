@@ -14,6 +14,7 @@ Flow:
 import base64
 import hashlib
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from urllib.parse import quote, urlencode
 
@@ -31,6 +32,7 @@ ANTHROPIC_REDIRECT_URI = "https://console.anthropic.com/oauth/code/callback"
 ANTHROPIC_SCOPES = "org:create_api_key user:profile user:inference"
 
 TOKEN_EXPIRY_BUFFER_SECONDS = 300  # Refresh 5 minutes before actual expiry
+TOKEN_STALE_WINDOW_SECONDS = 180  # Start a proactive refresh this long before the buffer
 
 # ---------------------------------------------------------------------------
 # Data models
@@ -247,27 +249,67 @@ def compute_expires_at(expires_in: int) -> str:
     return expires_at.isoformat()
 
 
-def is_token_expired(expires_at: str | None) -> bool:
-    """Check whether an access token has expired (or is about to).
+def parse_expiry_epoch(expires_at: str | None) -> float | None:
+    """Parse an ISO 8601 expiry timestamp into a POSIX epoch.
 
-    Includes a 5-minute buffer so we refresh *before* the actual expiry.
+    Callers that check expiry on every API call can parse once and keep
+    comparing the cached float instead of re-parsing the string.
 
     Args:
         expires_at: ISO 8601 UTC timestamp, or None/empty if unknown.
 
     Returns:
-        True if the token is expired or the expiry is unknown.
+        The expiry as seconds since the epoch, or None if unknown or
+        unparseable.
 
     """
     if not expires_at:
-        return True
+        return None
 
     try:
         expiry = datetime.fromisoformat(expires_at)
         # Ensure timezone-aware
         if expiry.tzinfo is None:
             expiry = expiry.replace(tzinfo=timezone.utc)
-        buffer = timedelta(seconds=TOKEN_EXPIRY_BUFFER_SECONDS)
-        return datetime.now(timezone.utc) >= (expiry - buffer)
+        return expiry.timestamp()
     except (ValueError, TypeError):
+        return None
+
+
+def is_token_expired(expires_at: str | None) -> bool:
+    """Check whether an access token has expired (or is about to).
+
+    Includes a 5-minute buffer so we refresh *before* the actual expiry.
+
+    Args:
+        expires_at: ISO 8601 UTC timestamp, or None/empty if unknown.
+
+    Returns:
+        True if the token is expired or the expiry is unknown.
+
+    """
+    epoch = parse_expiry_epoch(expires_at)
+    if epoch is None:
         return True
+    return time.time() >= epoch - TOKEN_EXPIRY_BUFFER_SECONDS
+
+
+def is_token_stale(expires_at: str | None) -> bool:
+    """Check whether a still-valid token is close enough to expiry to refresh early.
+
+    A stale token can keep serving requests while a background refresh
+    runs, so callers never block at the expiry boundary.
+
+    Args:
+        expires_at: ISO 8601 UTC timestamp, or None/empty if unknown.
+
+    Returns:
+        True if the token expires within the stale window (but may not
+        yet count as expired). Unknown expiry is left to
+        ``is_token_expired``.
+
+    """
+    epoch = parse_expiry_epoch(expires_at)
+    if epoch is None:
+        return False
+    return time.time() >= epoch - TOKEN_EXPIRY_BUFFER_SECONDS - TOKEN_STALE_WINDOW_SECONDS
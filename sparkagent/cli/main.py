@@ -471,8 +471,11 @@ def chat(
     if message:
         # Single message mode
         async def run_once():
-            response = await agent.process_direct(message, session_id)
-            console.print(f"\n{response}")
+            try:
+                response = await agent.process_direct(message, session_id)
+                console.print(f"\n{response}")
+            finally:
+                await provider.aclose()
 
         asyncio.run(run_once())
     else:
@@ -480,17 +483,22 @@ def chat(
         console.print("Interactive mode (Ctrl+C to exit)\n")
 
         async def run_interactive():
-            while True:
-                try:
-                    user_input = console.input("[bold blue]You:[/bold blue] ")
-                    if not user_input.strip():
-                        continue
-
-                    response = await agent.process_direct(user_input, session_id)
-                    console.print(f"\n{response}\n")
-                except KeyboardInterrupt:
-                    console.print("\nGoodbye!")
-                    break
+            try:
+                while True:
+                    try:
+                        user_input = console.input("[bold blue]You:[/bold blue] ")
+                        if not user_input.strip():
+                            continue
+
+                        console.print()
+                        async for chunk in agent.process_direct_stream(user_input, session_id):
+                            console.print(chunk, end="", soft_wrap=True)
+                        console.print("\n")
+                    except KeyboardInterrupt:
+                        console.print("\nGoodbye!")
+                        break
+            finally:
+                await provider.aclose()
 
         asyncio.run(run_interactive())
 
@@ -550,7 +558,7 @@ def gateway(
     # Collect async tasks and cleanup callbacks
     tasks = [agent.run()]
     cleanup_sync = [agent.stop]
-    cleanup_async = []
+    cleanup_async = [provider.aclose]
 
     if config.channels.telegram.enabled:
         telegram = TelegramChannel(config, bus)
@@ -6,7 +6,7 @@ used by the onboarding and configuration flows.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 @dataclass(frozen=True, slots=True)
@@ -25,7 +25,7 @@ class ProviderOption:
     key: str
     label: str
     key_url_hint: str
-    models: list[ModelOption] = field(default_factory=list)
+    models: tuple[ModelOption, ...] = ()
 
 
 PROVIDERS: list[ProviderOption] = [
@@ -33,19 +33,19 @@ PROVIDERS: list[ProviderOption] = [
         key="openai",
         label="OpenAI",
         key_url_hint="https://platform.openai.com/api-keys",
-        models=[
+        models=(
             ModelOption("gpt-4.1", "GPT-4.1", "Smartest non-reasoning model, 1M context"),
             ModelOption("gpt-4.1-mini", "GPT-4.1 Mini", "Fast and affordable"),
             ModelOption("gpt-4.1-nano", "GPT-4.1 Nano", "Cheapest and fastest"),
             ModelOption("o3", "o3", "Reasoning model for complex tasks"),
             ModelOption("o4-mini", "o4-mini", "Fast, cost-efficient reasoning"),
-        ],
+        ),
     ),
     ProviderOption(
         key="gemini",
         label="Google Gemini",
         key_url_hint="https://aistudio.google.com/apikey",
-        models=[
+        models=(
             ModelOption(
                 "gemini-2.5-pro", "Gemini 2.5 Pro", "Most capable, complex reasoning"
             ),
@@ -57,13 +57,13 @@ PROVIDERS: list[ProviderOption] = [
                 "Gemini 2.5 Flash Lite",
                 "Fastest, most budget-friendly",
             ),
-        ],
+        ),
     ),
     ProviderOption(
         key="anthropic",
         label="Anthropic",
         key_url_hint="https://console.anthropic.com/settings/keys",
-        models=[
+        models=(
             ModelOption(
                 "claude-opus-4-6", "Claude Opus 4.6", "Most intelligent, agents and coding"
             ),
@@ -75,7 +75,7 @@ PROVIDERS: list[ProviderOption] = [
             ModelOption(
                 "claude-haiku-4-5", "Claude Haiku 4.5", "Fastest, near-frontier intelligence"
             ),
-        ],
+        ),
     ),
 ]
 
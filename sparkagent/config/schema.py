@@ -1,7 +1,9 @@
 """Configuration schema using Pydantic."""
 
+import functools
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -101,6 +103,12 @@ class ToolsConfig(BaseModel):
     tavily: TavilyConfig = Field(default_factory=TavilyConfig)
 
 
+@functools.lru_cache(maxsize=8)
+def _expand_workspace(workspace: str) -> Path:
+    """Expand a workspace string to a Path (cached — expanduser hits $HOME)."""
+    return Path(workspace).expanduser()
+
+
 class Config(BaseModel):
     """Root configuration."""
 
@@ -114,7 +122,7 @@ class Config(BaseModel):
     @property
     def workspace_path(self) -> Path:
         """Get expanded workspace path."""
-        return Path(self.agent.workspace).expanduser()
+        return _expand_workspace(self.agent.workspace)
 
     def get_provider_config(self) -> ProviderConfig | None:
         """Get the ProviderConfig for the active provider."""
@@ -140,19 +148,46 @@ class Config(BaseModel):
         return defaults.get(self.agent.provider)
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
-    """Get the config file path."""
+    """Get the config file path (cached — Path.home() hits the environment)."""
     return Path.home() / ".sparkagent" / "config.json"
 
 
+# Directories already created this process — mkdir(exist_ok=True) still
+# stats the path, so skip the syscall on repeat saves.
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create the directory once per process, skipping repeat syscalls."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+# Validated Config cache keyed by (path, mtime) — avoids re-running Pydantic
+# validation (the dominant cost of Config(**data)) when the file is unchanged.
+_config_cache: tuple[Path, float, Config] | None = None
+
+
 def load_config() -> Config:
     """Load configuration from file."""
+    global _config_cache
     config_path = get_config_path()
 
     if config_path.exists():
         try:
-            data = json.loads(config_path.read_text())
-            return Config(**data)
+            mtime = config_path.stat().st_mtime
+            if _config_cache is not None:
+                cached_path, cached_mtime, cached_config = _config_cache
+                if cached_path == config_path and cached_mtime == mtime:
+                    return cached_config
+            # read_bytes: json.loads decodes UTF-8 internally, skipping one pass
+            data = json.loads(config_path.read_bytes())
+            config = Config(**data)
+            _config_cache = (config_path, mtime, config)
+            return config
         except Exception as exc:
             logger.warning("Failed to load config from %s: %s", config_path, exc)
 
@@ -160,8 +195,15 @@ def load_config() -> Config:
 
 
 def save_config(config: Config) -> None:
-    """Save configuration to file."""
+    """Save configuration to file atomically (temp file + rename)."""
+    global _config_cache
     config_path = get_config_path()
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(config.model_dump_json(indent=2))
-    config_path.chmod(0o600)
+    _ensure_dir(config_path.parent)
+    # Write to a sibling temp file and rename so a crash mid-write can't
+    # leave a truncated config, and concurrent readers never see partials.
+    tmp_path = config_path.with_suffix(config_path.suffix + ".tmp")
+    tmp_path.write_text(config.model_dump_json(indent=2))
+    tmp_path.chmod(0o600)
+    os.replace(tmp_path, config_path)
+    # The saved instance is already validated — prime the cache with it
+    _config_cache = (config_path, config_path.stat().st_mtime, config)
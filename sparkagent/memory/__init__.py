@@ -13,9 +13,11 @@ from sparkagent.memory.models import (
     MemorySkill,
     OperationType,
 )
+from sparkagent.memory.pipeline import process_turns
 from sparkagent.memory.selector import select_skills
 from sparkagent.memory.skill_bank import SkillBank
 from sparkagent.memory.store import MemoryStore
+from sparkagent.memory.turn_context import TurnContext
 
 __all__ = [
     "HardCase",
@@ -26,6 +28,8 @@ __all__ = [
     "OperationType",
     "SkillBank",
     "SkillDesigner",
+    "TurnContext",
     "execute_memory_skills",
+    "process_turns",
     "select_skills",
 ]
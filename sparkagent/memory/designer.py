@@ -4,6 +4,7 @@ Analyzes hard cases where memory operations failed and proposes
 skill refinements or new skills.
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -17,6 +18,21 @@ from sparkagent.providers.base import LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Hard cases per designer LLM call — keeps each prompt bounded as the
+# buffer grows, and lets chunks run concurrently.
+_EVOLUTION_CHUNK_SIZE = 5
+# Concurrent designer calls — bounded to respect provider rate limits.
+_MAX_CONCURRENT_DESIGNER_CALLS = 4
+
+# Storage dirs created this process — lets repeated SkillDesigner
+# construction skip the mkdir stat syscall.
+_ensured_dirs: set[Path] = set()
+
+
+# Sentinel for persisted records missing created_at — avoids a per-row
+# datetime.now() syscall in the load loop (every record we write has one).
+_UNKNOWN_CREATED_AT = datetime(1970, 1, 1)
+
 
 class NullSkillDesigner:
     """No-op skill designer used when the memory system is disabled."""
@@ -24,6 +40,9 @@ class NullSkillDesigner:
     def record_hard_case(self, case):
         """No-op."""
 
+    def record_hard_cases(self, new_cases):
+        """No-op."""
+
     def should_evolve(self):
         """Return False — never evolve."""
         return False
@@ -49,7 +68,9 @@ class SkillDesigner:
         """Initialize the skill designer."""
         self.skill_bank = skill_bank
         self.storage_dir = storage_dir or (Path.home() / ".sparkagent" / "memory")
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        if self.storage_dir not in _ensured_dirs:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(self.storage_dir)
         self._hard_cases_path = self.storage_dir / "hard_cases.jsonl"
         self.hard_case_threshold = hard_case_threshold
         self._hard_cases: list[HardCase] | None = None
@@ -94,17 +115,7 @@ class SkillDesigner:
             "id": case.id,
             "conversation_snippet": case.conversation_snippet,
             "selected_skills": case.selected_skills,
-            "operations": [
-                {
-                    "type": op.type.value,
-                    "content": op.content,
-                    "target_id": op.target_id,
-                    "tags": op.tags,
-                    "skill_id": op.skill_id,
-                    "reasoning": op.reasoning,
-                }
-                for op in case.operations
-            ],
+            "operations": [op.to_dict() for op in case.operations],
             "failure_type": case.failure_type,
             "created_at": case.created_at.isoformat(),
         }
@@ -134,7 +145,7 @@ class SkillDesigner:
             failure_type=data.get("failure_type", ""),
             created_at=datetime.fromisoformat(data["created_at"])
             if "created_at" in data
-            else datetime.now(),
+            else _UNKNOWN_CREATED_AT,
         )
 
     def record_hard_case(self, case: HardCase) -> None:
@@ -144,6 +155,13 @@ class SkillDesigner:
         self._save_hard_cases()
         logger.info("Recorded hard case %s (failure_type=%s)", case.id, case.failure_type)
 
+    def record_hard_cases(self, new_cases: list[HardCase]) -> None:
+        """Record a batch of hard cases with a single save."""
+        cases = self._ensure_loaded()
+        cases.extend(new_cases)
+        self._save_hard_cases()
+        logger.info("Recorded %d hard case(s)", len(new_cases))
+
     def should_evolve(self) -> bool:
         """Check whether enough hard cases have accumulated to trigger evolution."""
         cases = self._ensure_loaded()
@@ -158,30 +176,42 @@ class SkillDesigner:
         if not cases:
             return []
 
-        # Format hard cases for the prompt
-        hard_cases_text = self._format_hard_cases(cases)
         skill_descriptions = self.skill_bank.get_descriptions()
-
-        prompt = DESIGNER_PROMPT.format(
-            skill_descriptions=skill_descriptions,
-            hard_cases=hard_cases_text,
-        )
-
-        messages = [
-            {"role": "system", "content": "You are a memory skill designer."},
-            {"role": "user", "content": prompt},
+        chunks = [
+            cases[i : i + _EVOLUTION_CHUNK_SIZE]
+            for i in range(0, len(cases), _EVOLUTION_CHUNK_SIZE)
         ]
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_DESIGNER_CALLS)
 
-        response = await provider.chat(
-            messages=messages,
-            tools=None,
-            model=model,
-            max_tokens=2000,
-            temperature=0.3,
-        )
+        async def design_chunk(chunk: list[HardCase]) -> list[dict]:
+            prompt = DESIGNER_PROMPT.format(
+                skill_descriptions=skill_descriptions,
+                hard_cases=self._format_hard_cases(chunk),
+            )
+            messages = [
+                {"role": "system", "content": "You are a memory skill designer."},
+                {"role": "user", "content": prompt},
+            ]
+            async with semaphore:
+                response = await provider.chat(
+                    messages=messages,
+                    tools=None,
+                    model=model,
+                    max_tokens=2000,
+                    temperature=0.3,
+                )
+            return self._parse_proposals(response.content or "")
 
-        text = response.content or ""
-        proposals = self._parse_proposals(text)
+        chunk_proposals = await asyncio.gather(*(design_chunk(c) for c in chunks))
+
+        # Merge chunk results, deduplicating by skill id (last writer wins)
+        merged: dict[str, dict] = {}
+        for chunk_result in chunk_proposals:
+            for proposal in chunk_result:
+                sid = proposal.get("id", "")
+                if sid:
+                    merged[sid] = proposal
+        proposals = list(merged.values())
 
         logger.info(
             "Evolving skills: %d proposal(s) from %d hard case(s)", len(proposals), len(cases)
@@ -213,9 +243,10 @@ class SkillDesigner:
                     self.skill_bank.add_skill(existing)
                     new_skills.append(existing)
 
-        # Clear hard case buffer after evolution
+        # Clear hard case buffer after evolution — unlink instead of
+        # rewriting an empty file (one syscall vs open+truncate)
         self._hard_cases = []
-        self._save_hard_cases()
+        self._hard_cases_path.unlink(missing_ok=True)
 
         if new_skills:
             logger.info("Evolved skills: %s", [s.id for s in new_skills])
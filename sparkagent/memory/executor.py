@@ -2,14 +2,21 @@
 
 import json
 import logging
-import re
 
 from sparkagent.memory.models import MemoryEntry, MemoryOperation, MemorySkill, OperationType
-from sparkagent.memory.prompts import EXECUTOR_PROMPT
+from sparkagent.memory.prompts import EXECUTOR_STATIC_PROMPT, EXECUTOR_TURN_PROMPT
 from sparkagent.providers.base import LLMProvider
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Direct dict lookup per operation instead of the enum constructor (which
+# routes misses through _missing_) wrapped in try/except
+_OP_MAP: dict[str, OperationType] = {
+    alias: op_type for op_type in OperationType for alias in (op_type.value, op_type.value.upper())
+}
+
 
 async def execute_memory_skills(
     provider: LLMProvider,
@@ -20,6 +27,9 @@ async def execute_memory_skills(
 ) -> list[MemoryOperation]:
     """Generate memory operations from selected skills.
 
+    All selected skills are folded into a single prompt and executed in one
+    LLM call, so there is no per-skill serial round trip to parallelize.
+
     Args:
         provider: LLM provider for the generation call.
         model: Model identifier.
@@ -37,15 +47,18 @@ async def execute_memory_skills(
     # Format skill instructions
     skill_instructions = _format_skill_instructions(selected_skills)
 
-    prompt = EXECUTOR_PROMPT.format(
+    # Static block first (stable for a given skill selection → cacheable
+    # prefix), volatile memories + turn in a separate trailing message
+    static_prompt = EXECUTOR_STATIC_PROMPT.format(skill_instructions=skill_instructions)
+    turn_prompt = EXECUTOR_TURN_PROMPT.format(
         indexed_memories=indexed_memories or "(no existing memories)",
-        skill_instructions=skill_instructions,
         conversation_turn=conversation_turn,
     )
 
     messages = [
         {"role": "system", "content": "You are a memory executor."},
-        {"role": "user", "content": prompt},
+        {"role": "user", "content": static_prompt},
+        {"role": "user", "content": turn_prompt},
     ]
 
     response = await provider.chat(
@@ -92,18 +105,8 @@ def _parse_operations(
     skills: list[MemorySkill],
 ) -> list[MemoryOperation]:
     """Parse JSON array of operations from LLM response."""
-    # Extract JSON from potential markdown code fences
-    json_str = _extract_json(text)
-    if not json_str:
-        return []
-
-    try:
-        raw_ops = json.loads(json_str)
-    except json.JSONDecodeError:
-        logger.warning("Failed to parse executor JSON response")
-        return []
-
-    if not isinstance(raw_ops, list):
+    raw_ops = _decode_json_array(text)
+    if not raw_ops:
         return []
 
     skill_id = skills[0].id if skills else ""
@@ -113,10 +116,8 @@ def _parse_operations(
         if not isinstance(raw, dict):
             continue
 
-        op_type_str = raw.get("type", "").upper()
-        try:
-            op_type = OperationType(op_type_str.lower())
-        except ValueError:
+        op_type = _OP_MAP.get(raw.get("type", ""))
+        if op_type is None:
             continue
 
         target_id = ""
@@ -139,16 +140,29 @@ def _parse_operations(
     return operations
 
 
-def _extract_json(text: str) -> str:
-    """Extract JSON array from text, handling markdown code fences."""
-    # Try to find ```json ... ``` block
-    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
-    if fence_match:
-        return fence_match.group(1).strip()
+def _decode_json_array(text: str) -> list | None:
+    """Decode the first JSON array in text, handling markdown code fences.
+
+    Uses str.find plus JSONDecoder.raw_decode instead of regex: the decoder
+    consumes exactly one JSON value, so extraction and parsing happen in a
+    single pass over the response.
+    """
+    # Restrict the search to the fenced block when one exists
+    fence = text.find("```")
+    if fence != -1:
+        close = text.find("```", fence + 3)
+        segment = text[fence + 3 : close] if close != -1 else text[fence + 3 :]
+    else:
+        segment = text
+
+    start = segment.find("[")
+    if start == -1:
+        return None
 
-    # Try to find raw JSON array
-    bracket_match = re.search(r"\[.*\]", text, re.DOTALL)
-    if bracket_match:
-        return bracket_match.group(0).strip()
+    try:
+        decoded, _ = _JSON_DECODER.raw_decode(segment, start)
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse executor JSON response")
+        return None
 
-    return ""
+    return decoded if isinstance(decoded, list) else None
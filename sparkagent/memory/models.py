@@ -57,6 +57,17 @@ class MemoryOperation:
     skill_id: str = ""
     reasoning: str = ""
 
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable dict of this operation."""
+        return {
+            "type": self.type.value,
+            "content": self.content,
+            "target_id": self.target_id,
+            "tags": self.tags,
+            "skill_id": self.skill_id,
+            "reasoning": self.reasoning,
+        }
+
 
 @dataclass
 class HardCase:
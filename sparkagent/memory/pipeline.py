@@ -0,0 +1,66 @@
+"""Batch memory-pipeline processing for offline ingestion and replay."""
+
+import asyncio
+import logging
+
+from sparkagent.memory.executor import execute_memory_skills
+from sparkagent.memory.models import MemoryOperation
+from sparkagent.memory.selector import select_skills
+from sparkagent.memory.skill_bank import SkillBank
+from sparkagent.memory.store import MemoryStore
+from sparkagent.memory.turn_context import TurnContext
+from sparkagent.providers.base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+async def process_turns(
+    turns: list[str],
+    provider: LLMProvider,
+    model: str,
+    bank: SkillBank,
+    store: MemoryStore,
+    top_k: int = 3,
+    max_memories: int = 10,
+    concurrency: int = 8,
+) -> list[list[MemoryOperation]]:
+    """Run the selector/executor pipeline over many turns concurrently.
+
+    Single-turn latency is unchanged; per-turn pipelines overlap their
+    network round trips under a bounded semaphore, so batch throughput
+    scales with `concurrency`. Operations are returned per turn, in the
+    input order, without being applied to the store.
+
+    Args:
+        turns: conversation turns to process.
+        provider: LLM provider shared across all calls.
+        model: model identifier.
+        bank: skill bank supplying descriptions and skill bodies.
+        store: memory store used for retrieval.
+        top_k: maximum skills selected per turn.
+        max_memories: maximum memories retrieved per turn.
+        concurrency: maximum pipelines in flight at once.
+
+    Returns:
+        One list of memory operations per input turn.
+
+    """
+    sem = asyncio.Semaphore(concurrency)
+    skill_descriptions = bank.get_descriptions()
+
+    async def _one(turn: str) -> list[MemoryOperation]:
+        async with sem:
+            ctx = TurnContext.from_text(turn)
+            memories_text = store.retrieve_for_context(ctx, max_entries=max_memories)
+            relevant = store.retrieve_ctx(ctx, max_results=max_memories)
+            skill_ids = await select_skills(
+                provider, model, turn, memories_text, skill_descriptions, top_k=top_k
+            )
+            selected = [s for s in (bank.get(sid) for sid in skill_ids) if s]
+            if not selected:
+                return []
+            return await execute_memory_skills(provider, model, turn, relevant, selected)
+
+    results = await asyncio.gather(*(_one(turn) for turn in turns))
+    logger.info("Processed %d turn(s) with concurrency=%d", len(turns), concurrency)
+    return list(results)
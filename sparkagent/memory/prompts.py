@@ -1,18 +1,20 @@
-"""Prompt templates for the memory skill system."""
+"""Prompt templates for the memory skill system.
 
-SKILL_SELECTION_PROMPT = """You are a memory management controller. Given a conversation turn, existing memories, and available memory skills, select the most relevant skills to apply.
+The selector and executor prompts are split into a static part (skill
+descriptions/instructions plus task boilerplate — byte-identical across
+turns for the same skill bank) and a dynamic part (memories and the
+current conversation turn). Sending the static part as its own leading
+user message keeps the cacheable prefix intact for provider-side prompt
+caching.
+"""
 
-## Existing Memories
-{existing_memories}
+SKILL_SELECTION_STATIC_PROMPT = """You are a memory management controller. Given a conversation turn, existing memories, and available memory skills, select the most relevant skills to apply.
 
 ## Available Skills
 {skill_descriptions}
 
-## Conversation Turn
-{conversation_turn}
-
 ## Instructions
-Select up to {top_k} skills from the list above that should be applied to process this conversation turn. Consider:
+Select up to {top_k} skills from the list above that should be applied to process the conversation turn in the next message. Consider:
 - What new information is present that should be captured?
 - Do any existing memories need updating or removing?
 - Is this a purely transactional turn with no memory-worthy content?
@@ -21,24 +23,24 @@ Respond with ONLY a numbered list of skill IDs, most relevant first. Example:
 1. primitive_insert
 2. primitive_noop"""
 
-EXECUTOR_PROMPT = """You are a memory executor. Given a conversation turn, existing memories, and selected memory skills, generate the appropriate memory operations.
+SKILL_SELECTION_TURN_PROMPT = """## Existing Memories
+{existing_memories}
 
-## Existing Memories
-{indexed_memories}
+## Conversation Turn
+{conversation_turn}"""
+
+EXECUTOR_STATIC_PROMPT = """You are a memory executor. Given a conversation turn, existing memories, and selected memory skills, generate the appropriate memory operations.
 
 ## Selected Skills
 {skill_instructions}
 
-## Conversation Turn
-{conversation_turn}
-
 ## Instructions
-Based on the selected skills and their instructions, generate memory operations as a JSON array.
+Based on the selected skills and their instructions, generate memory operations for the conversation turn in the next message as a JSON array.
 
 Each operation must be one of:
 - INSERT: Create a new memory. Provide "content" and "tags".
-- UPDATE: Modify existing memory. Provide "memory_index" (from the numbered list above), "content", and "tags".
-- DELETE: Remove a memory. Provide "memory_index" (from the numbered list above).
+- UPDATE: Modify existing memory. Provide "memory_index" (from the numbered list of memories), "content", and "tags".
+- DELETE: Remove a memory. Provide "memory_index" (from the numbered list of memories).
 - NOOP: No changes needed. Provide "reasoning".
 
 Respond with ONLY a JSON array. Example:
@@ -50,6 +52,12 @@ Respond with ONLY a JSON array. Example:
 ]
 ```"""
 
+EXECUTOR_TURN_PROMPT = """## Existing Memories
+{indexed_memories}
+
+## Conversation Turn
+{conversation_turn}"""
+
 DESIGNER_PROMPT = """You are a memory skill designer. Analyze the following hard cases where the memory system performed poorly, and propose improvements to the skill bank.
 
 ## Current Skills
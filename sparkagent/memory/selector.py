@@ -6,13 +6,17 @@ Follows the mode_selector.py pattern: module-level prompt + single async functio
 import logging
 import re
 
-from sparkagent.memory.prompts import SKILL_SELECTION_PROMPT
+from sparkagent.memory.prompts import SKILL_SELECTION_STATIC_PROMPT, SKILL_SELECTION_TURN_PROMPT
 from sparkagent.providers.base import LLMProvider
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_FALLBACK = ["primitive_insert", "primitive_noop"]
 
+# Compiled once — these run on every selection response
+_LIST_RE = re.compile(r"(?:^\d+[\.\)]\s*|^-\s*)(\w+)", re.MULTILINE)
+_WORD_RE = re.compile(r"\b(\w+_\w+)\b")
+
 
 async def select_skills(
     provider: LLMProvider,
@@ -36,16 +40,21 @@ async def select_skills(
         Ordered list of skill IDs, most relevant first.
 
     """
-    prompt = SKILL_SELECTION_PROMPT.format(
-        existing_memories=existing_memories or "(no memories yet)",
+    # Static block first (stable across turns → cacheable prefix),
+    # volatile memories + turn in a separate trailing message
+    static_prompt = SKILL_SELECTION_STATIC_PROMPT.format(
         skill_descriptions=skill_descriptions,
-        conversation_turn=conversation_turn,
         top_k=top_k,
     )
+    turn_prompt = SKILL_SELECTION_TURN_PROMPT.format(
+        existing_memories=existing_memories or "(no memories yet)",
+        conversation_turn=conversation_turn,
+    )
 
     messages = [
         {"role": "system", "content": "You are a memory management controller."},
-        {"role": "user", "content": prompt},
+        {"role": "user", "content": static_prompt},
+        {"role": "user", "content": turn_prompt},
     ]
 
     response = await provider.chat(
@@ -70,14 +79,13 @@ def _parse_skill_ids(text: str, top_k: int) -> list[str]:
         2. capture_activity_details
     """
     # Match patterns like "1. skill_id" or "- skill_id"
-    pattern = r"(?:^\d+[\.\)]\s*|^-\s*)(\w+)"
-    matches = re.findall(pattern, text.strip(), re.MULTILINE)
+    matches = _LIST_RE.findall(text.strip())
 
     if matches:
         return matches[:top_k]
 
     # Fallback: try to find any word that looks like a skill ID
-    words = re.findall(r"\b(\w+_\w+)\b", text)
+    words = _WORD_RE.findall(text)
     if words:
         return words[:top_k]
 
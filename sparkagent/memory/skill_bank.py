@@ -1,6 +1,9 @@
 """Skill bank — manages memory skills as individual markdown files."""
 
+import atexit
 import logging
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 
@@ -115,11 +118,15 @@ def _format_frontmatter(skill: MemorySkill) -> str:
     return "\n".join(lines)
 
 
+# Matches one `key: value` frontmatter line, stripping optional quotes
+_FM_RE = re.compile(r'^(\w+):\s*["\']?(.*?)["\']?\s*$', re.MULTILINE)
+
+
 def _parse_frontmatter(text: str) -> tuple[dict[str, str], str]:
     """Parse YAML-like frontmatter from a markdown file.
 
-    Returns (metadata_dict, body_text). Uses simple key-value parsing
-    to avoid requiring PyYAML.
+    Returns (metadata_dict, body_text). A single precompiled regex pass
+    replaces per-line splitting; simple key-value only, no PyYAML needed.
     """
     text = text.strip()
     if not text.startswith("---"):
@@ -130,19 +137,8 @@ def _parse_frontmatter(text: str) -> tuple[dict[str, str], str]:
     if end_idx == -1:
         return {}, text
 
-    frontmatter_text = text[3:end_idx].strip()
+    metadata = dict(_FM_RE.findall(text, 3, end_idx))
     body = text[end_idx + 3 :].strip()
-
-    metadata: dict[str, str] = {}
-    for line in frontmatter_text.split("\n"):
-        line = line.strip()
-        if not line or ":" not in line:
-            continue
-        key, _, value = line.partition(":")
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        metadata[key] = value
-
     return metadata, body
 
 
@@ -184,8 +180,16 @@ class SkillBank:
         self.skills_dir = skills_dir or (Path.home() / ".sparkagent" / "memory" / "skills")
         self.skills_dir.mkdir(parents=True, exist_ok=True)
         self._skills: dict[str, MemorySkill] | None = None
+        # Caches rebuilt lazily after any mutation to the skill set
+        self._descriptions_cache: str | None = None
+        self._all_cache: tuple[MemorySkill, ...] | None = None
+        # Skills with counter bumps not yet written to their .md files
+        self._dirty_usage: set[str] = set()
+        # path -> (mtime_ns, skill): rescans only reparse changed files
+        self._mtime_cache: dict[str, tuple[int, MemorySkill]] = {}
         self._ensure_primitives()
-        self._load_skills()
+        # Parsing is deferred to the first get*/add call
+        atexit.register(self.flush_usage)
 
     def _ensure_primitives(self) -> None:
         """Write primitive skill .md files if they don't exist."""
@@ -204,32 +208,53 @@ class SkillBank:
             self._write_skill_file(skill)
 
     def _load_skills(self) -> None:
-        """Scan skills directory and parse all .md files."""
+        """Scan the skills directory, reparsing only files whose mtime changed."""
         self._skills = {}
-        for path in sorted(self.skills_dir.glob("*.md")):
+        self._invalidate_caches()
+        try:
+            dir_entries = sorted(os.scandir(self.skills_dir), key=lambda e: e.name)
+        except OSError:
+            return
+        for dir_entry in dir_entries:
+            if not dir_entry.name.endswith(".md"):
+                continue
             try:
-                skill = self._parse_skill_md(path)
+                mtime_ns = dir_entry.stat().st_mtime_ns
+                cached = self._mtime_cache.get(dir_entry.path)
+                if cached is not None and cached[0] == mtime_ns:
+                    skill = cached[1]
+                else:
+                    skill = self._parse_skill_md(Path(dir_entry.path))
+                    self._mtime_cache[dir_entry.path] = (mtime_ns, skill)
                 self._skills[skill.id] = skill
             except Exception:
                 continue
 
+    def _invalidate_caches(self) -> None:
+        """Drop derived caches after the skill set changes."""
+        self._descriptions_cache = None
+        self._all_cache = None
+
     def _parse_skill_md(self, path: Path) -> MemorySkill:
         """Parse a skill markdown file into a MemorySkill."""
         text = path.read_text(encoding="utf-8")
         metadata, body = _parse_frontmatter(text)
 
-        skill_id = path.stem
+        # Convert only keys actually present — absent keys take the dataclass
+        # defaults without a throwaway int()/fromisoformat call
+        version = metadata.get("version")
+        usage_count = metadata.get("usage_count")
+        success_count = metadata.get("success_count")
+        created_at = metadata.get("created_at")
         return MemorySkill(
-            id=skill_id,
+            id=path.stem,
             description=metadata.get("description", ""),
             content=body,
-            is_primitive=metadata.get("is_primitive", "false").lower() == "true",
-            version=int(metadata.get("version", "1")),
-            usage_count=int(metadata.get("usage_count", "0")),
-            success_count=int(metadata.get("success_count", "0")),
-            created_at=datetime.fromisoformat(metadata["created_at"])
-            if "created_at" in metadata
-            else datetime.now(),
+            is_primitive=metadata.get("is_primitive", "").lower() == "true",
+            version=int(version) if version else 1,
+            usage_count=int(usage_count) if usage_count else 0,
+            success_count=int(success_count) if success_count else 0,
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
         )
 
     def _write_skill_file(self, skill: MemorySkill) -> None:
@@ -244,22 +269,25 @@ class SkillBank:
             self._load_skills()
         return self._skills.get(skill_id)
 
-    def get_all(self) -> list[MemorySkill]:
-        """Get all skills."""
+    def get_all(self) -> tuple[MemorySkill, ...]:
+        """Get all skills (cached until the skill set changes)."""
         if self._skills is None:
             self._load_skills()
-        return list(self._skills.values())
+        if self._all_cache is None:
+            self._all_cache = tuple(self._skills.values())
+        return self._all_cache
 
     def get_descriptions(self) -> str:
-        """Format skill descriptions for the selector prompt."""
+        """Format skill descriptions for the selector prompt (cached)."""
         if self._skills is None:
             self._load_skills()
-
-        lines = []
-        for skill in self._skills.values():
-            tag = "[primitive]" if skill.is_primitive else "[evolved]"
-            lines.append(f"- {skill.id}: {skill.description} {tag}")
-        return "\n".join(lines)
+        if self._descriptions_cache is None:
+            self._descriptions_cache = "\n".join(
+                f"- {skill.id}: {skill.description} "
+                f"{'[primitive]' if skill.is_primitive else '[evolved]'}"
+                for skill in self._skills.values()
+            )
+        return self._descriptions_cache
 
     def add_skill(self, skill: MemorySkill) -> None:
         """Add a new skill (write .md file to disk)."""
@@ -268,6 +296,8 @@ class SkillBank:
 
         self._write_skill_file(skill)
         self._skills[skill.id] = skill
+        self._invalidate_caches()
+        self._dirty_usage.discard(skill.id)  # file now reflects current counters
         logger.info("Added skill %s", skill.id)
 
     def remove_skill(self, skill_id: str) -> bool:
@@ -283,11 +313,12 @@ class SkillBank:
         if path.exists():
             path.unlink()
         del self._skills[skill_id]
+        self._invalidate_caches()
         logger.info("Removed skill %s", skill_id)
         return True
 
     def record_usage(self, skill_id: str, success: bool = True) -> None:
-        """Update usage/success counters and rewrite the skill file."""
+        """Update usage/success counters in memory (flushed lazily to disk)."""
         if self._skills is None:
             self._load_skills()
 
@@ -298,9 +329,25 @@ class SkillBank:
         skill.usage_count += 1
         if success:
             skill.success_count += 1
-        self._write_skill_file(skill)
+        # Counters are analytics, not safety-critical — buffer in RAM and
+        # flush lazily instead of rewriting the file per turn
+        self._dirty_usage.add(skill_id)
         logger.debug("Recorded usage for skill %s (success=%s)", skill_id, success)
 
+    def flush_usage(self) -> None:
+        """Write buffered usage-counter updates to their skill files."""
+        if not self._dirty_usage or self._skills is None:
+            return
+        try:
+            for skill_id in self._dirty_usage:
+                skill = self._skills.get(skill_id)
+                if skill is not None:
+                    self._write_skill_file(skill)
+            self._dirty_usage.clear()
+        except OSError:
+            # Best effort — e.g. atexit after a temp skills dir is gone
+            logger.debug("Could not flush usage counters to %s", self.skills_dir)
+
     def rollback_skill(self, skill_id: str) -> bool:
         """Remove an evolved skill if its success rate is below threshold.
 
@@ -1,15 +1,39 @@
 """Memory store — JSONL persistence and keyword-based retrieval."""
 
+import atexit
+import heapq
+import io
 import json
 import logging
-import uuid
+import secrets
+import time
 from datetime import datetime
 from pathlib import Path
 
 from sparkagent.memory.models import MemoryEntry
+from sparkagent.memory.turn_context import TurnContext
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional performance dependency — stdlib json otherwise
+try:
+    import orjson
+
+    def _dumps_line(record: dict) -> bytes:
+        return orjson.dumps(record) + b"\n"
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps_line(record: dict) -> bytes:
+        return (json.dumps(record) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
+# Below this many entries a linear scan beats the inverted-index path
+# (and keeps the recency-only matches the small-store behaviour relies on)
+_INDEX_SCAN_THRESHOLD = 64
+
 
 class NullMemoryStore:
     """No-op memory store used when the memory system is disabled."""
@@ -38,6 +62,10 @@ class NullMemoryStore:
         """Return empty list."""
         return []
 
+    def retrieve_ctx(self, ctx, max_results=10):
+        """Return empty list."""
+        return []
+
     def retrieve_for_context(self, query, max_entries=10, max_chars=2000):
         """Return empty string."""
         return ""
@@ -47,49 +75,169 @@ class MemoryStore:
     """Persistent store for memory entries.
 
     Follows the SessionManager pattern: JSONL file on disk, in-memory cache,
-    lazy load on first access.
+    lazy load on first access. The file is an append-only log: updates
+    append a fresh record for the same id (latest wins on load) and deletes
+    append a tombstone, so each mutation writes one line instead of
+    rewriting the whole file. The log is compacted once dead records
+    outnumber live entries 2:1.
     """
 
-    def __init__(self, storage_dir: Path | None = None):
-        """Initialize the memory store."""
-        self.storage_dir = storage_dir or (Path.home() / ".sparkagent" / "memory")
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self._entries_path = self.storage_dir / "entries.jsonl"
+    def __init__(self, storage_dir: Path | None = None, storage: io.BytesIO | None = None):
+        """Initialize the memory store.
+
+        Args:
+            storage_dir: directory holding the JSONL log on disk.
+            storage: in-memory buffer backing the log instead of a file,
+                for ephemeral stores where persistence is incidental.
+
+        """
+        self._storage = storage
+        if storage is not None:
+            self.storage_dir = None
+            self._entries_path = None
+        else:
+            self.storage_dir = storage_dir or (Path.home() / ".sparkagent" / "memory")
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            self._entries_path = self.storage_dir / "entries.jsonl"
         self._cache: dict[str, MemoryEntry] | None = None
+        self._log_records = 0  # total records in the log, including dead ones
+        self._dirty_access = False  # access counts bumped in RAM but not persisted
+        # Ids are a 6-hex random salt plus a 6-hex counter: one token_hex
+        # call per process instead of a uuid4 per insert
+        self._id_salt = secrets.token_hex(3)
+        self._id_seq = 0
+        # Per-entry scoring data, precomputed at load/mutation time so
+        # retrieve doesn't re-tokenize every entry on every query
+        self._content_tokens: dict[str, frozenset[str]] = {}
+        self._tag_tokens: dict[str, frozenset[str]] = {}
+        self._updated_ts: dict[str, float] = {}
+        # Inverted index: token -> ids of entries containing it, so large
+        # stores only score entries sharing at least one query token
+        self._index: dict[str, set[str]] = {}
+        atexit.register(self.flush)
+
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Precompute token sets and timestamp for the scoring loop."""
+        self._deindex_entry(entry.id)  # clear stale tokens on update
+        content_tokens = frozenset(entry.content.lower().split())
+        tag_tokens = frozenset(t.lower() for t in entry.tags)
+        self._content_tokens[entry.id] = content_tokens
+        self._tag_tokens[entry.id] = tag_tokens
+        self._updated_ts[entry.id] = entry.updated_at.timestamp()
+        for token in content_tokens | tag_tokens:
+            self._index.setdefault(token, set()).add(entry.id)
+
+    def _deindex_entry(self, entry_id: str) -> None:
+        """Drop precomputed scoring data for a removed entry."""
+        old_tokens = self._content_tokens.pop(entry_id, frozenset()) | self._tag_tokens.pop(
+            entry_id, frozenset()
+        )
+        for token in old_tokens:
+            ids = self._index.get(token)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self._index[token]
+        self._updated_ts.pop(entry_id, None)
 
     def _ensure_loaded(self) -> dict[str, MemoryEntry]:
-        """Lazy-load entries from disk into cache."""
+        """Lazy-load entries from disk into cache, replaying the log in order."""
         if self._cache is not None:
             return self._cache
 
         self._cache = {}
-        if not self._entries_path.exists():
+        self._log_records = 0
+        raw = self._read_log()
+        if raw is None:
             return self._cache
 
+        for line in raw.split(b"\n"):
+            if not line.strip():
+                continue
+            try:
+                data = _loads(line)
+                self._log_records += 1
+                if data.get("_deleted"):
+                    self._cache.pop(data["id"], None)
+                    self._deindex_entry(data["id"])
+                    continue
+                entry = self._dict_to_entry(data)
+                self._cache[entry.id] = entry
+                self._index_entry(entry)
+            except (KeyError, ValueError):  # ValueError covers both JSON decoders
+                logger.warning("Skipping malformed entry in %s", self._entries_path)
+                continue
+
+        # Advance the id counter past any entry that shares our salt prefix
+        for entry_id in self._cache:
+            if entry_id.startswith(self._id_salt):
+                try:
+                    self._id_seq = max(self._id_seq, int(entry_id[6:], 16) + 1)
+                except ValueError:
+                    continue
+
+        return self._cache
+
+    def _read_log(self) -> bytes | None:
+        """Return the raw log bytes, or None when no log exists yet."""
+        if self._storage is not None:
+            return self._storage.getvalue()
+        if not self._entries_path.exists():
+            return None
         try:
-            with open(self._entries_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        entry = self._dict_to_entry(data)
-                        self._cache[entry.id] = entry
-                    except (json.JSONDecodeError, KeyError):
-                        logger.warning("Skipping malformed entry in %s", self._entries_path)
-                        continue
+            # One binary read instead of per-line text-mode decode
+            return self._entries_path.read_bytes()
         except OSError:
             logger.warning("Failed to read memory entries from %s", self._entries_path)
+            return None
 
-        return self._cache
+    def _append(self, record: dict) -> None:
+        """Append a single record to the log, compacting when it gets stale."""
+        line = _dumps_line(record)
+        if self._storage is not None:
+            self._storage.seek(0, io.SEEK_END)
+            self._storage.write(line)
+        else:
+            with open(self._entries_path, "ab") as f:
+                f.write(line)
+        self._log_records += 1
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the log when dead records outnumber live entries 2:1."""
+        live = len(self._cache) if self._cache is not None else 0
+        if self._log_records > 2 * max(live, 1):
+            self._save()
 
     def _save(self) -> None:
-        """Persist all entries to disk."""
+        """Compact: persist only the live entries to the backing log."""
         entries = self._ensure_loaded()
-        with open(self._entries_path, "w") as f:
+        if self._storage is not None:
+            self._storage.seek(0)
+            self._storage.truncate()
             for entry in entries.values():
-                f.write(json.dumps(self._entry_to_dict(entry)) + "\n")
+                self._storage.write(_dumps_line(self._entry_to_dict(entry)))
+        else:
+            with open(self._entries_path, "wb") as f:
+                for entry in entries.values():
+                    f.write(_dumps_line(self._entry_to_dict(entry)))
+        self._log_records = len(entries)
+        self._dirty_access = False
+
+    def flush(self) -> None:
+        """Persist buffered access-count updates, if any."""
+        if not self._dirty_access or self._cache is None:
+            return
+        try:
+            self._save()
+        except OSError:
+            # Best effort — access counts are advisory (e.g. atexit after
+            # a temp storage dir is gone)
+            logger.debug("Could not flush access counts to %s", self._entries_path)
+
+    def close(self) -> None:
+        """Flush pending state; the store remains usable afterwards."""
+        self.flush()
 
     @staticmethod
     def _entry_to_dict(entry: MemoryEntry) -> dict:
@@ -127,8 +275,10 @@ class MemoryStore:
         """Insert a new memory entry."""
         entries = self._ensure_loaded()
         now = datetime.now()
+        entry_id = f"{self._id_salt}{self._id_seq:06x}"
+        self._id_seq += 1
         entry = MemoryEntry(
-            id=uuid.uuid4().hex[:12],
+            id=entry_id,
             content=content,
             tags=tags or [],
             source_session=source_session,
@@ -137,7 +287,8 @@ class MemoryStore:
             updated_at=now,
         )
         entries[entry.id] = entry
-        self._save()
+        self._index_entry(entry)
+        self._append(self._entry_to_dict(entry))
         logger.info("Inserted memory %s: %.60s (tags=%s)", entry.id, content, tags or [])
         return entry
 
@@ -153,7 +304,8 @@ class MemoryStore:
         if tags is not None:
             entry.tags = tags
         entry.updated_at = datetime.now()
-        self._save()
+        self._index_entry(entry)
+        self._append(self._entry_to_dict(entry))
         logger.info("Updated memory %s", entry_id)
         return entry
 
@@ -163,7 +315,8 @@ class MemoryStore:
         if entry_id not in entries:
             return False
         del entries[entry_id]
-        self._save()
+        self._deindex_entry(entry_id)
+        self._append({"id": entry_id, "_deleted": True})
         logger.info("Deleted memory %s", entry_id)
         return True
 
@@ -178,54 +331,78 @@ class MemoryStore:
         return list(entries.values())
 
     def retrieve(self, query: str, max_results: int = 10) -> list[MemoryEntry]:
-        """Retrieve entries relevant to a query using keyword scoring.
+        """Retrieve entries relevant to a query using keyword scoring."""
+        return self.retrieve_ctx(TurnContext.from_text(query), max_results=max_results)
+
+    def retrieve_ctx(self, ctx: TurnContext, max_results: int = 10) -> list[MemoryEntry]:
+        """Retrieve entries relevant to a pre-tokenized turn context.
 
-        Scoring: (tag_overlap * 3) + content_word_overlap + recency_bonus
+        Scoring: (tag_overlap * 3) + content_word_overlap + recency_bonus.
+        Callers that already hold a TurnContext avoid re-tokenizing the
+        query text.
         """
         entries = self._ensure_loaded()
         if not entries:
             return []
 
-        query_tokens = set(query.lower().split())
+        query_tokens = ctx.tokens
         if not query_tokens:
             return []
 
-        now = datetime.now()
+        now_ts = time.time()
         scored: list[tuple[float, MemoryEntry]] = []
 
-        for entry in entries.values():
-            # Tag overlap (weighted 3x)
-            entry_tags = {t.lower() for t in entry.tags}
-            tag_overlap = len(query_tokens & entry_tags) * 3
+        if len(entries) >= _INDEX_SCAN_THRESHOLD:
+            # Score only entries sharing at least one query token
+            candidate_ids: set[str] = set()
+            for token in query_tokens:
+                candidate_ids |= self._index.get(token, set())
+            candidates = [entries[entry_id] for entry_id in candidate_ids]
+        else:
+            candidates = list(entries.values())
+
+        # Local aliases keep the scoring loop free of attribute lookups
+        tag_tokens = self._tag_tokens
+        content_tokens = self._content_tokens
+        updated_ts = self._updated_ts
+
+        for entry in candidates:
+            entry_id = entry.id
+
+            # Tag overlap (weighted 3x) — token sets precomputed at load time
+            tag_overlap = len(query_tokens & tag_tokens[entry_id]) * 3
 
             # Content word overlap
-            content_words = set(entry.content.lower().split())
-            word_overlap = len(query_tokens & content_words)
+            word_overlap = len(query_tokens & content_tokens[entry_id])
 
             # Recency bonus: max 2.0 for very recent, decaying over 30 days
-            age_seconds = (now - entry.updated_at).total_seconds()
-            age_days = max(age_seconds / 86400, 0)
+            age_days = max((now_ts - updated_ts[entry_id]) / 86400, 0)
             recency_bonus = max(0, 2.0 * (1 - age_days / 30))
 
             score = tag_overlap + word_overlap + recency_bonus
             if score > 0:
                 scored.append((score, entry))
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-
-        results = [entry for _, entry in scored[:max_results]]
-        logger.debug("Retrieved %d memories for query: %.60s", len(results), query)
-        # Update access counts
+        # Top-k selection: O(N log k) vs sorting the full candidate list
+        top = heapq.nlargest(max_results, scored, key=lambda x: x[0])
+        results = [entry for _, entry in top]
+        logger.debug("Retrieved %d memories for query: %.60s", len(results), ctx.text)
+        # Update access counts in RAM only — counts are advisory, so they
+        # persist lazily at the next compaction or flush instead of
+        # rewriting the file on this read path
         for entry in results:
             entry.access_count += 1
         if results:
-            self._save()
+            self._dirty_access = True
 
         return results
 
-    def retrieve_for_context(self, query: str, max_entries: int = 10, max_chars: int = 2000) -> str:
+    def retrieve_for_context(
+        self, query: str | TurnContext, max_entries: int = 10, max_chars: int = 2000
+    ) -> str:
         """Retrieve memories and format as markdown for the system prompt."""
-        entries = self.retrieve(query, max_results=max_entries)
+        ctx = query if isinstance(query, TurnContext) else TurnContext.from_text(query)
+        entries = self.retrieve_ctx(ctx, max_results=max_entries)
         if not entries:
             return ""
 
@@ -0,0 +1,23 @@
+"""Per-turn text context, tokenized once and shared across the memory pipeline."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class TurnContext:
+    """Conversation-turn text with its lowercased form and token set.
+
+    Built once per turn so retrieval and any other keyword consumer
+    reuse the same tokenization instead of re-running lower()/split()
+    on multi-KB turns.
+    """
+
+    text: str
+    text_lower: str
+    tokens: frozenset[str]
+
+    @classmethod
+    def from_text(cls, text: str) -> "TurnContext":
+        """Build a context, lowering and tokenizing the text once."""
+        text_lower = text.lower()
+        return cls(text=text, text_lower=text_lower, tokens=frozenset(text_lower.split()))
@@ -1,5 +1,10 @@
 """Anthropic LLM provider using the official SDK."""
 
+import asyncio
+import functools
+import json
+import logging
+import time
 from collections.abc import Callable
 from typing import Any
 
@@ -7,6 +12,8 @@ import anthropic
 
 from sparkagent.providers.base import LLMProvider, LLMResponse, ToolCall
 
+logger = logging.getLogger(__name__)
+
 
 def _classify_anthropic_credential(
     credential: str | None,
@@ -26,6 +33,27 @@ def _classify_anthropic_credential(
     return credential, None
 
 
+# Shared default for tools declared without parameters — built once instead
+# of allocating a fresh empty schema on every cache miss
+_EMPTY_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}}
+
+
+@functools.lru_cache(maxsize=512)
+def _convert_tool_cached(tool_key: str) -> dict[str, Any]:
+    """Convert a canonically serialized OpenAI tool schema (memoized).
+
+    Tool schemas rarely change between calls, so conversion is keyed on
+    the sorted JSON form and reused on the warm path. The returned dict
+    is shared across calls and must not be mutated.
+    """
+    fn = json.loads(tool_key)["function"]
+    return {
+        "name": fn["name"],
+        "description": fn.get("description", ""),
+        "input_schema": fn.get("parameters") or _EMPTY_SCHEMA,
+    }
+
+
 class AnthropicProvider(LLMProvider):
     """LLM provider for the Anthropic Messages API.
 
@@ -55,6 +83,7 @@ class AnthropicProvider(LLMProvider):
         api_base: str | None = None,
         default_model: str = "claude-sonnet-4-6",
         timeout: float = 120.0,
+        max_concurrency: int = 8,
         # OAuth support
         refresh_token: str | None = None,
         expires_at: str | None = None,
@@ -68,6 +97,7 @@ class AnthropicProvider(LLMProvider):
             api_base: Base URL for the Anthropic API.
             default_model: Default model identifier.
             timeout: Request timeout in seconds.
+            max_concurrency: maximum in-flight API requests.
             refresh_token: OAuth refresh token for automatic renewal.
             expires_at: ISO 8601 expiry timestamp for the access token.
             token_type: Credential type (``"oauth"`` or ``None``).
@@ -75,18 +105,24 @@ class AnthropicProvider(LLMProvider):
                 refresh_token, expires_at)`` after a successful token refresh.
 
         """
-        super().__init__(api_key, api_base)
+        super().__init__(api_key, api_base, max_concurrency=max_concurrency)
         self.default_model = default_model
         self._base_url = api_base or self.DEFAULT_BASE_URL
         self._timeout = timeout
 
         # OAuth state
         self._refresh_token = refresh_token
-        self._expires_at = expires_at
+        self._expires_at_epoch: float | None = None
+        self._set_expires_at(expires_at)
         self._token_type = token_type
         self._on_token_refresh = on_token_refresh
+        self._refresh_task: asyncio.Task | None = None
+        self._refresh_lock = asyncio.Lock()
 
         resolved_api_key, resolved_auth_token = _classify_anthropic_credential(api_key)
+        # Remember the credential kind so refreshes of the same kind can
+        # swap the token in place instead of rebuilding the client
+        self._uses_auth_token = resolved_auth_token is not None
         self.client = self._build_client(resolved_api_key, resolved_auth_token)
 
     def _build_client(
@@ -112,25 +148,80 @@ class AnthropicProvider(LLMProvider):
 
         return anthropic.AsyncAnthropic(**kwargs)
 
-    async def _ensure_valid_token(self) -> None:
-        """Refresh the OAuth token if it has expired.
+    def _set_expires_at(self, expires_at: str | None) -> None:
+        """Record the expiry string and cache its parsed epoch."""
+        from sparkagent.auth.oauth import parse_expiry_epoch
 
-        Only runs when ``token_type`` is ``"oauth"``. Transparently
-        recreates the SDK client with the new access token and invokes
-        the ``on_token_refresh`` callback so the caller can persist
-        the updated credentials.
+        self._expires_at = expires_at
+        self._expires_at_epoch = parse_expiry_epoch(expires_at)
+
+    def _token_expired(self) -> bool:
+        """Check the cached expiry epoch against the refresh buffer."""
+        from sparkagent.auth.oauth import TOKEN_EXPIRY_BUFFER_SECONDS
+
+        epoch = self._expires_at_epoch
+        return epoch is None or time.time() >= epoch - TOKEN_EXPIRY_BUFFER_SECONDS
+
+    def _token_stale(self) -> bool:
+        """Check whether the cached expiry falls inside the proactive-refresh window."""
+        from sparkagent.auth.oauth import (
+            TOKEN_EXPIRY_BUFFER_SECONDS,
+            TOKEN_STALE_WINDOW_SECONDS,
+        )
+
+        epoch = self._expires_at_epoch
+        if epoch is None:
+            return False
+        return time.time() >= epoch - TOKEN_EXPIRY_BUFFER_SECONDS - TOKEN_STALE_WINDOW_SECONDS
+
+    async def _ensure_valid_token(self) -> None:
+        """Keep the OAuth token valid with a fresh/stale/expired state machine.
+
+        Only runs when ``token_type`` is ``"oauth"``. Fresh tokens return
+        immediately. Stale tokens (nearing expiry) kick off a background
+        refresh and keep serving the current token, so callers never
+        block at the expiry boundary. Only truly expired tokens block on
+        the refresh round trip. Expiry checks compare against the epoch
+        cached at set-time, so the hot path never re-parses the ISO
+        timestamp.
         """
         if self._token_type != "oauth":
             return
 
-        from sparkagent.auth.oauth import (
-            compute_expires_at,
-            is_token_expired,
-            refresh_access_token,
-        )
+        if self._token_expired():
+            async with self._refresh_lock:
+                # Another caller may have refreshed while we waited
+                if self._token_expired():
+                    await self._await_refresh()
+            return
 
-        if not is_token_expired(self._expires_at):
+        if self._token_stale() and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._do_refresh())
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+
+    async def _await_refresh(self) -> None:
+        """Block on an in-flight background refresh, or run one now."""
+        task = self._refresh_task
+        if task is not None and not task.done():
+            await task
             return
+        await self._do_refresh()
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        """Surface background refresh errors; the blocking path will retry."""
+        if not task.cancelled() and task.exception():
+            logger.warning("Background OAuth token refresh failed: %s", task.exception())
+
+    async def _do_refresh(self) -> None:
+        """Refresh the access token and swap in a client that uses it.
+
+        Invokes the ``on_token_refresh`` callback so the caller can
+        persist the updated credentials.
+        """
+        from sparkagent.auth.oauth import compute_expires_at, refresh_access_token
 
         if not self._refresh_token:
             from sparkagent.auth.oauth import OAuthError
@@ -144,12 +235,20 @@ class AnthropicProvider(LLMProvider):
         new_expires_at = compute_expires_at(tokens.expires_in)
 
         # Update internal state
-        self._expires_at = new_expires_at
+        self._set_expires_at(new_expires_at)
         self._refresh_token = tokens.refresh_token
 
-        # Recreate the SDK client with the new token
-        _, resolved_auth_token = _classify_anthropic_credential(tokens.access_token)
-        self.client = self._build_client(None, resolved_auth_token)
+        # Swap the token into the existing client when the credential kind
+        # is unchanged — rebuilding would tear down the SDK's pooled HTTP
+        # connections on every refresh
+        resolved_api_key, resolved_auth_token = _classify_anthropic_credential(
+            tokens.access_token
+        )
+        if resolved_auth_token is not None and self._uses_auth_token:
+            self.client.auth_token = resolved_auth_token
+        else:
+            self._uses_auth_token = resolved_auth_token is not None
+            self.client = self._build_client(resolved_api_key, resolved_auth_token)
 
         # Notify caller to persist the new tokens
         if self._on_token_refresh:
@@ -157,31 +256,23 @@ class AnthropicProvider(LLMProvider):
                 tokens.access_token, tokens.refresh_token, new_expires_at
             )
 
-    async def chat(
+    def _build_request(
         self,
         messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None = None,
-        model: str | None = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-        tool_choice: dict[str, Any] | str | None = None,
-    ) -> LLMResponse:
-        """Send a chat completion request."""
-        await self._ensure_valid_token()
-
-        model = model or self.default_model
-
-        # Extract system messages — Anthropic takes system as a top-level parameter.
-        system_parts: list[str] = []
-        non_system: list[dict[str, Any]] = []
-        for msg in messages:
-            if msg.get("role") == "system":
-                system_parts.append(msg["content"])
-            else:
-                non_system.append(msg)
+        tools: list[dict[str, Any]] | None,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+        tool_choice: dict[str, Any] | str | None,
+    ) -> dict[str, Any]:
+        """Build the Messages API kwargs shared by chat and chat_stream."""
+        # Extract system messages — Anthropic takes system as a top-level
+        # parameter. Comprehensions keep the split loops in C.
+        system_parts = [m["content"] for m in messages if m.get("role") == "system"]
+        non_system = [m for m in messages if m.get("role") != "system"]
 
         kwargs: dict[str, Any] = {
-            "model": model,
+            "model": model or self.default_model,
             "max_tokens": max_tokens,
             "messages": non_system,
             "temperature": temperature,
@@ -192,9 +283,25 @@ class AnthropicProvider(LLMProvider):
             kwargs["tools"] = [self._convert_tool(t) for t in tools]
             if tool_choice is not None:
                 kwargs["tool_choice"] = tool_choice
+        return kwargs
+
+    async def chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tool_choice: dict[str, Any] | str | None = None,
+    ) -> LLMResponse:
+        """Send a chat completion request."""
+        await self._ensure_valid_token()
+
+        kwargs = self._build_request(messages, tools, model, max_tokens, temperature, tool_choice)
 
         try:
-            response = await self.client.messages.create(**kwargs)
+            async with self._sem:
+                response = await self.client.messages.create(**kwargs)
             return self._parse_response(response)
         except anthropic.APIStatusError as e:
             return LLMResponse(
@@ -207,27 +314,63 @@ class AnthropicProvider(LLMProvider):
                 finish_reason="error",
             )
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tool_choice: dict[str, Any] | str | None = None,
+    ):
+        """Stream a chat completion through the SDK's streaming API.
+
+        Yields text deltas as they arrive, then the assembled LLMResponse
+        (including any tool calls) as the final item, so time-to-first-
+        token no longer waits on the full generation.
+        """
+        await self._ensure_valid_token()
+
+        kwargs = self._build_request(messages, tools, model, max_tokens, temperature, tool_choice)
+
+        try:
+            async with self._sem:
+                async with self.client.messages.stream(**kwargs) as stream:
+                    async for text in stream.text_stream:
+                        if text:
+                            yield text
+                    message = await stream.get_final_message()
+            yield self._parse_response(message)
+        except anthropic.APIStatusError as e:
+            yield LLMResponse(
+                content=f"API error ({e.status_code}): {str(e.message)[:500]}",
+                finish_reason="error",
+            )
+        except Exception as e:
+            yield LLMResponse(
+                content=f"Request failed: {str(e)}",
+                finish_reason="error",
+            )
+
     @staticmethod
     def _convert_tool(tool: dict[str, Any]) -> dict[str, Any]:
         """Convert an OpenAI-style tool schema to Anthropic format."""
-        fn = tool["function"]
-        return {
-            "name": fn["name"],
-            "description": fn.get("description", ""),
-            "input_schema": fn.get("parameters", {"type": "object", "properties": {}}),
-        }
+        return _convert_tool_cached(json.dumps(tool, sort_keys=True))
 
     @staticmethod
     def _parse_response(response: Any) -> LLMResponse:
         """Parse an Anthropic Message into our standard format."""
         content_parts: list[str] = []
         tool_calls: list[ToolCall] = []
+        # Bind the append methods once — avoids an attribute lookup per block
+        append_text = content_parts.append
+        append_call = tool_calls.append
 
         for block in response.content:
             if block.type == "text":
-                content_parts.append(block.text)
+                append_text(block.text)
             elif block.type == "tool_use":
-                tool_calls.append(ToolCall(
+                append_call(ToolCall(
                     id=block.id,
                     name=block.name,
                     arguments=block.input,
@@ -242,7 +385,7 @@ class AnthropicProvider(LLMProvider):
             }
 
         return LLMResponse(
-            content="\n\n".join(content_parts) if content_parts else None,
+            content="\n\n".join(content_parts) or None,
             tool_calls=tool_calls,
             finish_reason="tool_calls" if tool_calls else response.stop_reason or "stop",
             usage=usage,
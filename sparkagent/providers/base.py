@@ -1,6 +1,8 @@
 """Base classes for LLM providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -32,10 +34,18 @@ class LLMResponse:
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
-    def __init__(self, api_key: str | None = None, api_base: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_base: str | None = None,
+        max_concurrency: int = 8,
+    ):
         """Initialize the provider."""
         self.api_key = api_key
         self.api_base = api_base
+        # Bounds in-flight requests so batched callers scale throughput
+        # without tripping provider rate limits
+        self._sem = asyncio.Semaphore(max_concurrency)
 
     @abstractmethod
     async def chat(
@@ -50,6 +60,52 @@ class LLMProvider(ABC):
         """Send a chat completion request."""
         pass
 
+    async def chat_many(self, batches: list[dict[str, Any]]) -> list[LLMResponse]:
+        """Run many chat() calls concurrently under the provider's limit.
+
+        Args:
+            batches: one chat() kwargs dict per request.
+
+        Returns:
+            Responses in the same order as the input batches.
+
+        """
+        return list(await asyncio.gather(*(self.chat(**batch) for batch in batches)))
+
+    async def aclose(self) -> None:
+        """Release provider resources (e.g. pooled HTTP connections).
+
+        Default is a no-op for providers without persistent state.
+        """
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tool_choice: dict[str, Any] | str | None = None,
+    ) -> AsyncIterator[str | LLMResponse]:
+        """Stream a chat completion request.
+
+        Yields content deltas as strings, followed by the assembled
+        LLMResponse as the final item. The default implementation falls
+        back to a single non-streaming chat() call, so providers without
+        a streaming endpoint still work with streaming callers.
+        """
+        response = await self.chat(
+            messages,
+            tools=tools,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            tool_choice=tool_choice,
+        )
+        if response.content:
+            yield response.content
+        yield response
+
     @abstractmethod
     def get_default_model(self) -> str:
         """Get the default model for this provider."""
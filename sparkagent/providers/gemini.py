@@ -1,7 +1,9 @@
 """Google Gemini LLM provider using the google-genai SDK."""
 
-import asyncio
-import uuid
+import functools
+import itertools
+import json
+from secrets import token_hex
 from typing import Any
 
 from google import genai
@@ -10,10 +12,30 @@ from google.genai import types
 from sparkagent.providers.base import LLMProvider, LLMResponse, ToolCall
 
 
+@functools.lru_cache(maxsize=128)
+def _convert_tools_cached(tool_keys: tuple[str, ...]) -> types.Tool:
+    """Build a Gemini Tool from canonically serialized schemas (memoized).
+
+    Tool schemas rarely change between calls, so the declarations are
+    keyed on their sorted JSON forms and reused on the warm path.
+    """
+    declarations = []
+    for tool_key in tool_keys:
+        fn = json.loads(tool_key)["function"]
+        declarations.append(types.FunctionDeclaration(
+            name=fn["name"],
+            description=fn.get("description", ""),
+            parameters=fn.get("parameters"),
+        ))
+    return types.Tool(function_declarations=declarations)
+
+
 class GeminiProvider(LLMProvider):
     """LLM provider for Google Gemini models.
 
-    Uses the google-genai SDK (synchronous) with asyncio.to_thread for async compat.
+    Uses the google-genai SDK's native async surface (client.aio), so
+    concurrent requests share the SDK's async httpx transport instead of
+    serializing through a thread pool.
     """
 
     def __init__(
@@ -22,9 +44,10 @@ class GeminiProvider(LLMProvider):
         api_base: str | None = None,
         default_model: str = "gemini-2.5-flash",
         timeout: float = 120.0,
+        max_concurrency: int = 8,
     ):
         """Initialize the Gemini provider."""
-        super().__init__(api_key, api_base)
+        super().__init__(api_key, api_base, max_concurrency=max_concurrency)
         self.default_model = default_model
         self.timeout = timeout
         self.client = genai.Client(api_key=api_key)
@@ -55,12 +78,12 @@ class GeminiProvider(LLMProvider):
                         function_calling_config=types.FunctionCallingConfig(mode="ANY")
                     )
 
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
-                model=model,
-                contents=contents,
-                config=config,
-            )
+            async with self._sem:
+                response = await self.client.aio.models.generate_content(
+                    model=model,
+                    contents=contents,
+                    config=config,
+                )
             return self._parse_response(response)
         except Exception as e:
             return LLMResponse(
@@ -68,38 +91,43 @@ class GeminiProvider(LLMProvider):
                 finish_reason="error",
             )
 
+    @staticmethod
+    def _gemini_role(msg: dict[str, Any]) -> str:
+        """Map an OpenAI message role to its Gemini equivalent."""
+        role = msg["role"]
+        if role == "system":
+            return "system"
+        if role == "assistant":
+            return "model"
+        # "user" and "tool" results both map to user role
+        return "user"
+
     def _convert_messages(
         self, messages: list[dict[str, Any]]
     ) -> tuple[str | None, list[types.Content]]:
-        """Convert OpenAI-format messages to Gemini format."""
-        system_instruction: str | None = None
-        contents: list[types.Content] = []
+        """Convert OpenAI-format messages to Gemini format.
 
-        for msg in messages:
-            role = msg["role"]
-            text = msg.get("content") or ""
+        Consecutive messages with the same Gemini role are merged into a
+        single multi-part Content, so long histories produce fewer
+        objects and a smaller serialized payload.
+        """
+        system_parts: list[str] = []
+        contents: list[types.Content] = []
 
+        for role, group in itertools.groupby(messages, key=self._gemini_role):
             if role == "system":
-                system_instruction = text
-            elif role == "assistant":
-                contents.append(types.Content(role="model", parts=[types.Part.from_text(text=text)]))
-            else:
-                # "user" and "tool" results both map to user role
-                contents.append(types.Content(role="user", parts=[types.Part.from_text(text=text)]))
+                system_parts.extend(m.get("content") or "" for m in group)
+                continue
+            contents.append(types.Content(
+                role=role,
+                parts=[types.Part.from_text(text=m.get("content") or "") for m in group],
+            ))
 
-        return system_instruction, contents
+        return "\n\n".join(system_parts) if system_parts else None, contents
 
     def _convert_tools(self, tools: list[dict[str, Any]]) -> types.Tool:
         """Convert OpenAI-format tool schemas to a Gemini Tool."""
-        declarations = []
-        for tool in tools:
-            fn = tool["function"]
-            declarations.append(types.FunctionDeclaration(
-                name=fn["name"],
-                description=fn.get("description", ""),
-                parameters=fn.get("parameters"),
-            ))
-        return types.Tool(function_declarations=declarations)
+        return _convert_tools_cached(tuple(json.dumps(t, sort_keys=True) for t in tools))
 
     def _parse_response(self, response: Any) -> LLMResponse:
         """Parse Gemini response into LLMResponse."""
@@ -112,7 +140,7 @@ class GeminiProvider(LLMProvider):
                 text_parts.append(part.text)
             elif part.function_call:
                 tool_calls.append(ToolCall(
-                    id=uuid.uuid4().hex[:8],
+                    id=token_hex(4),
                     name=part.function_call.name,
                     arguments=dict(part.function_call.args) if part.function_call.args else {},
                 ))
@@ -128,7 +156,7 @@ class GeminiProvider(LLMProvider):
         finish = candidate.finish_reason.name.lower() if candidate.finish_reason else "stop"
 
         return LLMResponse(
-            content="\n".join(text_parts) if text_parts else None,
+            content="\n".join(text_parts) or None,
             tool_calls=tool_calls,
             finish_reason=finish,
             usage=usage,
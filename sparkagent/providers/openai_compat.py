@@ -1,12 +1,39 @@
 """OpenAI-compatible LLM provider using httpx."""
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
 from sparkagent.providers.base import LLMProvider, LLMResponse, ToolCall
 
+# orjson is an optional performance dependency — stdlib json otherwise
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# h2 is an optional dependency — with it installed, concurrent requests
+# multiplex over one HTTP/2 connection instead of one socket each
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Bodies at least this large are parsed on a worker thread so a multi-KB
+# JSON decode does not stall the event loop
+_PARSE_OFFLOAD_BYTES = 64 * 1024
+
 
 class OpenAICompatibleProvider(LLMProvider):
     """LLM provider for OpenAI-compatible APIs.
@@ -22,12 +49,43 @@ class OpenAICompatibleProvider(LLMProvider):
         api_base: str | None = None,
         default_model: str = "gpt-4o",
         timeout: float = 120.0,
+        max_concurrency: int = 8,
     ):
         """Initialize the OpenAI-compatible provider."""
-        super().__init__(api_key, api_base)
+        super().__init__(api_key, api_base, max_concurrency=max_concurrency)
         self.default_model = default_model
         self.timeout = timeout
         self.base_url = api_base or self.DEFAULT_BASE_URL
+        # Computed once — every request inherits these from the client
+        self._default_headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            self._default_headers["Authorization"] = f"Bearer {self.api_key}"
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use.
+
+        Keeping one pooled client per provider instance reuses TCP+TLS
+        connections across calls instead of paying the handshake each turn.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._default_headers,
+                timeout=self.timeout,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=30,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
     async def chat(
         self,
@@ -52,34 +110,135 @@ class OpenAICompatibleProvider(LLMProvider):
             payload["tools"] = tools
             payload["tool_choice"] = tool_choice if tool_choice is not None else "auto"
 
+        client = self._get_client()
+        try:
+            async with self._sem:
+                response = await client.post("/chat/completions", content=_dumps(payload))
+            response.raise_for_status()
+            body = response.content
+            if len(body) >= _PARSE_OFFLOAD_BYTES:
+                data = await asyncio.to_thread(_loads, body)
+            else:
+                data = _loads(body)
+            return self._parse_response(data)
+        except httpx.HTTPStatusError as e:
+            error_body = e.response.text
+            return LLMResponse(
+                content=f"API error ({e.response.status_code}): {error_body[:500]}",
+                finish_reason="error",
+            )
+        except Exception as e:
+            return LLMResponse(
+                content=f"Request failed: {str(e)}",
+                finish_reason="error",
+            )
 
-        headers = {
-            "Content-Type": "application/json",
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tool_choice: dict[str, Any] | str | None = None,
+    ) -> AsyncIterator[str | LLMResponse]:
+        """Stream a chat completion over SSE.
+
+        Yields content deltas as they arrive, then the assembled
+        LLMResponse (including any tool calls) as the final item.
+        """
+        model = model or self.default_model
+
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
         }
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers=headers,
-                )
+        if tools:
+            payload["tools"] = tools
+            payload["tool_choice"] = tool_choice if tool_choice is not None else "auto"
+
+        content_parts: list[str] = []
+        tool_call_parts: dict[int, dict[str, Any]] = {}
+        finish_reason = "stop"
+
+        client = self._get_client()
+        try:
+            async with client.stream(
+                "POST", "/chat/completions", content=_dumps(payload)
+            ) as response:
+                if response.status_code >= 400:
+                    # Read the body before raising — raise_for_status() on an
+                    # unread stream closes it, and the handler below needs it.
+                    await response.aread()
                 response.raise_for_status()
-                data = response.json()
-                return self._parse_response(data)
-            except httpx.HTTPStatusError as e:
-                error_body = e.response.text
-                return LLMResponse(
-                    content=f"API error ({e.response.status_code}): {error_body[:500]}",
-                    finish_reason="error",
-                )
-            except Exception as e:
-                return LLMResponse(
-                    content=f"Request failed: {str(e)}",
-                    finish_reason="error",
-                )
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data_str = line[6:]
+                    if data_str.strip() == "[DONE]":
+                        break
+                    try:
+                        chunk = _loads(data_str)
+                    except ValueError:
+                        continue
+
+                    choices = chunk.get("choices")
+                    if not choices:
+                        continue
+                    choice = choices[0]
+                    if choice.get("finish_reason"):
+                        finish_reason = choice["finish_reason"]
+
+                    delta = choice.get("delta", {})
+                    content_delta = delta.get("content")
+                    if content_delta:
+                        content_parts.append(content_delta)
+                        yield content_delta
+
+                    for tc in delta.get("tool_calls") or []:
+                        idx = tc.get("index", 0)
+                        part = tool_call_parts.setdefault(
+                            idx, {"id": "", "name": "", "arguments": ""}
+                        )
+                        if tc.get("id"):
+                            part["id"] = tc["id"]
+                        fn = tc.get("function", {})
+                        if fn.get("name"):
+                            part["name"] = fn["name"]
+                        if fn.get("arguments"):
+                            part["arguments"] += fn["arguments"]
+        except httpx.HTTPStatusError as e:
+            error_body = (await e.response.aread()).decode("utf-8", errors="replace")
+            yield LLMResponse(
+                content=f"API error ({e.response.status_code}): {error_body[:500]}",
+                finish_reason="error",
+            )
+            return
+        except Exception as e:
+            yield LLMResponse(
+                content=f"Request failed: {str(e)}",
+                finish_reason="error",
+            )
+            return
+
+        tool_calls = []
+        for idx in sorted(tool_call_parts):
+            part = tool_call_parts[idx]
+            try:
+                args = _loads(part["arguments"]) if part["arguments"] else {}
+            except ValueError:
+                args = {"raw": part["arguments"]}
+            tool_calls.append(ToolCall(id=part["id"], name=part["name"], arguments=args))
+
+        yield LLMResponse(
+            content="".join(content_parts) or None,
+            tool_calls=tool_calls,
+            finish_reason=finish_reason,
+        )
 
     def _parse_response(self, data: dict[str, Any]) -> LLMResponse:
         """Parse the API response into our format."""
@@ -90,10 +249,10 @@ class OpenAICompatibleProvider(LLMProvider):
         if "tool_calls" in message and message["tool_calls"]:
             for tc in message["tool_calls"]:
                 args = tc["function"]["arguments"]
-                if isinstance(args, str):
+                if isinstance(args, (str, bytes)):
                     try:
-                        args = json.loads(args)
-                    except json.JSONDecodeError:
+                        args = _loads(args)
+                    except ValueError:
                         args = {"raw": args}
 
                 tool_calls.append(ToolCall(
@@ -82,6 +82,9 @@ class TestCodeActParser:
     def test_has_code_fence(self):
         assert self.parser.has_code("```python\nprint(1)\n```")
 
+    def test_has_code_unclosed_tag(self):
+        assert not self.parser.has_code("<execute>\nx = 1")
+
     # ------------------------------------------------------------------
     # extract_code()
     # ------------------------------------------------------------------
@@ -5,12 +5,65 @@ from __future__ import annotations
 import base64
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
 
 import pytest
 
 from sparkagent.agent.context import ContextBuilder
 
+class _StubStore:
+    """Minimal memory-store stand-in that records retrieve calls."""
+
+    def __init__(self, ret: str = ""):
+        self.calls: list[str] = []
+        self.ret = ret
+
+    def retrieve_for_context(self, message: str) -> str:
+        self.calls.append(message)
+        return self.ret
+
+
+# 1x1 red PNG, decoded once at import time
+_RED_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4"
+    "nGP4z8BQDwAEgAF/pooBPQAAAABJRU5ErkJggg=="
+)
+
+
+@pytest.fixture(scope="session")
+def red_png(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the 1x1 PNG to disk once for the whole session."""
+    path = tmp_path_factory.mktemp("img") / "red.png"
+    path.write_bytes(_RED_PNG)
+    return path
+
+
+@pytest.fixture(scope="session")
+def workspace_with_agents_md(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Workspace holding a canonical AGENTS.md, materialized once."""
+    root = tmp_path_factory.mktemp("ws_agents")
+    (root / "AGENTS.md").write_text("Custom agent instructions")
+    return root
+
+
+@pytest.fixture(scope="session")
+def workspace_with_memory_md(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Workspace holding a canonical memory/MEMORY.md, materialized once."""
+    root = tmp_path_factory.mktemp("ws_memory")
+    mem_dir = root / "memory"
+    mem_dir.mkdir()
+    (mem_dir / "MEMORY.md").write_text("User prefers dark mode.")
+    return root
+
+
+@pytest.fixture(scope="session")
+def shared_cb(tmp_path_factory: pytest.TempPathFactory) -> ContextBuilder:
+    """Builder over an empty shared workspace for tests that never mutate it.
+
+    Tests that write workspace files or inject a memory store build
+    their own ContextBuilder on a function-scoped tmp_path instead.
+    """
+    return ContextBuilder(tmp_path_factory.mktemp("workspace"))
+
 
 # ---------------------------------------------------------------------------
 # System prompt assembly
@@ -18,69 +71,67 @@ from sparkagent.agent.context import ContextBuilder
 
 
 class TestBuildSystemPrompt:
-    def test_includes_identity(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
-        prompt = cb.build_system_prompt()
+    def test_includes_identity(self, shared_cb: ContextBuilder) -> None:
+        prompt = shared_cb.build_system_prompt()
         assert "SparkAgent" in prompt
-        assert str(tmp_path.resolve()) in prompt
+        assert str(shared_cb.workspace.resolve()) in prompt
 
-    def test_loads_bootstrap_files(self, tmp_path: Path) -> None:
-        (tmp_path / "AGENTS.md").write_text("Custom agent instructions")
-        cb = ContextBuilder(tmp_path)
+    def test_loads_bootstrap_files(self, workspace_with_agents_md: Path) -> None:
+        cb = ContextBuilder(workspace_with_agents_md)
         prompt = cb.build_system_prompt()
         assert "Custom agent instructions" in prompt
         assert "AGENTS.md" in prompt
 
-    def test_skips_missing_bootstrap(self, tmp_path: Path) -> None:
+    def test_skips_missing_bootstrap(self, shared_cb: ContextBuilder) -> None:
         """No crash when workspace files don't exist."""
-        cb = ContextBuilder(tmp_path)
-        prompt = cb.build_system_prompt()
+        prompt = shared_cb.build_system_prompt()
         # Should still have identity section
         assert "SparkAgent" in prompt
 
-    def test_loads_memory_md(self, tmp_path: Path) -> None:
-        mem_dir = tmp_path / "memory"
-        mem_dir.mkdir()
-        (mem_dir / "MEMORY.md").write_text("User prefers dark mode.")
-        cb = ContextBuilder(tmp_path)
+    def test_loads_memory_md(self, workspace_with_memory_md: Path) -> None:
+        cb = ContextBuilder(workspace_with_memory_md)
         prompt = cb.build_system_prompt()
         assert "User prefers dark mode." in prompt
         assert "# Memory" in prompt
 
     def test_dynamic_memory(self, tmp_path: Path) -> None:
-        store = MagicMock()
-        store.retrieve_for_context.return_value = "Recalled: likes Python"
+        store = _StubStore(ret="Recalled: likes Python")
         cb = ContextBuilder(tmp_path, memory_store=store)
         prompt = cb.build_system_prompt(current_message="Tell me about Python")
-        store.retrieve_for_context.assert_called_once_with("Tell me about Python")
+        assert store.calls == ["Tell me about Python"]
         assert "Recalled: likes Python" in prompt
         assert "# Dynamic Memory" in prompt
 
     def test_dynamic_memory_not_called_without_message(self, tmp_path: Path) -> None:
-        store = MagicMock()
+        store = _StubStore()
         cb = ContextBuilder(tmp_path, memory_store=store)
         cb.build_system_prompt()  # no current_message
-        store.retrieve_for_context.assert_not_called()
+        assert store.calls == []
 
     def test_memory_instructions_present_when_store_set(self, tmp_path: Path) -> None:
-        store = MagicMock()
-        store.retrieve_for_context.return_value = ""
-        cb = ContextBuilder(tmp_path, memory_store=store)
+        cb = ContextBuilder(tmp_path, memory_store=_StubStore())
         prompt = cb.build_system_prompt()
         assert "Memory System" in prompt
         assert "DO NOT" in prompt
         assert "memory pipeline" in prompt
 
-    def test_memory_instructions_absent_when_no_store(self, tmp_path: Path) -> None:
+    def test_memory_instructions_absent_when_no_store(self, shared_cb: ContextBuilder) -> None:
+        prompt = shared_cb.build_system_prompt()
+        assert "Memory System" not in prompt
+
+    def test_sections_joined_with_single_separator(self, tmp_path: Path) -> None:
+        """Each section is joined exactly once — no duplicated separators."""
+        (tmp_path / "AGENTS.md").write_text("agent notes")
+        mem_dir = tmp_path / "memory"
+        mem_dir.mkdir()
+        (mem_dir / "MEMORY.md").write_text("memory notes")
         cb = ContextBuilder(tmp_path)
         prompt = cb.build_system_prompt()
-        assert "Memory System" not in prompt
+        # identity + bootstrap + memory -> two separators between three sections
+        assert prompt.count("\n\n---\n\n") == 2
 
-    def test_memory_instructions_before_bootstrap(self, tmp_path: Path) -> None:
-        (tmp_path / "AGENTS.md").write_text("Custom agent instructions")
-        store = MagicMock()
-        store.retrieve_for_context.return_value = ""
-        cb = ContextBuilder(tmp_path, memory_store=store)
+    def test_memory_instructions_before_bootstrap(self, workspace_with_agents_md: Path) -> None:
+        cb = ContextBuilder(workspace_with_agents_md, memory_store=_StubStore())
         prompt = cb.build_system_prompt()
         mem_pos = prompt.index("Memory System")
         bootstrap_pos = prompt.index("Custom agent instructions")
@@ -93,26 +144,23 @@ class TestBuildSystemPrompt:
 
 
 class TestBuildMessages:
-    def test_structure(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
-        msgs = cb.build_messages(history=[], current_message="hi")
+    def test_structure(self, shared_cb: ContextBuilder) -> None:
+        msgs = shared_cb.build_messages(history=[], current_message="hi")
         assert msgs[0]["role"] == "system"
         assert msgs[-1]["role"] == "user"
         assert msgs[-1]["content"] == "hi"
 
-    def test_includes_history(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
+    def test_includes_history(self, shared_cb: ContextBuilder) -> None:
         history = [
             {"role": "user", "content": "old q"},
             {"role": "assistant", "content": "old a"},
         ]
-        msgs = cb.build_messages(history=history, current_message="new q")
+        msgs = shared_cb.build_messages(history=history, current_message="new q")
         assert msgs[1] == {"role": "user", "content": "old q"}
         assert msgs[2] == {"role": "assistant", "content": "old a"}
         assert msgs[-1]["content"] == "new q"
 
-    def test_codeact_mode(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
+    def test_codeact_mode(self, shared_cb: ContextBuilder) -> None:
         schemas = [
             {
                 "type": "function",
@@ -127,7 +175,7 @@ class TestBuildMessages:
                 },
             }
         ]
-        msgs = cb.build_messages(
+        msgs = shared_cb.build_messages(
             history=[],
             current_message="hi",
             execution_mode="code_act",
@@ -137,9 +185,8 @@ class TestBuildMessages:
         assert "Code Execution Environment" in system
         assert "read_file" in system
 
-    def test_function_calling_no_codeact(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
-        msgs = cb.build_messages(history=[], current_message="hi")
+    def test_function_calling_no_codeact(self, shared_cb: ContextBuilder) -> None:
+        msgs = shared_cb.build_messages(history=[], current_message="hi")
         system = msgs[0]["content"]
         assert "Code Execution Environment" not in system
 
@@ -171,30 +218,35 @@ class TestSchemaToSignature:
         assert "path: str" in sig
         assert "limit: int | None = None" in sig
 
-    def test_type_mapping(self) -> None:
+    @pytest.mark.parametrize(
+        "jtype,pytype",
+        [
+            ("string", "str"),
+            ("integer", "int"),
+            ("number", "float"),
+            ("boolean", "bool"),
+            ("array", "list"),
+            ("object", "dict"),
+        ],
+    )
+    def test_type_mapping(self, jtype: str, pytype: str) -> None:
         sig = ContextBuilder._schema_to_signature(
             "t",
-            {
-                "properties": {
-                    "a": {"type": "string"},
-                    "b": {"type": "integer"},
-                    "c": {"type": "number"},
-                    "d": {"type": "boolean"},
-                    "e": {"type": "array"},
-                    "f": {"type": "object"},
-                },
-                "required": ["a", "b", "c", "d", "e", "f"],
-            },
+            {"properties": {"a": {"type": jtype}}, "required": ["a"]},
         )
-        assert "a: str" in sig
-        assert "b: int" in sig
-        assert "c: float" in sig
-        assert "d: bool" in sig
-        assert "e: list" in sig
-        assert "f: dict" in sig
-
-    def test_get_codeact_instructions_lists_tools(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
+        assert f"a: {pytype}" in sig
+
+    def test_schema_signature_cached(self) -> None:
+        from sparkagent.agent.context import _schema_signature_cached
+
+        schema = {"properties": {"path": {"type": "string"}}, "required": ["path"]}
+        hits_before = _schema_signature_cached.cache_info().hits
+        first = ContextBuilder._schema_to_signature("cached_tool", schema)
+        second = ContextBuilder._schema_to_signature("cached_tool", schema)
+        assert first == second
+        assert _schema_signature_cached.cache_info().hits > hits_before
+
+    def test_get_codeact_instructions_lists_tools(self, shared_cb: ContextBuilder) -> None:
         schemas = [
             {
                 "function": {
@@ -207,7 +259,7 @@ class TestSchemaToSignature:
                 }
             },
         ]
-        text = cb._get_codeact_instructions(schemas)
+        text = shared_cb._get_codeact_instructions(schemas)
         assert "shell(cmd: str)" in text
         assert "Run a command" in text
 
@@ -218,48 +270,35 @@ class TestSchemaToSignature:
 
 
 class TestBuildUserContent:
-    def test_text_only(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
-        result = cb._build_user_content("hello", None)
+    def test_text_only(self, shared_cb: ContextBuilder) -> None:
+        result = shared_cb._build_user_content("hello", None)
         assert result == "hello"
 
-    def test_with_image(self, tmp_path: Path) -> None:
-        img = tmp_path / "test.png"
-        # 1x1 red PNG
-        png_bytes = base64.b64decode(
-            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4"
-            "nGP4z8BQDwAEgAF/pooBPQAAAABJRU5ErkJggg=="
-        )
-        img.write_bytes(png_bytes)
-
-        cb = ContextBuilder(tmp_path)
-        result = cb._build_user_content("describe this", [str(img)])
+    def test_with_image(self, shared_cb: ContextBuilder, red_png: Path) -> None:
+        result = shared_cb._build_user_content("describe this", [str(red_png)])
         assert isinstance(result, list)
         assert result[-1] == {"type": "text", "text": "describe this"}
         assert result[0]["type"] == "image_url"
         assert result[0]["image_url"]["url"].startswith("data:image/png;base64,")
 
-    def test_invalid_media_path_returns_text(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
-        result = cb._build_user_content("hello", ["/nonexistent/img.png"])
+    def test_invalid_media_path_returns_text(self, shared_cb: ContextBuilder) -> None:
+        result = shared_cb._build_user_content("hello", ["/nonexistent/img.png"])
         assert result == "hello"
 
 
 class TestHelperMethods:
-    def test_add_assistant_message(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
+    def test_add_assistant_message(self, shared_cb: ContextBuilder) -> None:
         msgs: list[dict[str, Any]] = []
         tool_calls = [{"id": "tc1", "type": "function", "function": {"name": "foo"}}]
-        cb.add_assistant_message(msgs, "thinking...", tool_calls)
+        shared_cb.add_assistant_message(msgs, "thinking...", tool_calls)
         assert len(msgs) == 1
         assert msgs[0]["role"] == "assistant"
         assert msgs[0]["content"] == "thinking..."
         assert msgs[0]["tool_calls"] == tool_calls
 
-    def test_add_tool_result(self, tmp_path: Path) -> None:
-        cb = ContextBuilder(tmp_path)
+    def test_add_tool_result(self, shared_cb: ContextBuilder) -> None:
         msgs: list[dict[str, Any]] = []
-        cb.add_tool_result(msgs, "tc1", "read_file", "file contents")
+        shared_cb.add_tool_result(msgs, "tc1", "read_file", "file contents")
         assert len(msgs) == 1
         assert msgs[0]["role"] == "tool"
         assert msgs[0]["tool_call_id"] == "tc1"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -10,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from sparkagent.agent.loop import AgentLoop
+from sparkagent.agent.tools import ToolRegistry
 from sparkagent.bus import InboundMessage, MessageBus, OutboundMessage
 from sparkagent.config.schema import MemoryConfig
 from sparkagent.memory.models import MemoryOperation, OperationType
@@ -23,22 +25,39 @@ from sparkagent.providers.base import LLMProvider, LLMResponse, ToolCall
 # Helpers
 # ---------------------------------------------------------------------------
 
+_EXPECTED_TOOLS = frozenset({
+    "read_file",
+    "write_file",
+    "list_directory",
+    "edit_file",
+    "shell",
+    "web_search",
+    "web_fetch",
+})
+
 
 class _MockProvider(LLMProvider):
-    """Provider that returns canned responses in sequence."""
+    """Provider that returns canned responses in sequence.
+
+    Accepts any iterable, or a zero-arg callable for an endless supply
+    of responses. Exhausted iterators fall back to a stock response.
+    """
 
-    def __init__(self, responses: list[LLMResponse] | None = None):
+    def __init__(
+        self,
+        responses: Iterable[LLMResponse] | Callable[[], LLMResponse] | None = None,
+    ):
         super().__init__(api_key="fake")
-        self._responses = list(responses or [])
-        self._call_count = 0
+        if callable(responses):
+            self._next_response: Callable[[], LLMResponse] = responses
+        else:
+            response_iter = iter(responses or [])
+            self._next_response = lambda: next(
+                response_iter, LLMResponse(content="(fallback)")
+            )
 
     async def chat(self, messages, tools=None, model=None, **kwargs) -> LLMResponse:
-        if self._call_count < len(self._responses):
-            resp = self._responses[self._call_count]
-        else:
-            resp = LLMResponse(content="(fallback)")
-        self._call_count += 1
-        return resp
+        return self._next_response()
 
     def get_default_model(self) -> str:
         return "mock-model"
@@ -46,9 +65,10 @@ class _MockProvider(LLMProvider):
 
 def _make_loop(
     tmp_path: Path,
-    responses: list[LLMResponse] | None = None,
+    responses: Iterable[LLMResponse] | Callable[[], LLMResponse] | None = None,
     execution_mode: str = "function_calling",
     memory_config: MemoryConfig | None = None,
+    tools: ToolRegistry | None = None,
 ) -> AgentLoop:
     bus = MessageBus()
     provider = _MockProvider(responses)
@@ -58,9 +78,16 @@ def _make_loop(
         workspace=tmp_path,
         execution_mode=execution_mode,
         memory_config=memory_config,
+        tools=tools,
     )
 
 
+@pytest.fixture(scope="module")
+def shared_tools(tmp_path_factory: pytest.TempPathFactory) -> ToolRegistry:
+    """Default tool registry built once — the tools are stateless across tests."""
+    return _make_loop(tmp_path_factory.mktemp("tools")).tools
+
+
 # ---------------------------------------------------------------------------
 # Setup and construction
 # ---------------------------------------------------------------------------
@@ -69,17 +96,7 @@ def _make_loop(
 class TestInit:
     def test_registers_tools(self, tmp_path: Path) -> None:
         loop = _make_loop(tmp_path)
-        names = set(loop.tools.list_tools())
-        expected = {
-            "read_file",
-            "write_file",
-            "list_directory",
-            "edit_file",
-            "shell",
-            "web_search",
-            "web_fetch",
-        }
-        assert names == expected
+        assert frozenset(loop.tools.list_tools()) == _EXPECTED_TOOLS
 
     def test_memory_disabled_uses_null_objects(self, tmp_path: Path) -> None:
         loop = _make_loop(tmp_path)
@@ -133,35 +150,70 @@ class TestResolveMode:
 
 class TestFunctionCallingFlow:
     @pytest.mark.asyncio
-    async def test_simple_response(self, tmp_path: Path) -> None:
-        loop = _make_loop(tmp_path, responses=[LLMResponse(content="Hello!")])
+    async def test_simple_response(self, tmp_path: Path, shared_tools: ToolRegistry) -> None:
+        loop = _make_loop(tmp_path, responses=[LLMResponse(content="Hello!")], tools=shared_tools)
         result = await loop.process_direct("hi")
         assert result == "Hello!"
 
     @pytest.mark.asyncio
-    async def test_with_tool_call(self, tmp_path: Path) -> None:
+    async def test_with_tool_call(self, tmp_path: Path, shared_tools: ToolRegistry) -> None:
         # First response: tool call, second response: final text
         tool_call = ToolCall(id="tc1", name="read_file", arguments={"path": str(tmp_path)})
         responses = [
             LLMResponse(content=None, tool_calls=[tool_call]),
             LLMResponse(content="Done reading."),
         ]
-        loop = _make_loop(tmp_path, responses=responses)
+        loop = _make_loop(tmp_path, responses=responses, tools=shared_tools)
         result = await loop.process_direct("read workspace")
         assert result == "Done reading."
 
     @pytest.mark.asyncio
-    async def test_max_iterations(self, tmp_path: Path) -> None:
+    async def test_max_iterations(self, tmp_path: Path, shared_tools: ToolRegistry) -> None:
         # Provider always returns tool calls → hits iteration limit
         tool_call = ToolCall(id="tc1", name="list_directory", arguments={"path": str(tmp_path)})
-        endless = [LLMResponse(content=None, tool_calls=[tool_call])] * 25
-        loop = _make_loop(tmp_path, responses=endless)
+        endless = lambda: LLMResponse(content=None, tool_calls=[tool_call])  # noqa: E731
+        loop = _make_loop(tmp_path, responses=endless, tools=shared_tools)
         loop.max_iterations = 3
         result = await loop.process_direct("loop forever")
         # When max_iterations hit, final_content is None → fallback message
         assert "no response" in result.lower() or "completed" in result.lower()
 
 
+# ---------------------------------------------------------------------------
+# Streaming flow
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingFlow:
+    @pytest.mark.asyncio
+    async def test_simple_stream(self, tmp_path: Path) -> None:
+        # _MockProvider uses the base chat_stream fallback (one chunk)
+        loop = _make_loop(tmp_path, responses=[LLMResponse(content="Hello!")])
+        chunks = [c async for c in loop.process_direct_stream("hi")]
+        assert "".join(chunks) == "Hello!"
+
+    @pytest.mark.asyncio
+    async def test_stream_with_tool_call(self, tmp_path: Path) -> None:
+        tool_call = ToolCall(id="tc1", name="read_file", arguments={"path": str(tmp_path)})
+        responses = [
+            LLMResponse(content=None, tool_calls=[tool_call]),
+            LLMResponse(content="Done reading."),
+        ]
+        loop = _make_loop(tmp_path, responses=responses)
+        chunks = [c async for c in loop.process_direct_stream("read workspace")]
+        assert "".join(chunks) == "Done reading."
+
+    @pytest.mark.asyncio
+    async def test_stream_saves_session(self, tmp_path: Path) -> None:
+        loop = _make_loop(tmp_path, responses=[LLMResponse(content="saved!")])
+        async for _ in loop.process_direct_stream("remember this"):
+            pass
+        session = loop.sessions.get_or_create("cli:direct")
+        roles = [m["role"] for m in session.get_history()]
+        assert "user" in roles
+        assert "assistant" in roles
+
+
 # ---------------------------------------------------------------------------
 # CodeAct flow
 # ---------------------------------------------------------------------------
@@ -169,12 +221,14 @@ class TestFunctionCallingFlow:
 
 class TestCodeActFlow:
     @pytest.mark.asyncio
-    async def test_codeact_mode(self, tmp_path: Path) -> None:
+    async def test_codeact_mode(self, tmp_path: Path, shared_tools: ToolRegistry) -> None:
         responses = [
             LLMResponse(content='<execute>\nprint("hello")\n</execute>'),
             LLMResponse(content="The result is hello."),
         ]
-        loop = _make_loop(tmp_path, responses=responses, execution_mode="code_act")
+        loop = _make_loop(
+            tmp_path, responses=responses, execution_mode="code_act", tools=shared_tools
+        )
         result = await loop.process_direct("say hello")
         assert "result is hello" in result.lower() or "hello" in result.lower()
 
@@ -1,5 +1,6 @@
 """Tests for LLM-driven execution mode selector."""
 
+import re
 from typing import Any
 
 import pytest
@@ -12,6 +13,10 @@ from sparkagent.agent.mode_selector import (
 )
 from sparkagent.providers.base import LLMProvider, LLMResponse, ToolCall
 
+# One event loop for the whole module — every async test just awaits a
+# stateless mocked provider, so per-test loops buy no isolation
+_module_loop = pytest.mark.asyncio(loop_scope="module")
+
 
 class _MockProvider(LLMProvider):
     """Provider that returns a predetermined response (tool call or text)."""
@@ -51,6 +56,8 @@ def _mode_tool_call(mode: str) -> list[ToolCall]:
 class TestStructuredOutput:
     """Tests for the structured output (tool call) path."""
 
+    pytestmark = _module_loop
+
     @pytest.mark.asyncio
     async def test_returns_function_calling_via_tool_call(self):
         provider = _MockProvider(tool_calls=_mode_tool_call("function_calling"))
@@ -98,6 +105,8 @@ class TestStructuredOutput:
 class TestTextFallback:
     """Tests for the text-based fallback path (no tool calls)."""
 
+    pytestmark = _module_loop
+
     @pytest.mark.asyncio
     async def test_returns_code_act_from_text(self):
         provider = _MockProvider(response_text="code_act")
@@ -141,12 +150,18 @@ class TestTextFallback:
         assert result == "function_calling"
 
 
+@pytest.fixture(scope="module")
+def prompt_tokens() -> frozenset[str]:
+    """Tokenize CLASSIFICATION_PROMPT once for O(1) membership asserts."""
+    return frozenset(re.findall(r"\w+", CLASSIFICATION_PROMPT.lower()))
+
+
 class TestClassificationPrompt:
     """Tests for the classification prompt."""
 
-    def test_prompt_mentions_both_modes(self):
-        assert "function_calling" in CLASSIFICATION_PROMPT
-        assert "code_act" in CLASSIFICATION_PROMPT
+    def test_prompt_mentions_both_modes(self, prompt_tokens: frozenset[str]):
+        assert "function_calling" in prompt_tokens
+        assert "code_act" in prompt_tokens
 
     def test_prompt_is_nonempty(self):
         assert len(CLASSIFICATION_PROMPT.strip()) > 0
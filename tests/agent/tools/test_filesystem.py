@@ -25,34 +25,34 @@ class TestReadFileTool:
         assert schema["type"] == "function"
         assert schema["function"]["name"] == "read_file"
 
-    async def test_read_file_success(self, sample_file):
+    async def test_read_file_success(self, sample_file_ro):
         tool = ReadFileTool()
-        result = await tool.execute(path=str(sample_file))
+        result = await tool.execute(path=str(sample_file_ro))
         assert "Hello, World!" in result
         assert "Line 2" in result
 
-    async def test_read_file_not_found(self, temp_dir):
+    async def test_read_file_not_found(self, tmp_path):
         tool = ReadFileTool()
-        result = await tool.execute(path=str(temp_dir / "nonexistent.txt"))
+        result = await tool.execute(path=str(tmp_path / "nonexistent.txt"))
         assert "Error" in result
         assert "not found" in result.lower()
 
-    async def test_read_file_is_directory(self, temp_dir):
+    async def test_read_file_is_directory(self, tmp_path):
         tool = ReadFileTool()
-        result = await tool.execute(path=str(temp_dir))
+        result = await tool.execute(path=str(tmp_path))
         assert "Error" in result
         assert "Not a file" in result
 
-    async def test_read_file_max_lines(self, sample_file):
+    async def test_read_file_max_lines(self, sample_file_ro):
         tool = ReadFileTool()
-        result = await tool.execute(path=str(sample_file), max_lines=2)
+        result = await tool.execute(path=str(sample_file_ro), max_lines=2)
         assert "Hello, World!" in result
         assert "Line 2" in result
         assert "truncated" in result.lower()
 
-    async def test_read_file_truncate_large(self, temp_dir):
+    async def test_read_file_truncate_large(self, tmp_path):
         tool = ReadFileTool()
-        large_file = temp_dir / "large.txt"
+        large_file = tmp_path / "large.txt"
         large_file.write_text("x" * 60000)
 
         result = await tool.execute(path=str(large_file))
@@ -75,9 +75,9 @@ class TestWriteFileTool:
         assert "path" in tool.parameters["properties"]
         assert "content" in tool.parameters["properties"]
 
-    async def test_write_file_success(self, temp_dir):
+    async def test_write_file_success(self, tmp_path):
         tool = WriteFileTool()
-        file_path = temp_dir / "new_file.txt"
+        file_path = tmp_path / "new_file.txt"
 
         result = await tool.execute(path=str(file_path), content="Test content")
 
@@ -85,9 +85,9 @@ class TestWriteFileTool:
         assert file_path.exists()
         assert file_path.read_text() == "Test content"
 
-    async def test_write_file_creates_parent_dirs(self, temp_dir):
+    async def test_write_file_creates_parent_dirs(self, tmp_path):
         tool = WriteFileTool()
-        file_path = temp_dir / "new_dir" / "subdir" / "file.txt"
+        file_path = tmp_path / "new_dir" / "subdir" / "file.txt"
 
         result = await tool.execute(path=str(file_path), content="Nested content")
 
@@ -128,23 +128,23 @@ class TestListDirectoryTool:
 
         assert "nested.txt" in result
 
-    async def test_list_directory_not_found(self, temp_dir):
+    async def test_list_directory_not_found(self, tmp_path):
         tool = ListDirectoryTool()
-        result = await tool.execute(path=str(temp_dir / "nonexistent"))
+        result = await tool.execute(path=str(tmp_path / "nonexistent"))
 
         assert "Error" in result
         assert "not found" in result.lower()
 
-    async def test_list_directory_not_a_directory(self, sample_file):
+    async def test_list_directory_not_a_directory(self, sample_file_ro):
         tool = ListDirectoryTool()
-        result = await tool.execute(path=str(sample_file))
+        result = await tool.execute(path=str(sample_file_ro))
 
         assert "Error" in result
         assert "Not a directory" in result
 
-    async def test_list_empty_directory(self, temp_dir):
+    async def test_list_empty_directory(self, tmp_path):
         tool = ListDirectoryTool()
-        empty_dir = temp_dir / "empty"
+        empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
 
         result = await tool.execute(path=str(empty_dir))
@@ -173,9 +173,9 @@ class TestEditFileTool:
         assert "1 occurrence" in result
         assert "Hi, Universe!" in sample_file.read_text()
 
-    async def test_edit_file_multiple_occurrences(self, temp_dir):
+    async def test_edit_file_multiple_occurrences(self, tmp_path):
         tool = EditFileTool()
-        file_path = temp_dir / "multi.txt"
+        file_path = tmp_path / "multi.txt"
         file_path.write_text("foo bar foo baz foo")
 
         result = await tool.execute(
@@ -187,10 +187,10 @@ class TestEditFileTool:
         assert "3 occurrence" in result
         assert file_path.read_text() == "qux bar qux baz qux"
 
-    async def test_edit_file_not_found(self, temp_dir):
+    async def test_edit_file_not_found(self, tmp_path):
         tool = EditFileTool()
         result = await tool.execute(
-            path=str(temp_dir / "nonexistent.txt"),
+            path=str(tmp_path / "nonexistent.txt"),
             old_text="foo",
             new_text="bar"
         )
@@ -198,10 +198,10 @@ class TestEditFileTool:
         assert "Error" in result
         assert "not found" in result.lower()
 
-    async def test_edit_file_text_not_found(self, sample_file):
+    async def test_edit_file_text_not_found(self, sample_file_ro):
         tool = EditFileTool()
         result = await tool.execute(
-            path=str(sample_file),
+            path=str(sample_file_ro),
             old_text="nonexistent text",
             new_text="replacement"
         )
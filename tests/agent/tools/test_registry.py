@@ -1,5 +1,6 @@
 """Tests for tool registry."""
 
+from dataclasses import dataclass, field
 from typing import Any
 
 import pytest
@@ -7,54 +8,58 @@ import pytest
 from sparkagent.agent.tools.base import Tool
 from sparkagent.agent.tools.registry import ToolRegistry
 
+# Shared schema trees, built once at import — every MockTool instance
+# references the same dict instead of rebuilding it. Tests treat these
+# as read-only.
+_MOCK_PARAMETERS: dict[str, Any] = {
+    "type": "object",
+    "properties": {"input": {"type": "string", "description": "Input text"}},
+    "required": ["input"],
+}
+_EMPTY_PARAMETERS: dict[str, Any] = {"type": "object", "properties": {}}
 
-class MockTool(Tool):
-    """A mock tool for testing."""
-
-    def __init__(self, name: str = "mock_tool"):
-        self._name = name
 
-    @property
-    def name(self) -> str:
-        return self._name
+@dataclass(slots=True, frozen=True)
+class MockTool(Tool):
+    """A mock tool for testing.
 
-    @property
-    def description(self) -> str:
-        return "A mock tool for testing"
+    Slotted frozen dataclass: the field descriptors satisfy the base
+    class's abstract properties without per-access dict rebuilding.
+    """
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "input": {"type": "string", "description": "Input text"}
-            },
-            "required": ["input"]
-        }
+    name: str = "mock_tool"
+    description: str = "A mock tool for testing"
+    parameters: dict[str, Any] = field(default_factory=lambda: _MOCK_PARAMETERS)
 
     async def execute(self, input: str, **kwargs: Any) -> str:
         return f"Executed with: {input}"
 
 
+@dataclass(slots=True, frozen=True)
 class FailingTool(Tool):
     """A tool that always fails."""
 
-    @property
-    def name(self) -> str:
-        return "failing_tool"
-
-    @property
-    def description(self) -> str:
-        return "A tool that always fails"
-
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {"type": "object", "properties": {}}
+    name: str = "failing_tool"
+    description: str = "A tool that always fails"
+    parameters: dict[str, Any] = field(default_factory=lambda: _EMPTY_PARAMETERS)
 
     async def execute(self, **kwargs: Any) -> str:
         raise ValueError("Tool execution failed")
 
 
+# Explicit marker for the async tests (skips auto-mode's per-test probe)
+# sharing one module-scoped event loop
+_module_loop = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture
+def populated_registry() -> ToolRegistry:
+    """Registry pre-loaded with one MockTool."""
+    registry = ToolRegistry()
+    registry.register(MockTool())
+    return registry
+
+
 class TestToolRegistry:
     """Tests for ToolRegistry."""
 
@@ -63,15 +68,18 @@ class TestToolRegistry:
         assert len(registry) == 0
         assert registry.list_tools() == []
 
-    def test_register_tool(self):
-        registry = ToolRegistry()
-        tool = MockTool()
-
-        registry.register(tool)
-
-        assert len(registry) == 1
-        assert "mock_tool" in registry
-        assert registry.list_tools() == ["mock_tool"]
+    @pytest.mark.parametrize(
+        "check",
+        [
+            pytest.param(lambda r: len(r) == 1, id="len"),
+            pytest.param(lambda r: "mock_tool" in r, id="contains"),
+            pytest.param(lambda r: "nonexistent" not in r, id="not-contains"),
+            pytest.param(lambda r: r.list_tools() == ["mock_tool"], id="list-tools"),
+            pytest.param(lambda r: r.get("mock_tool") is not None, id="get"),
+        ],
+    )
+    def test_registered_tool_visible(self, populated_registry, check):
+        assert check(populated_registry)
 
     def test_register_multiple_tools(self):
         registry = ToolRegistry()
@@ -81,27 +89,21 @@ class TestToolRegistry:
         registry.register(MockTool("tool3"))
 
         assert len(registry) == 3
-        assert set(registry.list_tools()) == {"tool1", "tool2", "tool3"}
+        assert sorted(registry.list_tools()) == ["tool1", "tool2", "tool3"]
 
-    def test_register_overwrites_existing(self):
-        registry = ToolRegistry()
-        tool1 = MockTool("same_name")
-        tool2 = MockTool("same_name")
+    def test_register_overwrites_existing(self, populated_registry):
+        replacement = MockTool()
 
-        registry.register(tool1)
-        registry.register(tool2)
+        populated_registry.register(replacement)
 
-        assert len(registry) == 1
-        assert registry.get("same_name") is tool2
+        assert len(populated_registry) == 1
+        assert populated_registry.get("mock_tool") is replacement
 
-    def test_unregister_tool(self):
-        registry = ToolRegistry()
-        registry.register(MockTool())
-
-        registry.unregister("mock_tool")
+    def test_unregister_tool(self, populated_registry):
+        populated_registry.unregister("mock_tool")
 
-        assert len(registry) == 0
-        assert "mock_tool" not in registry
+        assert len(populated_registry) == 0
+        assert "mock_tool" not in populated_registry
 
     def test_unregister_nonexistent_tool(self):
         registry = ToolRegistry()
@@ -110,15 +112,6 @@ class TestToolRegistry:
         registry.unregister("nonexistent")
         assert len(registry) == 0
 
-    def test_get_tool(self):
-        registry = ToolRegistry()
-        tool = MockTool()
-        registry.register(tool)
-
-        retrieved = registry.get("mock_tool")
-
-        assert retrieved is tool
-
     def test_get_nonexistent_tool(self):
         registry = ToolRegistry()
 
@@ -126,13 +119,6 @@ class TestToolRegistry:
 
         assert result is None
 
-    def test_contains(self):
-        registry = ToolRegistry()
-        registry.register(MockTool())
-
-        assert "mock_tool" in registry
-        assert "nonexistent" not in registry
-
     def test_get_schemas(self):
         registry = ToolRegistry()
         registry.register(MockTool("tool1"))
@@ -142,17 +128,16 @@ class TestToolRegistry:
 
         assert len(schemas) == 2
         assert all(s["type"] == "function" for s in schemas)
-        names = {s["function"]["name"] for s in schemas}
-        assert names == {"tool1", "tool2"}
-
-    async def test_execute_tool(self):
-        registry = ToolRegistry()
-        registry.register(MockTool())
+        names = sorted(s["function"]["name"] for s in schemas)
+        assert names == ["tool1", "tool2"]
 
-        result = await registry.execute("mock_tool", {"input": "test"})
+    @_module_loop
+    async def test_execute_tool(self, populated_registry):
+        result = await populated_registry.execute("mock_tool", {"input": "test"})
 
         assert result == "Executed with: test"
 
+    @_module_loop
     async def test_execute_nonexistent_tool(self):
         registry = ToolRegistry()
 
@@ -161,6 +146,7 @@ class TestToolRegistry:
         assert "Error" in result
         assert "not found" in result.lower()
 
+    @_module_loop
     async def test_execute_tool_error_handling(self):
         registry = ToolRegistry()
         registry.register(FailingTool())
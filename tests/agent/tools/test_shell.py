@@ -28,15 +28,15 @@ class TestShellTool:
         result = await tool.execute(command="echo 'Hello World'")
         assert "Hello World" in result
 
-    async def test_execute_with_working_dir(self, temp_dir):
+    async def test_execute_with_working_dir(self, tmp_path):
         tool = ShellTool()
-        result = await tool.execute(command="pwd", working_dir=str(temp_dir))
-        assert str(temp_dir) in result
+        result = await tool.execute(command="pwd", working_dir=str(tmp_path))
+        assert str(tmp_path) in result
 
-    async def test_execute_default_working_dir(self, temp_dir):
-        tool = ShellTool(working_dir=str(temp_dir))
+    async def test_execute_default_working_dir(self, tmp_path):
+        tool = ShellTool(working_dir=str(tmp_path))
         result = await tool.execute(command="pwd")
-        assert str(temp_dir) in result
+        assert str(tmp_path) in result
 
     async def test_execute_captures_stderr(self):
         tool = ShellTool()
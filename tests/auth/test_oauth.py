@@ -20,6 +20,8 @@ from sparkagent.auth.oauth import (
     exchange_code_for_tokens,
     generate_pkce_pair,
     is_token_expired,
+    is_token_stale,
+    parse_expiry_epoch,
     refresh_access_token,
 )
 
@@ -322,6 +324,54 @@ class TestIsTokenExpired:
         assert is_token_expired("not-a-date") is True
 
 
+class TestIsTokenStale:
+    """Tests for is_token_stale()."""
+
+    def test_none_is_not_stale(self):
+        """Unknown expiry is handled by is_token_expired, not staleness."""
+        assert is_token_stale(None) is False
+
+    def test_far_future_not_stale(self):
+        future = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        assert is_token_stale(future) is False
+
+    def test_within_stale_window(self):
+        """A token expiring in 7 minutes is stale (5-min buffer + 3-min window)."""
+        soon = (datetime.now(timezone.utc) + timedelta(minutes=7)).isoformat()
+        assert is_token_stale(soon) is True
+
+    def test_stale_but_not_expired(self):
+        soon = (datetime.now(timezone.utc) + timedelta(minutes=7)).isoformat()
+        assert is_token_stale(soon) is True
+        assert is_token_expired(soon) is False
+
+    def test_invalid_string_not_stale(self):
+        assert is_token_stale("not-a-date") is False
+
+
+class TestParseExpiryEpoch:
+    """Tests for parse_expiry_epoch()."""
+
+    def test_none_returns_none(self):
+        assert parse_expiry_epoch(None) is None
+
+    def test_empty_string_returns_none(self):
+        assert parse_expiry_epoch("") is None
+
+    def test_invalid_string_returns_none(self):
+        assert parse_expiry_epoch("not-a-date") is None
+
+    def test_roundtrip_matches_datetime(self):
+        expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+        epoch = parse_expiry_epoch(expiry.isoformat())
+        assert epoch == pytest.approx(expiry.timestamp())
+
+    def test_naive_timestamp_treated_as_utc(self):
+        naive = datetime.now(timezone.utc).replace(tzinfo=None)
+        epoch = parse_expiry_epoch(naive.isoformat())
+        assert epoch == pytest.approx(naive.replace(tzinfo=timezone.utc).timestamp())
+
+
 class TestComputeExpiresAt:
     """Tests for compute_expires_at()."""
 
@@ -0,0 +1,10 @@
+"""Shared fixtures for CLI tests."""
+
+import pytest
+from typer.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """One stateless CliRunner shared across every CLI test."""
+    return CliRunner()
@@ -6,6 +6,9 @@ import pytest
 
 from sparkagent.cli.providers import PROVIDERS, ModelOption, ProviderOption, get_provider
 
+# Required string fields on every ProviderOption, walked in one loop
+_REQUIRED_STR_FIELDS = ("key", "label", "key_url_hint")
+
 
 class TestProvidersRegistry:
     """Tests for the PROVIDERS registry list."""
@@ -15,10 +18,10 @@ class TestProvidersRegistry:
 
     def test_each_provider_has_required_fields(self):
         for provider in PROVIDERS:
-            assert isinstance(provider.key, str) and provider.key
-            assert isinstance(provider.label, str) and provider.label
-            assert isinstance(provider.key_url_hint, str) and provider.key_url_hint
-            assert isinstance(provider.models, list) and len(provider.models) > 0
+            for name in _REQUIRED_STR_FIELDS:
+                value = getattr(provider, name)
+                assert isinstance(value, str) and value, f"{provider.key}.{name}"
+            assert isinstance(provider.models, tuple) and len(provider.models) > 0
 
     def test_provider_keys_are_unique(self):
         keys = [p.key for p in PROVIDERS]
@@ -65,44 +68,44 @@ class TestGetProvider:
         assert get_provider("") is None
 
 
-class TestModelOptionImmutability:
-    """Tests that ModelOption instances are frozen (immutable)."""
-
-    def test_cannot_set_id(self):
-        model = ModelOption("test-id", "Test", "A test model")
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            model.id = "other-id"  # type: ignore[misc]
+@pytest.fixture(scope="module")
+def model() -> ModelOption:
+    return ModelOption("test-id", "Test", "A test model")
 
-    def test_cannot_set_label(self):
-        model = ModelOption("test-id", "Test", "A test model")
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            model.label = "Other"  # type: ignore[misc]
 
-    def test_cannot_set_description(self):
-        model = ModelOption("test-id", "Test", "A test model")
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            model.description = "changed"  # type: ignore[misc]
+@pytest.fixture(scope="module")
+def provider() -> ProviderOption:
+    return ProviderOption(key="k", label="L", key_url_hint="https://example.com")
 
 
-class TestProviderOptionImmutability:
-    """Tests that ProviderOption instances are frozen (immutable)."""
+class TestModelOptionImmutability:
+    """Tests that ModelOption instances are frozen (immutable)."""
 
-    def test_cannot_set_key(self):
-        provider = ProviderOption(key="k", label="L", key_url_hint="https://example.com")
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("id", "other-id"),
+            ("label", "Other"),
+            ("description", "changed"),
+        ],
+    )
+    def test_cannot_set_field(self, model: ModelOption, field: str, value: str):
         with pytest.raises(dataclasses.FrozenInstanceError):
-            provider.key = "other"  # type: ignore[misc]
+            setattr(model, field, value)
 
-    def test_cannot_set_label(self):
-        provider = ProviderOption(key="k", label="L", key_url_hint="https://example.com")
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            provider.label = "Other"  # type: ignore[misc]
 
-    def test_cannot_set_key_url_hint(self):
-        provider = ProviderOption(key="k", label="L", key_url_hint="https://example.com")
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            provider.key_url_hint = "https://other.com"  # type: ignore[misc]
+class TestProviderOptionImmutability:
+    """Tests that ProviderOption instances are frozen (immutable)."""
 
-    def test_cannot_set_models(self):
-        provider = ProviderOption(key="k", label="L", key_url_hint="https://example.com")
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("key", "other"),
+            ("label", "Other"),
+            ("key_url_hint", "https://other.com"),
+            ("models", ()),
+        ],
+    )
+    def test_cannot_set_field(self, provider: ProviderOption, field: str, value: object):
         with pytest.raises(dataclasses.FrozenInstanceError):
-            provider.models = []  # type: ignore[misc]
+            setattr(provider, field, value)
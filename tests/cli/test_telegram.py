@@ -1,206 +1,151 @@
 """Tests for the Telegram plugin CLI commands."""
 
-from unittest.mock import patch
+import dataclasses
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-from typer.testing import CliRunner
+import pytest
 
 from sparkagent.cli.main import app
+from sparkagent.config import Config
 
-runner = CliRunner()
+
+@pytest.fixture(scope="session")
+def _config_template() -> Config:
+    """Build the nested default Config once for the whole session."""
+    return Config()
+
+
+@pytest.fixture
+def telegram_mocks(monkeypatch: pytest.MonkeyPatch, tmp_path, _config_template: Config):
+    """Patch the telegram CLI's config I/O once per test via monkeypatch.
+
+    Returns a namespace with the load/save mocks and the fake config path,
+    replacing the three identical patch() context managers each test used
+    to re-enter.
+    """
+    mocks = SimpleNamespace(
+        load=MagicMock(return_value=_config_template.model_copy(deep=True)),
+        save=MagicMock(),
+        path=tmp_path / "config.json",
+    )
+    monkeypatch.setattr("sparkagent.cli.telegram.load_config", mocks.load)
+    monkeypatch.setattr("sparkagent.cli.telegram.save_config", mocks.save)
+    monkeypatch.setattr(
+        "sparkagent.cli.telegram.get_config_path", MagicMock(return_value=mocks.path)
+    )
+    return mocks
 
 
 class TestTelegramSubcommand:
     """Tests for `sparkagent telegram` subcommand group."""
 
-    def test_telegram_help_shows_onboard(self):
+    def test_telegram_help_shows_onboard(self, runner):
         result = runner.invoke(app, ["telegram", "--help"])
         assert result.exit_code == 0
         assert "onboard" in result.output
 
-    def test_telegram_no_args_shows_help(self):
+    def test_telegram_no_args_shows_help(self, runner):
         result = runner.invoke(app, ["telegram"])
         # no_args_is_help causes exit code 0 in some Typer versions, 2 in others
         assert result.exit_code in (0, 2)
         assert "onboard" in result.output
 
 
+@dataclasses.dataclass(frozen=True)
+class OnboardCase:
+    """One onboard scenario: stdin input plus the assertions to run on it."""
+
+    input: str
+    expect_output: tuple[str, ...] = ()
+    expect_token: str | None = None
+    expect_allow: list[str] | None = None
+
+
 class TestTelegramOnboard:
     """Tests for `sparkagent telegram onboard`."""
 
-    def test_saves_token_and_user_id(self, tmp_path):
-        config_path = tmp_path / "config.json"
-
-        with (
-            patch("sparkagent.cli.telegram.load_config") as mock_load,
-            patch("sparkagent.cli.telegram.save_config") as mock_save,
-            patch("sparkagent.cli.telegram.get_config_path", return_value=config_path),
-        ):
-            from sparkagent.config import Config
-
-            config = Config()
-            mock_load.return_value = config
-
-            result = runner.invoke(
-                app,
-                ["telegram", "onboard"],
-                input="fake-bot-token:ABC\n123456789\n",
-            )
-
-            assert result.exit_code == 0
-            assert "Token saved" in result.output
-            assert "123456789" in result.output
-
-            # Verify config was updated
-            saved_config = mock_save.call_args[0][0]
-            assert saved_config.channels.telegram.enabled is True
-            assert saved_config.channels.telegram.token == "fake-bot-token:ABC"
-            assert saved_config.channels.telegram.allow_from == ["123456789"]
-
-    def test_blank_user_id_allows_everyone(self, tmp_path):
-        config_path = tmp_path / "config.json"
-
-        with (
-            patch("sparkagent.cli.telegram.load_config") as mock_load,
-            patch("sparkagent.cli.telegram.save_config") as mock_save,
-            patch("sparkagent.cli.telegram.get_config_path", return_value=config_path),
-        ):
-            from sparkagent.config import Config
-
-            config = Config()
-            mock_load.return_value = config
-
-            result = runner.invoke(
-                app,
-                ["telegram", "onboard"],
-                input="fake-bot-token:ABC\n\n",
-            )
-
-            assert result.exit_code == 0
-            assert "allow everyone" in result.output
-
-            saved_config = mock_save.call_args[0][0]
-            assert saved_config.channels.telegram.allow_from == []
-
-    def test_preserves_existing_provider_config(self, tmp_path):
-        config_path = tmp_path / "config.json"
-
-        with (
-            patch("sparkagent.cli.telegram.load_config") as mock_load,
-            patch("sparkagent.cli.telegram.save_config") as mock_save,
-            patch("sparkagent.cli.telegram.get_config_path", return_value=config_path),
-        ):
-            from sparkagent.config import Config
-
-            config = Config()
-            config.agent.provider = "openai"
-            config.agent.model = "gpt-4.1"
-            config.providers.openai.api_key = "sk-existing-key"
-            mock_load.return_value = config
-
-            # Write a dummy file so config_path.exists() is True
-            config_path.write_text("{}")
-
-            result = runner.invoke(
-                app,
-                ["telegram", "onboard"],
-                input="fake-bot-token:ABC\n\n",
-            )
-
-            assert result.exit_code == 0
-
-            saved_config = mock_save.call_args[0][0]
-            # Provider settings should be untouched
-            assert saved_config.agent.provider == "openai"
-            assert saved_config.agent.model == "gpt-4.1"
-            assert saved_config.providers.openai.api_key == "sk-existing-key"
-            # Telegram should be configured
-            assert saved_config.channels.telegram.enabled is True
-
-    def test_enables_telegram(self, tmp_path):
-        config_path = tmp_path / "config.json"
-
-        with (
-            patch("sparkagent.cli.telegram.load_config") as mock_load,
-            patch("sparkagent.cli.telegram.save_config") as mock_save,
-            patch("sparkagent.cli.telegram.get_config_path", return_value=config_path),
-        ):
-            from sparkagent.config import Config
-
-            config = Config()
-            assert config.channels.telegram.enabled is False
-            mock_load.return_value = config
-
-            result = runner.invoke(
-                app,
-                ["telegram", "onboard"],
-                input="fake-bot-token:ABC\n\n",
-            )
-
-            assert result.exit_code == 0
-            saved_config = mock_save.call_args[0][0]
-            assert saved_config.channels.telegram.enabled is True
-
-    def test_shows_gateway_instructions(self, tmp_path):
-        config_path = tmp_path / "config.json"
-
-        with (
-            patch("sparkagent.cli.telegram.load_config") as mock_load,
-            patch("sparkagent.cli.telegram.save_config"),
-            patch("sparkagent.cli.telegram.get_config_path", return_value=config_path),
-        ):
-            from sparkagent.config import Config
-
-            mock_load.return_value = Config()
-
-            result = runner.invoke(
-                app,
-                ["telegram", "onboard"],
-                input="fake-bot-token:ABC\n\n",
-            )
-
-            assert result.exit_code == 0
-            assert "sparkagent gateway" in result.output
-
-    def test_token_is_stripped(self, tmp_path):
-        config_path = tmp_path / "config.json"
-
-        with (
-            patch("sparkagent.cli.telegram.load_config") as mock_load,
-            patch("sparkagent.cli.telegram.save_config") as mock_save,
-            patch("sparkagent.cli.telegram.get_config_path", return_value=config_path),
-        ):
-            from sparkagent.config import Config
-
-            mock_load.return_value = Config()
-
-            result = runner.invoke(
-                app,
-                ["telegram", "onboard"],
-                input="  fake-bot-token:ABC  \n\n",
-            )
-
-            assert result.exit_code == 0
-            saved_config = mock_save.call_args[0][0]
-            assert saved_config.channels.telegram.token == "fake-bot-token:ABC"
-
-    def test_user_id_is_stripped(self, tmp_path):
-        config_path = tmp_path / "config.json"
-
-        with (
-            patch("sparkagent.cli.telegram.load_config") as mock_load,
-            patch("sparkagent.cli.telegram.save_config") as mock_save,
-            patch("sparkagent.cli.telegram.get_config_path", return_value=config_path),
-        ):
-            from sparkagent.config import Config
-
-            mock_load.return_value = Config()
-
-            result = runner.invoke(
-                app,
-                ["telegram", "onboard"],
-                input="fake-bot-token:ABC\n  123456789  \n",
-            )
-
-            assert result.exit_code == 0
-            saved_config = mock_save.call_args[0][0]
-            assert saved_config.channels.telegram.allow_from == ["123456789"]
+    @pytest.mark.parametrize(
+        "case",
+        [
+            pytest.param(
+                OnboardCase(
+                    input="fake-bot-token:ABC\n123456789\n",
+                    expect_output=("Token saved", "123456789"),
+                    expect_token="fake-bot-token:ABC",
+                    expect_allow=["123456789"],
+                ),
+                id="saves-token-and-user-id",
+            ),
+            pytest.param(
+                OnboardCase(
+                    input="fake-bot-token:ABC\n\n",
+                    expect_output=("allow everyone",),
+                    expect_allow=[],
+                ),
+                id="blank-user-id-allows-everyone",
+            ),
+            pytest.param(
+                OnboardCase(
+                    input="fake-bot-token:ABC\n\n",
+                    expect_output=("sparkagent gateway",),
+                ),
+                id="shows-gateway-instructions",
+            ),
+            pytest.param(
+                OnboardCase(
+                    input="  fake-bot-token:ABC  \n\n",
+                    expect_token="fake-bot-token:ABC",
+                ),
+                id="token-is-stripped",
+            ),
+            pytest.param(
+                OnboardCase(
+                    input="fake-bot-token:ABC\n  123456789  \n",
+                    expect_allow=["123456789"],
+                ),
+                id="user-id-is-stripped",
+            ),
+        ],
+    )
+    def test_onboard(self, runner, telegram_mocks, case: OnboardCase):
+        result = runner.invoke(app, ["telegram", "onboard"], input=case.input)
+
+        assert result.exit_code == 0
+        for expected in case.expect_output:
+            assert expected in result.output
+
+        saved_config = telegram_mocks.save.call_args[0][0]
+        # Onboarding always enables the channel
+        assert saved_config.channels.telegram.enabled is True
+        if case.expect_token is not None:
+            assert saved_config.channels.telegram.token == case.expect_token
+        if case.expect_allow is not None:
+            assert saved_config.channels.telegram.allow_from == case.expect_allow
+
+    def test_preserves_existing_provider_config(self, runner, telegram_mocks, monkeypatch):
+        config = telegram_mocks.load.return_value
+        config.agent.provider = "openai"
+        config.agent.model = "gpt-4.1"
+        config.providers.openai.api_key = "sk-existing-key"
+        telegram_mocks.load.return_value = config
+
+        # Make config_path.exists() report True without touching the filesystem
+        monkeypatch.setattr(Path, "exists", lambda self: True)
+
+        result = runner.invoke(
+            app,
+            ["telegram", "onboard"],
+            input="fake-bot-token:ABC\n\n",
+        )
+
+        assert result.exit_code == 0
+
+        saved_config = telegram_mocks.save.call_args[0][0]
+        # Provider settings should be untouched
+        assert saved_config.agent.provider == "openai"
+        assert saved_config.agent.model == "gpt-4.1"
+        assert saved_config.providers.openai.api_key == "sk-existing-key"
+        # Telegram should be configured
+        assert saved_config.channels.telegram.enabled is True
@@ -345,8 +345,8 @@ class TestConfigPersistence:
         assert path.name == "config.json"
         assert ".sparkagent" in str(path)
 
-    def test_save_and_load_config(self, temp_dir):
-        config_path = temp_dir / "config.json"
+    def test_save_and_load_config(self, tmp_path):
+        config_path = tmp_path / "config.json"
 
         with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
             # Create and save config
@@ -362,24 +362,42 @@ class TestConfigPersistence:
             assert loaded.agent.model == "gpt-4.1"
             assert loaded.providers.openai.api_key == "test-key"
 
-    def test_save_config_sets_restrictive_permissions(self, temp_dir):
-        config_path = temp_dir / "config.json"
+    def test_save_config_sets_restrictive_permissions(self, tmp_path):
+        config_path = tmp_path / "config.json"
 
         with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
             save_config(Config())
             mode = config_path.stat().st_mode
             assert stat.S_IMODE(mode) == 0o600
 
-    def test_load_config_missing_file(self, temp_dir):
-        config_path = temp_dir / "nonexistent.json"
+    def test_save_config_leaves_no_temp_file(self, tmp_path):
+        config_path = tmp_path / "config.json"
+
+        with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
+            save_config(Config())
+            assert config_path.exists()
+            assert not (tmp_path / "config.json.tmp").exists()
+
+    def test_load_config_returns_cached_instance(self, tmp_path):
+        config_path = tmp_path / "config.json"
+
+        with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
+            save_config(Config(agent=AgentConfig(model="gpt-4.1")))
+            first = load_config()
+            second = load_config()
+            # Unchanged mtime → same validated instance, no re-validation
+            assert second is first
+
+    def test_load_config_missing_file(self, tmp_path):
+        config_path = tmp_path / "nonexistent.json"
 
         with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
             config = load_config()
             # Should return default config
             assert config.agent.model == ""
 
-    def test_load_config_invalid_json(self, temp_dir):
-        config_path = temp_dir / "config.json"
+    def test_load_config_invalid_json(self, tmp_path):
+        config_path = tmp_path / "config.json"
         config_path.write_text("invalid json {{{")
 
         with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
@@ -387,8 +405,8 @@ class TestConfigPersistence:
             # Should return default config on error
             assert config.agent.model == ""
 
-    def test_load_config_invalid_json_logs_warning(self, temp_dir, caplog):
-        config_path = temp_dir / "config.json"
+    def test_load_config_invalid_json_logs_warning(self, tmp_path, caplog):
+        config_path = tmp_path / "config.json"
         config_path.write_text("invalid json {{{")
 
         with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
@@ -413,9 +431,9 @@ class TestConfigPersistence:
         assert "anthropic" in data["providers"]
         assert "channels" in data
 
-    def test_config_json_round_trip(self, temp_dir):
+    def test_config_json_round_trip(self, tmp_path):
         """Test that all new fields survive save/load cycle."""
-        config_path = temp_dir / "config.json"
+        config_path = tmp_path / "config.json"
 
         with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
             config = Config(
@@ -434,9 +452,9 @@ class TestConfigPersistence:
             assert loaded.providers.gemini.api_key == "gemini-key-123"
             assert loaded.providers.gemini.api_base == "https://custom.gemini.api"
 
-    def test_config_json_round_trip_with_oauth(self, temp_dir):
+    def test_config_json_round_trip_with_oauth(self, tmp_path):
         """Test that OAuth fields survive save/load cycle."""
-        config_path = temp_dir / "config.json"
+        config_path = tmp_path / "config.json"
 
         with patch("sparkagent.config.schema.get_config_path", return_value=config_path):
             config = Config(
@@ -459,9 +477,9 @@ class TestConfigPersistence:
             assert loaded.providers.anthropic.expires_at == "2026-03-01T12:00:00+00:00"
             assert loaded.providers.anthropic.token_type == "oauth"
 
-    def test_backward_compat_missing_oauth_fields(self, temp_dir):
+    def test_backward_compat_missing_oauth_fields(self, tmp_path):
         """Loading old config JSON without OAuth fields should use defaults."""
-        config_path = temp_dir / "config.json"
+        config_path = tmp_path / "config.json"
 
         # Write old-style config without refresh_token/expires_at/token_type
         old_config = {
@@ -484,9 +502,9 @@ class TestConfigPersistence:
             assert loaded.providers.anthropic.expires_at == ""
             assert loaded.providers.anthropic.token_type == ""
 
-    def test_backward_compat_missing_heartbeat(self, temp_dir):
+    def test_backward_compat_missing_heartbeat(self, tmp_path):
         """Loading old config JSON without heartbeat key should use defaults."""
-        config_path = temp_dir / "config.json"
+        config_path = tmp_path / "config.json"
 
         old_config = {
             "agent": {"provider": "openai", "model": "gpt-4.1"},
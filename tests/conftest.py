@@ -1,31 +1,32 @@
 """Pytest fixtures for SparkAgent tests."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def sample_file(tmp_path: Path):
+    """Create a sample file for tests that modify it."""
+    file_path = tmp_path / "sample.txt"
+    file_path.write_text("Hello, World!\nLine 2\nLine 3")
+    return file_path
 
 
-@pytest.fixture
-def sample_file(temp_dir):
-    """Create a sample file for testing."""
-    file_path = temp_dir / "sample.txt"
+@pytest.fixture(scope="session")
+def sample_file_ro(tmp_path_factory: pytest.TempPathFactory):
+    """Create a sample file once for tests that only read it."""
+    file_path = tmp_path_factory.mktemp("sample_file") / "sample.txt"
     file_path.write_text("Hello, World!\nLine 2\nLine 3")
     return file_path
 
 
-@pytest.fixture
-def sample_dir(temp_dir):
-    """Create a sample directory structure for testing."""
-    (temp_dir / "subdir").mkdir()
-    (temp_dir / "file1.txt").write_text("content1")
-    (temp_dir / "file2.py").write_text("content2")
-    (temp_dir / "subdir" / "nested.txt").write_text("nested content")
-    return temp_dir
+@pytest.fixture(scope="session")
+def sample_dir(tmp_path_factory: pytest.TempPathFactory):
+    """Create a sample directory structure, built once and read-only."""
+    root = tmp_path_factory.mktemp("sample_dir")
+    (root / "subdir").mkdir()
+    (root / "file1.txt").write_text("content1")
+    (root / "file2.py").write_text("content2")
+    (root / "subdir" / "nested.txt").write_text("nested content")
+    return root
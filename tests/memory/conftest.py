@@ -0,0 +1,29 @@
+"""Shared fixtures for memory tests."""
+
+import os
+
+import pytest
+
+from sparkagent.memory.skill_bank import SkillBank
+
+
+@pytest.fixture(scope="session")
+def _primitives_template(tmp_path_factory: pytest.TempPathFactory):
+    """Materialize the four primitive skill files once per session."""
+    template = tmp_path_factory.mktemp("primitives")
+    SkillBank(skills_dir=template)
+    return template
+
+
+@pytest.fixture
+def primitives_dir(tmp_path, _primitives_template):
+    """Skills dir pre-seeded with the primitives via O(1) hardlinks.
+
+    Only for tests that never rewrite a primitive file in place —
+    an in-place rewrite would mutate the shared template through the
+    link. Tests that flush usage stats onto a primitive use a plain
+    tmp_path so SkillBank materializes private copies.
+    """
+    for f in _primitives_template.iterdir():
+        os.link(f, tmp_path / f.name)
+    return tmp_path
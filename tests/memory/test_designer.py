@@ -1,5 +1,6 @@
 """Tests for skill designer."""
 
+import dataclasses
 import json
 from datetime import datetime
 from typing import Any
@@ -9,45 +10,82 @@ import pytest
 from sparkagent.memory.designer import SkillDesigner
 from sparkagent.memory.models import HardCase, MemoryOperation, MemorySkill, OperationType
 from sparkagent.memory.skill_bank import SkillBank
-from sparkagent.providers.base import LLMProvider, LLMResponse
+from sparkagent.providers.base import LLMResponse
 
+# Shardable in CI; the xdist group keeps tests sharing temp storage on
+# one worker
+pytestmark = [pytest.mark.skill, pytest.mark.xdist_group("designer")]
 
-class _MockProvider(LLMProvider):
-    def __init__(self, response_text: str):
-        super().__init__(api_key="test")
-        self._response_text = response_text
 
-    async def chat(
-        self,
-        messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None = None,
-        model: str | None = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-    ) -> LLMResponse:
-        return LLMResponse(content=self._response_text)
+@dataclasses.dataclass
+class _StubProvider:
+    """Duck-typed provider double — skips LLMProvider.__init__ entirely."""
+
+    response_text: str
+
+    async def chat(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        return LLMResponse(content=self.response_text)
 
     def get_default_model(self) -> str:
         return "mock"
 
 
+# Fixed timestamp — creation order never matters in these tests, and a
+# constant avoids a clock syscall per constructed object.
+_NOW = datetime(2024, 1, 1)
+
+# Built once; _make_hard_case clones it instead of re-allocating the
+# snippet/operations ~20 times per run.
+_TEMPLATE_HARD_CASE = HardCase(
+    id="",
+    conversation_snippet="User: I went hiking at Yosemite\nAssistant: Sounds fun!",
+    selected_skills=["primitive_insert"],
+    operations=[MemoryOperation(type=OperationType.NOOP, reasoning="No action taken")],
+    failure_type="",
+    created_at=_NOW,
+)
+
+
 def _make_hard_case(id: str = "hc1", failure_type: str = "missing_info") -> HardCase:
-    return HardCase(
-        id=id,
-        conversation_snippet="User: I went hiking at Yosemite\nAssistant: Sounds fun!",
-        selected_skills=["primitive_insert"],
-        operations=[
-            MemoryOperation(type=OperationType.NOOP, reasoning="No action taken")
-        ],
-        failure_type=failure_type,
-        created_at=datetime.now(),
-    )
+    return dataclasses.replace(_TEMPLATE_HARD_CASE, id=id, failure_type=failure_type)
+
+
+@pytest.fixture(scope="module")
+def add_new_response() -> str:
+    """Serialize the canned add_new designer reply once per module."""
+    proposals = json.dumps([{
+        "action": "add_new",
+        "id": "capture_activity_details",
+        "description": "Capture activity details from conversation",
+        "content": "# Capture Activity Details\n\nCapture activity info.",
+    }])
+    return f"```json\n{proposals}\n```"
+
+
+@pytest.fixture
+def designer_factory(tmp_path):
+    """Build designers over one shared bank so reload tests skip the rescan.
+
+    The bank is constructed once per test; calling the factory again
+    only re-instantiates SkillDesigner against the same storage dir,
+    which is all the persistence tests need to exercise reload.
+    """
+    bank = SkillBank(skills_dir=tmp_path / "skills")
+
+    def make(**kwargs) -> tuple[SkillBank, SkillDesigner]:
+        return bank, SkillDesigner(bank, storage_dir=tmp_path, **kwargs)
+
+    return make
+
+
+# One event loop for every async test in this module — each coroutine
+# only awaits a canned mock provider, so per-test loops buy no isolation
+_module_loop = pytest.mark.asyncio(loop_scope="module")
 
 
 class TestSkillDesigner:
-    def test_record_hard_case(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir)
+    def test_record_hard_case(self, designer_factory):
+        _, designer = designer_factory()
 
         case = _make_hard_case()
         designer.record_hard_case(case)
@@ -56,50 +94,36 @@ class TestSkillDesigner:
         assert len(cases) == 1
         assert cases[0].id == "hc1"
 
-    def test_hard_cases_persist(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir)
-        designer.record_hard_case(_make_hard_case("hc1"))
-        designer.record_hard_case(_make_hard_case("hc2"))
+    def test_hard_cases_persist(self, designer_factory):
+        _, designer = designer_factory()
+        designer.record_hard_cases([_make_hard_case("hc1"), _make_hard_case("hc2")])
 
-        # Reload from disk
-        designer2 = SkillDesigner(bank, storage_dir=temp_dir)
+        # Reload from disk — same bank, fresh designer
+        _, designer2 = designer_factory()
         cases = designer2._ensure_loaded()
         assert len(cases) == 2
 
-    def test_should_evolve_false(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir, hard_case_threshold=5)
+    def test_should_evolve_false(self, designer_factory):
+        _, designer = designer_factory(hard_case_threshold=5)
 
-        for i in range(4):
-            designer.record_hard_case(_make_hard_case(f"hc{i}"))
+        designer.record_hard_cases([_make_hard_case(f"hc{i}") for i in range(4)])
 
         assert designer.should_evolve() is False
 
-    def test_should_evolve_true(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir, hard_case_threshold=5)
+    def test_should_evolve_true(self, designer_factory):
+        _, designer = designer_factory(hard_case_threshold=5)
 
-        for i in range(5):
-            designer.record_hard_case(_make_hard_case(f"hc{i}"))
+        designer.record_hard_cases([_make_hard_case(f"hc{i}") for i in range(5)])
 
         assert designer.should_evolve() is True
 
-    @pytest.mark.asyncio
-    async def test_evolve_adds_new_skill(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir, hard_case_threshold=2)
+    @_module_loop
+    async def test_evolve_adds_new_skill(self, designer_factory, add_new_response):
+        bank, designer = designer_factory(hard_case_threshold=2)
 
-        designer.record_hard_case(_make_hard_case("hc1"))
-        designer.record_hard_case(_make_hard_case("hc2"))
+        designer.record_hard_cases([_make_hard_case("hc1"), _make_hard_case("hc2")])
 
-        response = json.dumps([{
-            "action": "add_new",
-            "id": "capture_activity_details",
-            "description": "Capture activity details from conversation",
-            "content": "# Capture Activity Details\n\nCapture activity info.",
-        }])
-        provider = _MockProvider(f"```json\n{response}\n```")
+        provider = _StubProvider(add_new_response)
 
         new_skills = await designer.evolve_skills(provider, "mock")
 
@@ -111,20 +135,19 @@ class TestSkillDesigner:
         assert loaded is not None
         assert loaded.is_primitive is False
 
-    @pytest.mark.asyncio
-    async def test_evolve_refines_existing(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
+    @_module_loop
+    async def test_evolve_refines_existing(self, designer_factory):
+        bank, designer = designer_factory(hard_case_threshold=1)
         # Add a skill to refine
         existing = MemorySkill(
             id="my_skill",
             description="Original description",
             content="# Original",
-            created_at=datetime.now(),
+            created_at=_NOW,
             version=1,
         )
         bank.add_skill(existing)
 
-        designer = SkillDesigner(bank, storage_dir=temp_dir, hard_case_threshold=1)
         designer.record_hard_case(_make_hard_case())
 
         response = json.dumps([{
@@ -133,7 +156,7 @@ class TestSkillDesigner:
             "description": "Improved description",
             "content": "# Improved\n\nBetter instructions.",
         }])
-        provider = _MockProvider(response)
+        provider = _StubProvider(response)
 
         new_skills = await designer.evolve_skills(provider, "mock")
 
@@ -142,31 +165,47 @@ class TestSkillDesigner:
         assert refined.description == "Improved description"
         assert refined.version == 2
 
-    @pytest.mark.asyncio
-    async def test_evolve_clears_hard_cases(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir, hard_case_threshold=1)
+    @_module_loop
+    async def test_evolve_chunks_large_case_buffers(self, designer_factory):
+        _, designer = designer_factory(hard_case_threshold=1)
+        designer.record_hard_cases([_make_hard_case(f"hc{i}") for i in range(12)])
+
+        call_count = 0
+
+        class _CountingProvider(_StubProvider):
+            async def chat(self, *args, **kwargs):
+                nonlocal call_count
+                call_count += 1
+                return await super().chat(*args, **kwargs)
+
+        provider = _CountingProvider("[]")
+        await designer.evolve_skills(provider, "mock")
+
+        # 12 cases → 3 chunks of up to 5 → 3 designer calls
+        assert call_count == 3
+
+    @_module_loop
+    async def test_evolve_clears_hard_cases(self, designer_factory):
+        _, designer = designer_factory(hard_case_threshold=1)
         designer.record_hard_case(_make_hard_case())
 
-        provider = _MockProvider("[]")
+        provider = _StubProvider("[]")
         await designer.evolve_skills(provider, "mock")
 
         assert designer.should_evolve() is False
         assert len(designer._ensure_loaded()) == 0
 
-    @pytest.mark.asyncio
-    async def test_evolve_empty_hard_cases(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir)
+    @_module_loop
+    async def test_evolve_empty_hard_cases(self, designer_factory):
+        _, designer = designer_factory()
 
-        provider = _MockProvider("[]")
+        provider = _StubProvider("[]")
         result = await designer.evolve_skills(provider, "mock")
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_evolve_does_not_refine_primitives(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir, hard_case_threshold=1)
+    @_module_loop
+    async def test_evolve_does_not_refine_primitives(self, designer_factory):
+        bank, designer = designer_factory(hard_case_threshold=1)
         designer.record_hard_case(_make_hard_case())
 
         response = json.dumps([{
@@ -175,7 +214,7 @@ class TestSkillDesigner:
             "description": "Modified primitive",
             "content": "# Modified",
         }])
-        provider = _MockProvider(response)
+        provider = _StubProvider(response)
 
         new_skills = await designer.evolve_skills(provider, "mock")
         # Primitives should not be refined
@@ -183,14 +222,14 @@ class TestSkillDesigner:
         prim = bank.get("primitive_insert")
         assert "Modified" not in prim.description
 
-    def test_check_rollbacks(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
+    def test_check_rollbacks(self, designer_factory):
+        bank, designer = designer_factory()
         # Add a low-success evolved skill
         bad = MemorySkill(
             id="bad_skill",
             description="Bad skill",
             content="# Bad",
-            created_at=datetime.now(),
+            created_at=_NOW,
             usage_count=10,
             success_count=1,
         )
@@ -201,13 +240,12 @@ class TestSkillDesigner:
             id="good_skill",
             description="Good skill",
             content="# Good",
-            created_at=datetime.now(),
+            created_at=_NOW,
             usage_count=10,
             success_count=9,
         )
         bank.add_skill(good)
 
-        designer = SkillDesigner(bank, storage_dir=temp_dir)
         rolled_back = designer.check_rollbacks()
 
         assert "bad_skill" in rolled_back
@@ -215,19 +253,17 @@ class TestSkillDesigner:
         assert bank.get("bad_skill") is None
         assert bank.get("good_skill") is not None
 
-    @pytest.mark.asyncio
-    async def test_malformed_response(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir, hard_case_threshold=1)
+    @_module_loop
+    async def test_malformed_response(self, designer_factory):
+        _, designer = designer_factory(hard_case_threshold=1)
         designer.record_hard_case(_make_hard_case())
 
-        provider = _MockProvider("This is not JSON")
+        provider = _StubProvider("This is not JSON")
         new_skills = await designer.evolve_skills(provider, "mock")
         assert new_skills == []
 
-    def test_hard_case_operations_persist(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir / "skills")
-        designer = SkillDesigner(bank, storage_dir=temp_dir)
+    def test_hard_case_operations_persist(self, designer_factory):
+        _, designer = designer_factory()
 
         case = HardCase(
             id="hc_ops",
@@ -245,8 +281,8 @@ class TestSkillDesigner:
         )
         designer.record_hard_case(case)
 
-        # Reload
-        designer2 = SkillDesigner(bank, storage_dir=temp_dir)
+        # Reload — same bank, fresh designer
+        _, designer2 = designer_factory()
         loaded = designer2._ensure_loaded()
         assert len(loaded) == 1
         assert len(loaded[0].operations) == 1
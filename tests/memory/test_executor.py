@@ -7,7 +7,7 @@ from typing import Any
 import pytest
 
 from sparkagent.memory.executor import (
-    _extract_json,
+    _decode_json_array,
     _format_indexed_memories,
     execute_memory_skills,
 )
@@ -18,17 +18,11 @@ from sparkagent.providers.base import LLMProvider, LLMResponse
 class _MockProvider(LLMProvider):
     def __init__(self, response_text: str):
         super().__init__(api_key="test")
-        self._response_text = response_text
-
-    async def chat(
-        self,
-        messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None = None,
-        model: str | None = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-    ) -> LLMResponse:
-        return LLMResponse(content=self._response_text)
+        # Built once — chat just hands back the same response object
+        self._resp = LLMResponse(content=response_text)
+
+    async def chat(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        return self._resp
 
     def get_default_model(self) -> str:
         return "mock"
@@ -51,26 +45,34 @@ def _make_skill(id: str = "primitive_insert") -> MemorySkill:
     )
 
 
-class TestExtractJson:
-    def test_code_fence(self):
-        text = 'Some text\n```json\n[{"type": "INSERT"}]\n```\nMore text'
-        assert _extract_json(text) == '[{"type": "INSERT"}]'
-
-    def test_code_fence_no_lang(self):
-        text = 'Text\n```\n[{"type": "NOOP"}]\n```'
-        assert _extract_json(text) == '[{"type": "NOOP"}]'
-
-    def test_raw_json(self):
-        text = '[{"type": "INSERT", "content": "test"}]'
-        assert _extract_json(text) == '[{"type": "INSERT", "content": "test"}]'
-
-    def test_no_json(self):
-        assert _extract_json("No JSON here") == ""
-
-    def test_json_with_surrounding_text(self):
-        text = 'Here are the operations: [{"type": "NOOP"}] done.'
-        result = _extract_json(text)
-        assert '"NOOP"' in result
+class TestDecodeJsonArray:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            pytest.param(
+                'Some text\n```json\n[{"type": "INSERT"}]\n```\nMore text',
+                [{"type": "INSERT"}],
+                id="code-fence",
+            ),
+            pytest.param(
+                'Text\n```\n[{"type": "NOOP"}]\n```', [{"type": "NOOP"}], id="code-fence-no-lang"
+            ),
+            pytest.param(
+                '[{"type": "INSERT", "content": "test"}]',
+                [{"type": "INSERT", "content": "test"}],
+                id="raw-json",
+            ),
+            pytest.param(
+                'Here are the operations: [{"type": "NOOP"}] done.',
+                [{"type": "NOOP"}],
+                id="surrounding-text",
+            ),
+            pytest.param("No JSON here", None, id="no-json"),
+            pytest.param('```json\n[{"type": ]\n```', None, id="malformed-json"),
+        ],
+    )
+    def test_decode(self, text: str, expected: list[dict] | None):
+        assert _decode_json_array(text) == expected
 
 
 class TestFormatIndexedMemories:
@@ -90,7 +92,9 @@ class TestFormatIndexedMemories:
 
 
 class TestExecuteMemorySkills:
-    @pytest.mark.asyncio
+    # All tests here are async — share one module-scoped event loop
+    pytestmark = pytest.mark.asyncio(loop_scope="module")
+
     async def test_insert_operation(self):
         response = json.dumps([
             {"type": "INSERT", "content": "User prefers dark mode", "tags": ["preference", "ui"]}
@@ -107,7 +111,6 @@ class TestExecuteMemorySkills:
         assert ops[0].content == "User prefers dark mode"
         assert ops[0].tags == ["preference", "ui"]
 
-    @pytest.mark.asyncio
     async def test_update_operation(self):
         entries = [_make_entry("entry_abc", "User lives in SF", ["location"])]
         response = json.dumps([
@@ -126,7 +129,6 @@ class TestExecuteMemorySkills:
         assert ops[0].target_id == "entry_abc"
         assert ops[0].content == "User lives in NYC"
 
-    @pytest.mark.asyncio
     async def test_delete_operation(self):
         entries = [_make_entry("entry_del", "Old fact")]
         response = json.dumps([
@@ -141,7 +143,6 @@ class TestExecuteMemorySkills:
         assert ops[0].type == OperationType.DELETE
         assert ops[0].target_id == "entry_del"
 
-    @pytest.mark.asyncio
     async def test_noop_operation(self):
         response = json.dumps([
             {"type": "NOOP", "reasoning": "Just a greeting"}
@@ -154,7 +155,6 @@ class TestExecuteMemorySkills:
         assert len(ops) == 1
         assert ops[0].type == OperationType.NOOP
 
-    @pytest.mark.asyncio
     async def test_multiple_operations(self):
         entries = [_make_entry("e1", "Old fact")]
         response = json.dumps([
@@ -170,7 +170,6 @@ class TestExecuteMemorySkills:
         assert ops[0].type == OperationType.INSERT
         assert ops[1].type == OperationType.DELETE
 
-    @pytest.mark.asyncio
     async def test_malformed_json_returns_empty(self):
         provider = _MockProvider("This is not JSON at all")
         ops = await execute_memory_skills(
@@ -178,7 +177,6 @@ class TestExecuteMemorySkills:
         )
         assert ops == []
 
-    @pytest.mark.asyncio
     async def test_invalid_op_type_skipped(self):
         response = json.dumps([
             {"type": "INVALID", "content": "foo"},
@@ -192,7 +190,6 @@ class TestExecuteMemorySkills:
         assert len(ops) == 1
         assert ops[0].type == OperationType.INSERT
 
-    @pytest.mark.asyncio
     async def test_out_of_range_memory_index(self):
         entries = [_make_entry("e1", "Only entry")]
         response = json.dumps([
@@ -206,7 +203,6 @@ class TestExecuteMemorySkills:
         assert len(ops) == 1
         assert ops[0].target_id == ""  # Index out of range → no target
 
-    @pytest.mark.asyncio
     async def test_skill_id_assigned(self):
         response = json.dumps([{"type": "INSERT", "content": "test", "tags": []}])
         provider = _MockProvider(response)
@@ -108,6 +108,23 @@ class TestMemoryOperation:
         assert op.type == OperationType.NOOP
         assert op.reasoning == "Just a greeting"
 
+    def test_to_dict(self):
+        op = MemoryOperation(
+            type=OperationType.INSERT,
+            content="New fact",
+            tags=["fact"],
+            skill_id="sk1",
+            reasoning="worth keeping",
+        )
+        assert op.to_dict() == {
+            "type": "insert",
+            "content": "New fact",
+            "target_id": "",
+            "tags": ["fact"],
+            "skill_id": "sk1",
+            "reasoning": "worth keeping",
+        }
+
 
 class TestHardCase:
     def test_create(self):
@@ -0,0 +1,72 @@
+"""Tests for batch memory pipeline processing."""
+
+import asyncio
+import json
+from typing import Any
+
+from sparkagent.memory.pipeline import process_turns
+from sparkagent.memory.skill_bank import SkillBank
+from sparkagent.memory.store import MemoryStore
+from sparkagent.providers.base import LLMProvider, LLMResponse
+
+
+class _MockProvider(LLMProvider):
+    """Provider answering selector calls with a skill list and executor calls with ops."""
+
+    def __init__(self):
+        super().__init__(api_key="test")
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> LLMResponse:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        if "controller" in messages[0]["content"]:
+            return LLMResponse(content="1. primitive_insert")
+        ops = [{"type": "INSERT", "content": "fact", "tags": []}]
+        return LLMResponse(content=json.dumps(ops))
+
+    def get_default_model(self) -> str:
+        return "mock"
+
+
+class TestProcessTurns:
+    async def test_returns_operations_per_turn(self, tmp_path):
+        provider = _MockProvider()
+        bank = SkillBank(skills_dir=tmp_path / "skills")
+        store = MemoryStore(storage_dir=tmp_path / "store")
+
+        turns = [f"User: fact {i}\nAssistant: noted" for i in range(4)]
+        results = await process_turns(turns, provider, "mock", bank, store)
+
+        assert len(results) == 4
+        for ops in results:
+            assert len(ops) == 1
+            assert ops[0].content == "fact"
+
+    async def test_overlaps_calls_up_to_concurrency(self, tmp_path):
+        provider = _MockProvider()
+        bank = SkillBank(skills_dir=tmp_path / "skills")
+        store = MemoryStore(storage_dir=tmp_path / "store")
+
+        turns = [f"Turn {i}" for i in range(6)]
+        await process_turns(turns, provider, "mock", bank, store, concurrency=3)
+
+        assert 1 < provider.max_in_flight <= 3
+
+    async def test_empty_turns(self, tmp_path):
+        provider = _MockProvider()
+        bank = SkillBank(skills_dir=tmp_path / "skills")
+        store = MemoryStore(storage_dir=tmp_path / "store")
+
+        assert await process_turns([], provider, "mock", bank, store) == []
@@ -13,46 +13,50 @@ class _MockProvider(LLMProvider):
 
     def __init__(self, response_text: str):
         super().__init__(api_key="test")
-        self._response_text = response_text
-
-    async def chat(
-        self,
-        messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None = None,
-        model: str | None = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-    ) -> LLMResponse:
-        return LLMResponse(content=self._response_text)
+        # Built once — chat just hands back the same response object
+        self._resp = LLMResponse(content=response_text)
+
+    async def chat(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        return self._resp
 
     def get_default_model(self) -> str:
         return "mock"
 
 
 class TestParseSkillIds:
-    def test_numbered_list(self):
-        text = "1. primitive_insert\n2. primitive_noop\n3. capture_details"
-        result = _parse_skill_ids(text, top_k=3)
-        assert result == ["primitive_insert", "primitive_noop", "capture_details"]
-
-    def test_dash_list(self):
-        text = "- primitive_insert\n- primitive_update"
-        result = _parse_skill_ids(text, top_k=3)
-        assert result == ["primitive_insert", "primitive_update"]
-
-    def test_top_k_respected(self):
-        text = "1. a_b\n2. c_d\n3. e_f"
-        result = _parse_skill_ids(text, top_k=2)
-        assert len(result) == 2
-
-    def test_fallback_on_garbled(self):
-        text = "I'm not sure what skills to pick"
-        result = _parse_skill_ids(text, top_k=3)
-        assert result == ["primitive_insert", "primitive_noop"]
-
-    def test_fallback_on_empty(self):
-        result = _parse_skill_ids("", top_k=3)
-        assert result == ["primitive_insert", "primitive_noop"]
+    @pytest.mark.parametrize(
+        ("text", "top_k", "expected"),
+        [
+            pytest.param(
+                "1. primitive_insert\n2. primitive_noop\n3. capture_details",
+                3,
+                ["primitive_insert", "primitive_noop", "capture_details"],
+                id="numbered-list",
+            ),
+            pytest.param(
+                "- primitive_insert\n- primitive_update",
+                3,
+                ["primitive_insert", "primitive_update"],
+                id="dash-list",
+            ),
+            pytest.param(
+                "1) primitive_insert\n2) primitive_noop",
+                3,
+                ["primitive_insert", "primitive_noop"],
+                id="numbered-with-paren",
+            ),
+            pytest.param("1. a_b\n2. c_d\n3. e_f", 2, ["a_b", "c_d"], id="top-k-respected"),
+            pytest.param(
+                "I'm not sure what skills to pick",
+                3,
+                ["primitive_insert", "primitive_noop"],
+                id="fallback-on-garbled",
+            ),
+            pytest.param("", 3, ["primitive_insert", "primitive_noop"], id="fallback-on-empty"),
+        ],
+    )
+    def test_parse(self, text: str, top_k: int, expected: list[str]):
+        assert _parse_skill_ids(text, top_k=top_k) == expected
 
     def test_underscore_word_fallback(self):
         text = "I think we should use capture_details and handle_entities here"
@@ -60,14 +64,11 @@ class TestParseSkillIds:
         assert "capture_details" in result
         assert "handle_entities" in result
 
-    def test_numbered_with_paren(self):
-        text = "1) primitive_insert\n2) primitive_noop"
-        result = _parse_skill_ids(text, top_k=3)
-        assert result == ["primitive_insert", "primitive_noop"]
-
 
 class TestSelectSkills:
-    @pytest.mark.asyncio
+    # All tests here are async — share one module-scoped event loop
+    pytestmark = pytest.mark.asyncio(loop_scope="module")
+
     async def test_returns_skill_ids(self):
         provider = _MockProvider("1. primitive_insert\n2. primitive_noop")
         result = await select_skills(
@@ -76,7 +77,6 @@ class TestSelectSkills:
         )
         assert result == ["primitive_insert", "primitive_noop"]
 
-    @pytest.mark.asyncio
     async def test_top_k(self):
         provider = _MockProvider("1. a_b\n2. c_d\n3. e_f")
         result = await select_skills(
@@ -84,7 +84,6 @@ class TestSelectSkills:
         )
         assert len(result) == 2
 
-    @pytest.mark.asyncio
     async def test_garbled_response_falls_back(self):
         provider = _MockProvider("I can't decide")
         result = await select_skills(
@@ -93,7 +92,6 @@ class TestSelectSkills:
         assert "primitive_insert" in result
         assert "primitive_noop" in result
 
-    @pytest.mark.asyncio
     async def test_none_content_falls_back(self):
         provider = _MockProvider("")
 
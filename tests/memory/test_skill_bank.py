@@ -39,9 +39,9 @@ version: 2
 
 
 class TestSkillBank:
-    def test_creates_primitives(self, temp_dir):
-        SkillBank(skills_dir=temp_dir)
-        files = list(temp_dir.glob("*.md"))
+    def test_creates_primitives(self, tmp_path):
+        SkillBank(skills_dir=tmp_path)
+        files = list(tmp_path.glob("*.md"))
         assert len(files) == 4
 
         names = {f.stem for f in files}
@@ -50,36 +50,62 @@ class TestSkillBank:
         assert "primitive_delete" in names
         assert "primitive_noop" in names
 
-    def test_primitives_are_marked(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_primitives_are_marked(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         for skill in bank.get_all():
             assert skill.is_primitive is True
 
-    def test_get_all(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_get_all(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         skills = bank.get_all()
         assert len(skills) == 4
 
-    def test_get_by_id(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_get_by_id(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         skill = bank.get("primitive_insert")
         assert skill is not None
         assert skill.id == "primitive_insert"
         assert "Insert" in skill.description or "insert" in skill.description.lower()
 
-    def test_get_nonexistent(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_get_nonexistent(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         assert bank.get("nonexistent") is None
 
-    def test_get_descriptions(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_get_descriptions(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         desc = bank.get_descriptions()
         assert "primitive_insert" in desc
         assert "primitive_noop" in desc
         assert "[primitive]" in desc
 
-    def test_add_skill(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_get_descriptions_cached(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
+        first = bank.get_descriptions()
+        # Unchanged skill set → same cached string, no reformatting
+        assert bank.get_descriptions() is first
+
+    def test_init_defers_parsing(self, primitives_dir, monkeypatch):
+        parsed = []
+        monkeypatch.setattr(
+            SkillBank, "_parse_skill_md", lambda self, p: parsed.append(p) or None
+        )
+        SkillBank(skills_dir=primitives_dir)
+        assert parsed == []
+
+    def test_rescan_skips_unchanged_files(self, primitives_dir, monkeypatch):
+        bank = SkillBank(skills_dir=primitives_dir)
+        bank.get_all()  # trigger the lazy initial load
+        parsed = []
+        original = bank._parse_skill_md
+        monkeypatch.setattr(bank, "_parse_skill_md", lambda p: parsed.append(p) or original(p))
+
+        # All files already in the mtime cache → no reparsing
+        bank._load_skills()
+        assert parsed == []
+        assert len(bank.get_all()) == 4
+
+    def test_add_skill(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         skill = MemorySkill(
             id="capture_details",
             description="Capture activity details",
@@ -90,7 +116,7 @@ class TestSkillBank:
         bank.add_skill(skill)
 
         # Check file was created
-        assert (temp_dir / "capture_details.md").exists()
+        assert (primitives_dir / "capture_details.md").exists()
 
         # Check it's retrievable
         loaded = bank.get("capture_details")
@@ -98,8 +124,8 @@ class TestSkillBank:
         assert loaded.description == "Capture activity details"
         assert loaded.is_primitive is False
 
-    def test_remove_skill(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_remove_skill(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         skill = MemorySkill(
             id="to_remove",
             description="Temporary skill",
@@ -110,21 +136,21 @@ class TestSkillBank:
 
         result = bank.remove_skill("to_remove")
         assert result is True
-        assert not (temp_dir / "to_remove.md").exists()
+        assert not (primitives_dir / "to_remove.md").exists()
         assert bank.get("to_remove") is None
 
-    def test_cannot_remove_primitive(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_cannot_remove_primitive(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         result = bank.remove_skill("primitive_insert")
         assert result is False
         assert bank.get("primitive_insert") is not None
 
-    def test_remove_nonexistent(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_remove_nonexistent(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         assert bank.remove_skill("nonexistent") is False
 
-    def test_record_usage(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_record_usage(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         bank.record_usage("primitive_insert", success=True)
         bank.record_usage("primitive_insert", success=True)
         bank.record_usage("primitive_insert", success=False)
@@ -133,18 +159,30 @@ class TestSkillBank:
         assert skill.usage_count == 3
         assert skill.success_count == 2
 
-    def test_record_usage_persists(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_record_usage_persists_on_flush(self, tmp_path):
+        bank = SkillBank(skills_dir=tmp_path)
         bank.record_usage("primitive_insert", success=True)
+        bank.flush_usage()
 
         # Reload from disk
-        bank2 = SkillBank(skills_dir=temp_dir)
+        bank2 = SkillBank(skills_dir=tmp_path)
         skill = bank2.get("primitive_insert")
         assert skill.usage_count == 1
         assert skill.success_count == 1
 
-    def test_rollback_low_success(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_record_usage_does_not_rewrite_until_flush(self, tmp_path):
+        bank = SkillBank(skills_dir=tmp_path)
+        path = tmp_path / "primitive_insert.md"
+        before = path.read_text()
+
+        bank.record_usage("primitive_insert", success=True)
+        assert path.read_text() == before
+
+        bank.flush_usage()
+        assert "usage_count: 1" in path.read_text()
+
+    def test_rollback_low_success(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         skill = MemorySkill(
             id="bad_skill",
             description="A bad skill",
@@ -159,8 +197,8 @@ class TestSkillBank:
         assert result is True
         assert bank.get("bad_skill") is None
 
-    def test_no_rollback_high_success(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_no_rollback_high_success(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         skill = MemorySkill(
             id="good_skill",
             description="A good skill",
@@ -175,8 +213,8 @@ class TestSkillBank:
         assert result is False
         assert bank.get("good_skill") is not None
 
-    def test_no_rollback_too_few_uses(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_no_rollback_too_few_uses(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         skill = MemorySkill(
             id="new_skill",
             description="New skill",
@@ -190,19 +228,20 @@ class TestSkillBank:
         result = bank.rollback_skill("new_skill")
         assert result is False
 
-    def test_does_not_recreate_primitives(self, temp_dir):
+    def test_does_not_recreate_primitives(self, tmp_path):
         """If primitives exist, they should not be overwritten."""
-        bank = SkillBank(skills_dir=temp_dir)
+        bank = SkillBank(skills_dir=tmp_path)
         # Record usage to modify primitive
         bank.record_usage("primitive_insert", success=True)
+        bank.flush_usage()
 
         # Reload — should not reset usage count
-        bank2 = SkillBank(skills_dir=temp_dir)
+        bank2 = SkillBank(skills_dir=tmp_path)
         skill = bank2.get("primitive_insert")
         assert skill.usage_count == 1
 
-    def test_add_skill_shows_evolved_tag(self, temp_dir):
-        bank = SkillBank(skills_dir=temp_dir)
+    def test_add_skill_shows_evolved_tag(self, primitives_dir):
+        bank = SkillBank(skills_dir=primitives_dir)
         skill = MemorySkill(
             id="evolved_one",
             description="An evolved skill",
@@ -1,18 +1,20 @@
 """Tests for memory store."""
 
+import io
 from datetime import datetime
 
 from sparkagent.memory.store import MemoryStore
+from sparkagent.memory.turn_context import TurnContext
 
 
 class TestMemoryStore:
-    def test_create_store(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
-        assert store.storage_dir == temp_dir
-        assert store._entries_path == temp_dir / "entries.jsonl"
+    def test_create_store(self, tmp_path):
+        store = MemoryStore(storage_dir=tmp_path)
+        assert store.storage_dir == tmp_path
+        assert store._entries_path == tmp_path / "entries.jsonl"
 
-    def test_insert(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_insert(self):
+        store = MemoryStore(storage=io.BytesIO())
         entry = store.insert("User likes dark mode", tags=["preference", "ui"])
 
         assert entry.content == "User likes dark mode"
@@ -20,21 +22,26 @@ class TestMemoryStore:
         assert len(entry.id) == 12
         assert isinstance(entry.created_at, datetime)
 
-    def test_insert_persists(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_insert_ids_unique(self):
+        store = MemoryStore(storage=io.BytesIO())
+        ids = {store.insert(f"Fact {i}").id for i in range(100)}
+        assert len(ids) == 100
+
+    def test_insert_persists(self, tmp_path):
+        store = MemoryStore(storage_dir=tmp_path)
         store.insert("Fact 1", tags=["tag1"])
         store.insert("Fact 2", tags=["tag2"])
 
         # Reload from disk
-        store2 = MemoryStore(storage_dir=temp_dir)
+        store2 = MemoryStore(storage_dir=tmp_path)
         entries = store2.get_all()
         assert len(entries) == 2
         contents = {e.content for e in entries}
         assert "Fact 1" in contents
         assert "Fact 2" in contents
 
-    def test_update(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_update(self):
+        store = MemoryStore(storage=io.BytesIO())
         entry = store.insert("User lives in SF", tags=["location"])
 
         updated = store.update(entry.id, content="User lives in NYC", tags=["location", "nyc"])
@@ -44,8 +51,8 @@ class TestMemoryStore:
         assert updated.tags == ["location", "nyc"]
         assert updated.updated_at >= entry.created_at
 
-    def test_update_partial(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_update_partial(self):
+        store = MemoryStore(storage=io.BytesIO())
         entry = store.insert("Original content", tags=["tag1"])
 
         # Update only content, tags unchanged
@@ -53,37 +60,37 @@ class TestMemoryStore:
         assert updated.content == "New content"
         assert updated.tags == ["tag1"]
 
-    def test_update_nonexistent(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_update_nonexistent(self):
+        store = MemoryStore(storage=io.BytesIO())
         result = store.update("nonexistent", content="foo")
         assert result is None
 
-    def test_delete(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_delete(self):
+        store = MemoryStore(storage=io.BytesIO())
         entry = store.insert("To be deleted")
 
         result = store.delete(entry.id)
         assert result is True
         assert store.get(entry.id) is None
 
-    def test_delete_nonexistent(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_delete_nonexistent(self):
+        store = MemoryStore(storage=io.BytesIO())
         assert store.delete("nonexistent") is False
 
-    def test_get(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_get(self):
+        store = MemoryStore(storage=io.BytesIO())
         entry = store.insert("Test content")
 
         found = store.get(entry.id)
         assert found is not None
         assert found.content == "Test content"
 
-    def test_get_nonexistent(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_get_nonexistent(self):
+        store = MemoryStore(storage=io.BytesIO())
         assert store.get("nonexistent") is None
 
-    def test_get_all(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_get_all(self):
+        store = MemoryStore(storage=io.BytesIO())
         store.insert("Fact 1")
         store.insert("Fact 2")
         store.insert("Fact 3")
@@ -91,14 +98,14 @@ class TestMemoryStore:
         entries = store.get_all()
         assert len(entries) == 3
 
-    def test_get_all_empty(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_get_all_empty(self):
+        store = MemoryStore(storage=io.BytesIO())
         assert store.get_all() == []
 
 
 class TestMemoryStoreRetrieval:
-    def test_retrieve_by_tag_overlap(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_by_tag_overlap(self):
+        store = MemoryStore(storage=io.BytesIO())
         store.insert("Likes pizza", tags=["food", "preference"])
         store.insert("Works at Acme", tags=["work", "company"])
         store.insert("Likes sushi too", tags=["food", "preference"])
@@ -109,8 +116,8 @@ class TestMemoryStoreRetrieval:
         assert any("pizza" in r.content.lower() for r in results[:2])
         assert any("sushi" in r.content.lower() for r in results[:2])
 
-    def test_retrieve_by_content_overlap(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_by_content_overlap(self):
+        store = MemoryStore(storage=io.BytesIO())
         store.insert("User prefers dark mode for the UI")
         store.insert("User has a cat named Whiskers")
 
@@ -118,35 +125,74 @@ class TestMemoryStoreRetrieval:
         assert len(results) >= 1
         assert "dark mode" in results[0].content.lower()
 
-    def test_retrieve_max_results(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_max_results(self):
+        store = MemoryStore(storage=io.BytesIO())
         for i in range(20):
             store.insert(f"Fact {i}", tags=["fact"])
 
         results = store.retrieve("fact", max_results=5)
         assert len(results) == 5
 
-    def test_retrieve_empty_query(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_empty_query(self):
+        store = MemoryStore(storage=io.BytesIO())
         store.insert("Some fact")
         results = store.retrieve("")
         assert results == []
 
-    def test_retrieve_empty_store(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_empty_store(self):
+        store = MemoryStore(storage=io.BytesIO())
         results = store.retrieve("anything")
         assert results == []
 
-    def test_retrieve_updates_access_count(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_updates_access_count(self):
+        store = MemoryStore(storage=io.BytesIO())
         entry = store.insert("Important fact", tags=["important"])
 
         store.retrieve("important")
         updated = store.get(entry.id)
         assert updated.access_count == 1
 
-    def test_retrieve_for_context(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_access_counts_persist_on_flush(self, tmp_path):
+        store = MemoryStore(storage_dir=tmp_path)
+        entry = store.insert("Important fact", tags=["important"])
+
+        store.retrieve("important")
+        store.flush()
+
+        store2 = MemoryStore(storage_dir=tmp_path)
+        assert store2.get(entry.id).access_count == 1
+
+    def test_retrieve_uses_index_on_large_stores(self):
+        store = MemoryStore(storage=io.BytesIO())
+        for i in range(70):
+            store.insert(f"Filler fact number {i}", tags=["filler"])
+        target = store.insert("User speaks Esperanto fluently", tags=["language"])
+
+        results = store.retrieve("esperanto", max_results=3)
+        assert [e.id for e in results] == [target.id]
+
+    def test_index_drops_stale_tokens_on_update(self):
+        store = MemoryStore(storage=io.BytesIO())
+        for i in range(70):
+            store.insert(f"Filler fact number {i}", tags=["filler"])
+        entry = store.insert("User plays chess", tags=["hobby"])
+        store.update(entry.id, content="User plays go")
+
+        assert store.retrieve("chess") == []
+        assert [e.id for e in store.retrieve("go")] == [entry.id]
+
+    def test_retrieve_ctx_matches_retrieve(self):
+        store = MemoryStore(storage=io.BytesIO())
+        store.insert("Likes pizza", tags=["food"])
+        store.insert("Works at Acme", tags=["work"])
+
+        ctx = TurnContext.from_text("food pizza")
+        assert [e.id for e in store.retrieve_ctx(ctx)] == [
+            e.id for e in store.retrieve("food pizza")
+        ]
+
+    def test_retrieve_for_context(self):
+        store = MemoryStore(storage=io.BytesIO())
         store.insert("Likes dark mode", tags=["preference", "ui"])
         store.insert("Lives in NYC", tags=["location"])
 
@@ -154,20 +200,20 @@ class TestMemoryStoreRetrieval:
         assert "dark mode" in text.lower()
         assert text.startswith("- ")
 
-    def test_retrieve_for_context_empty(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_for_context_empty(self):
+        store = MemoryStore(storage=io.BytesIO())
         assert store.retrieve_for_context("anything") == ""
 
-    def test_retrieve_for_context_max_chars(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_for_context_max_chars(self):
+        store = MemoryStore(storage=io.BytesIO())
         for i in range(50):
             store.insert(f"This is a fact number {i} about the user", tags=["fact"])
 
         text = store.retrieve_for_context("fact", max_chars=100)
         assert len(text) <= 150  # Some slack for the last line
 
-    def test_retrieve_for_context_with_tags(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_retrieve_for_context_with_tags(self):
+        store = MemoryStore(storage=io.BytesIO())
         store.insert("Prefers Python", tags=["language", "preference"])
 
         text = store.retrieve_for_context("Python language")
@@ -176,27 +222,57 @@ class TestMemoryStoreRetrieval:
 
 
 class TestMemoryStorePersistence:
-    def test_load_corrupted_file(self, temp_dir):
+    def test_load_corrupted_file(self, tmp_path):
         """Corrupted lines should be skipped."""
-        path = temp_dir / "entries.jsonl"
+        path = tmp_path / "entries.jsonl"
         path.write_text('{"bad json\n{"id":"a","content":"ok","tags":[],'
                         '"source_session":"","source_skill":"","created_at":"2026-01-01T00:00:00",'
                         '"updated_at":"2026-01-01T00:00:00","access_count":0}\n')
 
-        store = MemoryStore(storage_dir=temp_dir)
+        store = MemoryStore(storage_dir=tmp_path)
         entries = store.get_all()
         assert len(entries) == 1
         assert entries[0].content == "ok"
 
-    def test_empty_file(self, temp_dir):
-        path = temp_dir / "entries.jsonl"
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "entries.jsonl"
         path.write_text("")
 
-        store = MemoryStore(storage_dir=temp_dir)
+        store = MemoryStore(storage_dir=tmp_path)
         assert store.get_all() == []
 
-    def test_insert_with_source(self, temp_dir):
-        store = MemoryStore(storage_dir=temp_dir)
+    def test_delete_survives_reload(self, tmp_path):
+        store = MemoryStore(storage_dir=tmp_path)
+        kept = store.insert("Keep me")
+        doomed = store.insert("Delete me")
+        store.delete(doomed.id)
+
+        # Tombstone must be replayed on load
+        store2 = MemoryStore(storage_dir=tmp_path)
+        assert store2.get(doomed.id) is None
+        assert store2.get(kept.id) is not None
+
+    def test_update_latest_wins_on_reload(self, tmp_path):
+        store = MemoryStore(storage_dir=tmp_path)
+        entry = store.insert("Original")
+        store.update(entry.id, content="Revised")
+
+        store2 = MemoryStore(storage_dir=tmp_path)
+        assert store2.get(entry.id).content == "Revised"
+        assert len(store2.get_all()) == 1
+
+    def test_log_compaction(self, tmp_path):
+        store = MemoryStore(storage_dir=tmp_path)
+        entry = store.insert("Churny fact")
+        for i in range(10):
+            store.update(entry.id, content=f"Rev {i}")
+
+        # Dead records trigger compaction, so the log stays near live size
+        lines = (tmp_path / "entries.jsonl").read_text().strip().splitlines()
+        assert len(lines) <= 3
+
+    def test_insert_with_source(self):
+        store = MemoryStore(storage=io.BytesIO())
         entry = store.insert(
             "Fact", source_session="cli:default", source_skill="primitive_insert"
         )
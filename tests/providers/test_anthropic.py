@@ -167,6 +167,68 @@ class TestAnthropicProviderInit:
             assert "default_query" not in call_kwargs
 
 
+class _FakeMessageStream:
+    """Async-context stand-in for the SDK's messages.stream() helper."""
+
+    def __init__(self, texts: list[str], final: SimpleNamespace):
+        self._texts = texts
+        self._final = final
+
+    async def __aenter__(self) -> "_FakeMessageStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> bool:
+        return False
+
+    @property
+    def text_stream(self):
+        async def gen():
+            for text in self._texts:
+                yield text
+
+        return gen()
+
+    async def get_final_message(self) -> SimpleNamespace:
+        return self._final
+
+
+class TestChatStream:
+    """Tests for the streaming chat path."""
+
+    async def test_yields_deltas_then_response(
+        self, provider: AnthropicProvider, mock_client: AsyncMock
+    ):
+        final = _anthropic_response([_text_block("Hello world")])
+        mock_client.messages.stream = MagicMock(
+            return_value=_FakeMessageStream(["Hello ", "world"], final)
+        )
+
+        items = []
+        async for item in provider.chat_stream(
+            messages=[{"role": "user", "content": "hi"}]
+        ):
+            items.append(item)
+
+        assert items[:2] == ["Hello ", "world"]
+        assert isinstance(items[2], LLMResponse)
+        assert items[2].content == "Hello world"
+
+    async def test_stream_error_yields_error_response(
+        self, provider: AnthropicProvider, mock_client: AsyncMock
+    ):
+        mock_client.messages.stream = MagicMock(side_effect=RuntimeError("boom"))
+
+        items = []
+        async for item in provider.chat_stream(
+            messages=[{"role": "user", "content": "hi"}]
+        ):
+            items.append(item)
+
+        assert len(items) == 1
+        assert items[0].finish_reason == "error"
+        assert "boom" in items[0].content
+
+
 # ---------------------------------------------------------------------------
 # Tests: _convert_tool
 # ---------------------------------------------------------------------------
@@ -223,6 +285,17 @@ class TestConvertTool:
 
         assert result["input_schema"] == {"type": "object", "properties": {}}
 
+    def test_identical_schema_returns_cached_object(self):
+        tool: dict[str, Any] = {
+            "type": "function",
+            "function": {"name": "cached_tool", "description": "d", "parameters": {}},
+        }
+
+        first = AnthropicProvider._convert_tool(tool)
+        second = AnthropicProvider._convert_tool(dict(tool))
+
+        assert second is first
+
 
 # ---------------------------------------------------------------------------
 # Tests: _parse_response
@@ -743,6 +816,46 @@ class TestEnsureValidToken:
         # Third arg is expires_at string
         assert isinstance(call_args[2], str)
 
+    async def test_stale_token_refreshes_in_background(self, mock_client: AsyncMock):
+        """A stale (but valid) token should not block; refresh runs as a task."""
+        import asyncio
+        from datetime import datetime, timedelta, timezone
+
+        from sparkagent.auth.oauth import OAuthTokens
+
+        # Inside the stale window (5-min buffer + 3-min window), not expired
+        soon = (datetime.now(timezone.utc) + timedelta(minutes=7)).isoformat()
+
+        with patch.object(_fake_anthropic, "AsyncAnthropic", return_value=mock_client):
+            p = AnthropicProvider(
+                api_key="sk-ant-oat01-stale",
+                token_type="oauth",
+                expires_at=soon,
+                refresh_token="refresh-tok",
+            )
+        p.client = mock_client
+
+        new_tokens = OAuthTokens(
+            access_token="sk-ant-oat01-new",
+            refresh_token="new-refresh",
+            expires_in=28800,
+        )
+
+        with (
+            patch(
+                "sparkagent.auth.oauth.refresh_access_token",
+                return_value=new_tokens,
+            ) as mock_refresh,
+            patch.object(_fake_anthropic, "AsyncAnthropic", return_value=mock_client),
+        ):
+            await p._ensure_valid_token()
+            # Returned without blocking; the refresh runs in the background
+            assert p._refresh_task is not None
+            await asyncio.wait_for(p._refresh_task, timeout=1)
+            mock_refresh.assert_called_once_with("refresh-tok")
+
+        assert p._refresh_token == "new-refresh"
+
     async def test_raises_without_refresh_token(self, mock_client: AsyncMock):
         """Expired token with no refresh_token should raise OAuthError."""
         from datetime import datetime, timedelta, timezone
@@ -763,10 +876,10 @@ class TestEnsureValidToken:
         with pytest.raises(OAuthError, match="no refresh token"):
             await p._ensure_valid_token()
 
-    async def test_refresh_recreates_client_with_oauth_headers(
+    async def test_refresh_same_kind_swaps_token_in_place(
         self, mock_client: AsyncMock
     ):
-        """Refreshed client should also get OAuth headers/query params."""
+        """An oauth-to-oauth refresh should reuse the pooled client."""
         from datetime import datetime, timedelta, timezone
 
         from sparkagent.auth.oauth import OAuthTokens
@@ -799,10 +912,10 @@ class TestEnsureValidToken:
         ):
             await p._ensure_valid_token()
 
-        # The recreated client should include OAuth headers and query
-        call_kwargs = mock_cls.call_args[1]
-        assert call_kwargs["default_headers"] == AnthropicProvider._OAUTH_HEADERS
-        assert call_kwargs["default_query"] == AnthropicProvider._OAUTH_QUERY
+        # Same credential kind — no client rebuild, token mutated in place
+        mock_cls.assert_not_called()
+        assert p.client is mock_client
+        assert p.client.auth_token == "sk-ant-oat01-new"
 
     async def test_chat_calls_ensure_valid_token(
         self, provider: AnthropicProvider, mock_client: AsyncMock
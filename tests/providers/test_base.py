@@ -85,6 +85,7 @@ class MockLLMProvider(LLMProvider):
         model: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        tool_choice: dict[str, Any] | str | None = None,
     ) -> LLMResponse:
         return self._response
 
@@ -128,6 +129,26 @@ class TestLLMProvider:
         assert result is expected
         assert result.content == "Custom response"
 
+    async def test_chat_stream_fallback(self):
+        # Default chat_stream yields the full content once, then the response
+        expected = LLMResponse(content="Streamed response")
+        provider = MockLLMProvider(response=expected)
+
+        items = []
+        async for item in provider.chat_stream(messages=[{"role": "user", "content": "Hello"}]):
+            items.append(item)
+
+        assert items == ["Streamed response", expected]
+
+    async def test_chat_many_preserves_order(self):
+        expected = LLMResponse(content="Batched response")
+        provider = MockLLMProvider(response=expected)
+
+        batches = [{"messages": [{"role": "user", "content": f"q{i}"}]} for i in range(3)]
+        results = await provider.chat_many(batches)
+
+        assert results == [expected, expected, expected]
+
     async def test_chat_with_tools(self):
         tc = ToolCall(id="1", name="test_tool", arguments={"arg": "value"})
         expected = LLMResponse(tool_calls=[tc], finish_reason="tool_calls")
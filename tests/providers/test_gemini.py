@@ -2,7 +2,7 @@
 
 import sys
 import types as builtin_types
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # ---------------------------------------------------------------------------
 # Mock the google.genai SDK so that the test suite works even when the
@@ -174,6 +174,20 @@ class TestConvertMessages:
         # 3 non-system messages
         assert len(contents) == 3
 
+    def test_consecutive_same_role_merged(self):
+        messages = [
+            {"role": "user", "content": "Question"},
+            {"role": "tool", "content": "tool result"},
+            {"role": "assistant", "content": "Answer"},
+        ]
+        _, contents = self.provider._convert_messages(messages)
+
+        # user + tool collapse into one multi-part user Content
+        assert len(contents) == 2
+        merged_kwargs = _types_module.Content.call_args_list[-2].kwargs
+        assert merged_kwargs["role"] == "user"
+        assert len(merged_kwargs["parts"]) == 2
+
     def test_empty_content_defaults_to_empty_string(self):
         messages = [{"role": "user", "content": None}]
         _, contents = self.provider._convert_messages(messages)
@@ -420,7 +434,7 @@ class TestChat:
 
     async def test_text_response(self):
         mock_response = _make_gemini_response([_make_text_part("The answer is 42.")])
-        self.provider.client.models.generate_content = MagicMock(
+        self.provider.client.aio.models.generate_content = AsyncMock(
             return_value=mock_response
         )
 
@@ -431,11 +445,11 @@ class TestChat:
         assert isinstance(result, LLMResponse)
         assert result.content == "The answer is 42."
         assert result.finish_reason == "stop"
-        self.provider.client.models.generate_content.assert_called_once()
+        self.provider.client.aio.models.generate_content.assert_awaited_once()
 
     async def test_uses_default_model(self):
         mock_response = _make_gemini_response([_make_text_part("ok")])
-        self.provider.client.models.generate_content = MagicMock(
+        self.provider.client.aio.models.generate_content = AsyncMock(
             return_value=mock_response
         )
 
@@ -443,12 +457,12 @@ class TestChat:
             messages=[{"role": "user", "content": "hi"}],
         )
 
-        call_kwargs = self.provider.client.models.generate_content.call_args.kwargs
+        call_kwargs = self.provider.client.aio.models.generate_content.call_args.kwargs
         assert call_kwargs["model"] == "gemini-2.5-flash"
 
     async def test_custom_model_overrides_default(self):
         mock_response = _make_gemini_response([_make_text_part("ok")])
-        self.provider.client.models.generate_content = MagicMock(
+        self.provider.client.aio.models.generate_content = AsyncMock(
             return_value=mock_response
         )
 
@@ -457,14 +471,14 @@ class TestChat:
             model="gemini-2.0-pro",
         )
 
-        call_kwargs = self.provider.client.models.generate_content.call_args.kwargs
+        call_kwargs = self.provider.client.aio.models.generate_content.call_args.kwargs
         assert call_kwargs["model"] == "gemini-2.0-pro"
 
     async def test_tool_call_response(self):
         mock_response = _make_gemini_response(
             [_make_function_call_part("search", {"query": "python"})]
         )
-        self.provider.client.models.generate_content = MagicMock(
+        self.provider.client.aio.models.generate_content = AsyncMock(
             return_value=mock_response
         )
 
@@ -490,7 +504,7 @@ class TestChat:
         assert result.tool_calls[0].arguments == {"query": "python"}
 
     async def test_exception_returns_error_response(self):
-        self.provider.client.models.generate_content = MagicMock(
+        self.provider.client.aio.models.generate_content = AsyncMock(
             side_effect=RuntimeError("API timeout")
         )
 
@@ -505,7 +519,7 @@ class TestChat:
 
     async def test_passes_max_tokens_and_temperature(self):
         mock_response = _make_gemini_response([_make_text_part("ok")])
-        self.provider.client.models.generate_content = MagicMock(
+        self.provider.client.aio.models.generate_content = AsyncMock(
             return_value=mock_response
         )
 
@@ -515,14 +529,14 @@ class TestChat:
             temperature=0.2,
         )
 
-        call_kwargs = self.provider.client.models.generate_content.call_args.kwargs
+        call_kwargs = self.provider.client.aio.models.generate_content.call_args.kwargs
         config = call_kwargs["config"]
         assert config.max_output_tokens == 1024
         assert config.temperature == 0.2
 
     async def test_no_tools_skips_tool_conversion(self):
         mock_response = _make_gemini_response([_make_text_part("ok")])
-        self.provider.client.models.generate_content = MagicMock(
+        self.provider.client.aio.models.generate_content = AsyncMock(
             return_value=mock_response
         )
 
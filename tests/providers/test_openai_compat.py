@@ -0,0 +1,186 @@
+"""Tests for the OpenAI-compatible LLM provider."""
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from sparkagent.providers.base import LLMResponse
+from sparkagent.providers.openai_compat import OpenAICompatibleProvider
+
+# ---------------------------------------------------------------------------
+# Helpers for building SSE chunk payloads and streamed responses
+# ---------------------------------------------------------------------------
+
+def _delta_chunk(
+    content: str | None = None,
+    tool_calls: list[dict[str, Any]] | None = None,
+    finish_reason: str | None = None,
+) -> dict[str, Any]:
+    delta: dict[str, Any] = {}
+    if content is not None:
+        delta["content"] = content
+    if tool_calls is not None:
+        delta["tool_calls"] = tool_calls
+    return {"choices": [{"delta": delta, "finish_reason": finish_reason}]}
+
+
+def _sse_body(chunks: list[dict[str, Any]], done: bool = True) -> bytes:
+    lines = [f"data: {json.dumps(chunk)}\n\n" for chunk in chunks]
+    if done:
+        lines.append("data: [DONE]\n\n")
+    return "".join(lines).encode("utf-8")
+
+
+def _streamed_response(status_code: int, body: bytes) -> httpx.Response:
+    # An async-iterator body keeps the response unread until consumed,
+    # matching a live SSE stream (a plain bytes body is pre-buffered).
+    async def aiter() -> Any:
+        yield body
+
+    return httpx.Response(
+        status_code,
+        content=aiter(),
+        headers={"content-type": "text/event-stream"},
+    )
+
+
+def _make_provider(handler) -> OpenAICompatibleProvider:
+    """Create a provider whose pooled client routes through a MockTransport."""
+    provider = OpenAICompatibleProvider(api_key="test-key", api_base="https://test.api.com/v1")
+    provider._client = httpx.AsyncClient(
+        base_url=provider.base_url,
+        transport=httpx.MockTransport(handler),
+    )
+    return provider
+
+
+async def _collect(provider: OpenAICompatibleProvider) -> list[str | LLMResponse]:
+    items: list[str | LLMResponse] = []
+    async for item in provider.chat_stream(messages=[{"role": "user", "content": "hi"}]):
+        items.append(item)
+    await provider.aclose()
+    return items
+
+
+# ---------------------------------------------------------------------------
+# Tests: chat_stream
+# ---------------------------------------------------------------------------
+
+class TestChatStream:
+    """Tests for the SSE streaming chat path."""
+
+    async def test_yields_deltas_then_response(self):
+        body = _sse_body([
+            _delta_chunk(content="Hello "),
+            _delta_chunk(content="world"),
+            _delta_chunk(finish_reason="stop"),
+        ])
+        provider = _make_provider(lambda request: _streamed_response(200, body))
+
+        items = await _collect(provider)
+
+        assert items[:2] == ["Hello ", "world"]
+        assert isinstance(items[2], LLMResponse)
+        assert items[2].content == "Hello world"
+        assert items[2].finish_reason == "stop"
+
+    async def test_tool_call_assembled_across_chunks(self):
+        body = _sse_body([
+            _delta_chunk(tool_calls=[
+                {"index": 0, "id": "call_1", "function": {"name": "read_file"}}
+            ]),
+            _delta_chunk(tool_calls=[
+                {"index": 0, "function": {"arguments": '{"path": '}}
+            ]),
+            _delta_chunk(tool_calls=[
+                {"index": 0, "function": {"arguments": '"/tmp/x"}'}}
+            ]),
+            _delta_chunk(finish_reason="tool_calls"),
+        ])
+        provider = _make_provider(lambda request: _streamed_response(200, body))
+
+        items = await _collect(provider)
+
+        assert len(items) == 1
+        response = items[0]
+        assert response.finish_reason == "tool_calls"
+        assert len(response.tool_calls) == 1
+        assert response.tool_calls[0].id == "call_1"
+        assert response.tool_calls[0].name == "read_file"
+        assert response.tool_calls[0].arguments == {"path": "/tmp/x"}
+
+    async def test_stops_at_done_marker(self):
+        body = _sse_body([_delta_chunk(content="before")])
+        body += _sse_body([_delta_chunk(content="after")], done=False)
+        provider = _make_provider(lambda request: _streamed_response(200, body))
+
+        items = await _collect(provider)
+
+        assert items[0] == "before"
+        assert items[1].content == "before"
+
+    async def test_malformed_chunks_skipped(self):
+        body = (
+            b"data: {not json}\n\n"
+            b": comment line\n\n"
+            + _sse_body([_delta_chunk(content="ok")])
+        )
+        provider = _make_provider(lambda request: _streamed_response(200, body))
+
+        items = await _collect(provider)
+
+        assert items == ["ok", items[1]]
+        assert items[1].content == "ok"
+
+    async def test_http_error_yields_error_response(self):
+        # Regression: raising before reading the streamed body used to close
+        # it, so the error handler's aread() escaped as httpx.StreamClosed.
+        error_body = json.dumps({"error": {"message": "model overloaded"}}).encode("utf-8")
+        provider = _make_provider(lambda request: _streamed_response(500, error_body))
+
+        items = await _collect(provider)
+
+        assert len(items) == 1
+        assert items[0].finish_reason == "error"
+        assert "500" in items[0].content
+        assert "model overloaded" in items[0].content
+
+    async def test_transport_error_yields_error_response(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused")
+
+        provider = _make_provider(handler)
+
+        items = await _collect(provider)
+
+        assert len(items) == 1
+        assert items[0].finish_reason == "error"
+        assert "connection refused" in items[0].content
+
+
+@pytest.mark.parametrize(
+    ("arguments", "expected"),
+    [
+        pytest.param('{"path": "/x"}', {"path": "/x"}, id="valid-json"),
+        pytest.param("", {}, id="empty"),
+        pytest.param('{"broken', {"raw": '{"broken'}, id="invalid-json"),
+    ],
+)
+async def test_tool_call_argument_decoding(arguments: str, expected: dict[str, Any]):
+    chunks = [
+        _delta_chunk(tool_calls=[
+            {
+                "index": 0,
+                "id": "call_1",
+                "function": {"name": "t", "arguments": arguments},
+            }
+        ]),
+        _delta_chunk(finish_reason="tool_calls"),
+    ]
+    provider = _make_provider(lambda request: _streamed_response(200, _sse_body(chunks)))
+
+    items = await _collect(provider)
+
+    assert items[0].tool_calls[0].arguments == expected
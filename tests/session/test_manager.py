@@ -83,26 +83,26 @@ class TestSession:
 class TestSessionManager:
     """Tests for SessionManager class."""
 
-    def test_create_manager(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
-        assert manager.storage_dir == temp_dir
-        assert temp_dir.exists()
+    def test_create_manager(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
+        assert manager.storage_dir == tmp_path
+        assert tmp_path.exists()
 
-    def test_create_manager_creates_directory(self, temp_dir):
-        new_dir = temp_dir / "sessions"
+    def test_create_manager_creates_directory(self, tmp_path):
+        new_dir = tmp_path / "sessions"
         manager = SessionManager(storage_dir=new_dir)
         assert new_dir.exists()
 
-    def test_get_or_create_new_session(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_get_or_create_new_session(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
 
         session = manager.get_or_create("test:123")
 
         assert session.key == "test:123"
         assert session.messages == []
 
-    def test_get_or_create_cached_session(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_get_or_create_cached_session(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
 
         session1 = manager.get_or_create("test:123")
         session1.add_message("user", "Hello")
@@ -111,8 +111,8 @@ class TestSessionManager:
         assert session1 is session2
         assert len(session2.messages) == 1
 
-    def test_save_session(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_save_session(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
         session = manager.get_or_create("test:123")
         session.add_message("user", "Hello")
         session.add_message("assistant", "Hi")
@@ -120,7 +120,7 @@ class TestSessionManager:
         manager.save(session)
 
         # Check file exists
-        files = list(temp_dir.glob("*.jsonl"))
+        files = list(tmp_path.glob("*.jsonl"))
         assert len(files) == 1
 
         # Check file content
@@ -128,8 +128,8 @@ class TestSessionManager:
         lines = [l for l in content.strip().split("\n") if l]
         assert len(lines) == 3  # metadata + 2 messages
 
-    def test_load_saved_session(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_load_saved_session(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
         session = manager.get_or_create("test:123")
         session.add_message("user", "Hello")
         session.add_message("assistant", "Hi")
@@ -144,8 +144,8 @@ class TestSessionManager:
         assert loaded.messages[0]["content"] == "Hello"
         assert loaded.messages[1]["content"] == "Hi"
 
-    def test_delete_session(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_delete_session(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
         session = manager.get_or_create("test:123")
         session.add_message("user", "Hello")
         manager.save(session)
@@ -154,17 +154,17 @@ class TestSessionManager:
 
         assert result is True
         assert "test:123" not in manager._cache
-        assert not list(temp_dir.glob("*.jsonl"))
+        assert not list(tmp_path.glob("*.jsonl"))
 
-    def test_delete_nonexistent_session(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_delete_nonexistent_session(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
 
         result = manager.delete("nonexistent")
 
         assert result is False
 
-    def test_list_sessions(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_list_sessions(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
 
         # Create and save multiple sessions
         for key in ["cli:user1", "telegram:user2", "cli:user3"]:
@@ -176,19 +176,19 @@ class TestSessionManager:
 
         assert len(sessions) == 3
 
-    def test_safe_filename(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_safe_filename(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
 
         # Special characters should be replaced
         filename = manager._safe_filename("telegram:12345")
         assert ":" not in filename
         assert "/" not in filename
 
-    def test_load_corrupted_file(self, temp_dir):
-        manager = SessionManager(storage_dir=temp_dir)
+    def test_load_corrupted_file(self, tmp_path):
+        manager = SessionManager(storage_dir=tmp_path)
 
         # Create a corrupted file
-        (temp_dir / "test_123.jsonl").write_text("invalid json {{{")
+        (tmp_path / "test_123.jsonl").write_text("invalid json {{{")
 
         session = manager.get_or_create("test:123")
 